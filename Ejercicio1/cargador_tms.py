@@ -0,0 +1,229 @@
+"""
+Cargador de Máquinas en Formato turingmachinesimulator.com
+==========================================================
+
+exportar_algoritmo() y exportar_algoritmo_txt() generan archivos para
+turingmachinesimulator.com (suma_binaria_1cinta.txt, suma_binaria_3cintas.txt).
+Este módulo hace el camino inverso: lee uno de esos archivos y devuelve una
+máquina lista para ejecutar con el motor de k cintas (motor_k_cintas.py).
+
+Formato:
+
+    // comentario
+    name: Nombre de la máquina
+    init: ESTADO_INICIAL
+    accept: FIN, OTRO_FINAL
+
+    ESTADO,s_1,...,s_k
+    NUEVO_ESTADO,e_1,...,e_k,d_1,...,d_k
+
+- La cantidad de cintas k se deduce de la primera transición.
+- Las direcciones son '<' (izquierda), '>' (derecha) y '-' (quieto).
+- El blanco es '_'.
+
+*** CACHÉ DE MÁQUINAS COMPILADAS ***
+================================================================================
+Parsear y compilar una máquina con miles de transiciones cuesta mucho más que
+leer el resultado ya compilado. La máquina compilada se guarda con marshal
+(solo tipos básicos) en __pycache__, junto al archivo, con nombre
+
+    <archivo>.<hash del contenido>.mt
+
+Si el archivo cambia, cambia el hash y se recompila; si no, la máquina se
+carga directamente del caché.
+================================================================================
+"""
+
+import hashlib
+import marshal
+import os
+
+from motor_k_cintas import MaquinaTuringKCintas
+
+# Cambiar si cambia el formato de exportar_compilada(): invalida los cachés viejos
+VERSION_CACHE = 1
+
+BLANCO = '_'
+
+
+def parsear_maquina(texto):
+    """
+    Parsea una máquina en formato turingmachinesimulator.com.
+
+    Args:
+        texto: contenido del archivo
+
+    Returns:
+        diccionario con nombre, estado_inicial, estados_finales, num_cintas y
+        transiciones (lista de tuplas (estado, s_1..s_k, nuevo_estado, e_1..e_k, d_1..d_k))
+
+    Raises:
+        ValueError: si el archivo no respeta el formato (indica la línea)
+    """
+    maquina = {'nombre': None, 'estado_inicial': None, 'estados_finales': set(),
+               'num_cintas': None, 'transiciones': []}
+    pendiente = None            # (número de línea, campos) de la línea "estado,símbolos"
+
+    for numero, linea in enumerate(texto.splitlines(), 1):
+        linea = linea.split('//', 1)[0].strip()
+        if not linea:
+            continue
+
+        # ====================================================================
+        # ENCABEZADOS
+        # ====================================================================
+        clave, separador, valor = linea.partition(':')
+        if separador and clave.strip() in ('name', 'init', 'accept'):
+            clave, valor = clave.strip(), valor.strip()
+            if clave == 'name':
+                maquina['nombre'] = valor
+            elif clave == 'init':
+                maquina['estado_inicial'] = valor
+            else:
+                maquina['estados_finales'].update(e.strip() for e in valor.split(',') if e.strip())
+            continue
+
+        # ====================================================================
+        # TRANSICIONES (pares de líneas)
+        # ====================================================================
+        campos = tuple(campo.strip() for campo in linea.split(','))
+        if pendiente is None:
+            k = len(campos) - 1
+            if k < 1:
+                raise ValueError(f"Línea {numero}: se esperaba 'estado,símbolo(s)': {linea!r}")
+            if maquina['num_cintas'] is None:
+                maquina['num_cintas'] = k
+            elif k != maquina['num_cintas']:
+                raise ValueError(f"Línea {numero}: la transición usa {k} cintas "
+                                 f"(la máquina tiene {maquina['num_cintas']})")
+            pendiente = (numero, campos)
+            continue
+
+        k = maquina['num_cintas']
+        if len(campos) != 1 + 2 * k:
+            raise ValueError(f"Línea {numero}: se esperaba 'nuevo_estado,{k} símbolo(s),"
+                             f"{k} dirección(es)': {linea!r}")
+        for direccion in campos[1 + k:]:
+            if direccion not in ('<', '>', '-'):
+                raise ValueError(f"Línea {numero}: dirección inválida {direccion!r} "
+                                 f"(se esperaba '<', '>' o '-')")
+        maquina['transiciones'].append(pendiente[1] + campos)
+        pendiente = None
+
+    if pendiente is not None:
+        raise ValueError(f"Línea {pendiente[0]}: transición sin línea de destino")
+    if maquina['estado_inicial'] is None:
+        raise ValueError("Falta el encabezado 'init:'")
+    if maquina['num_cintas'] is None:
+        raise ValueError("El archivo no tiene transiciones")
+
+    return maquina
+
+
+def compilar_maquina(maquina):
+    """
+    Compila una máquina parseada para el motor de k cintas.
+
+    Args:
+        maquina: diccionario devuelto por parsear_maquina()
+
+    Returns:
+        MaquinaTuringKCintas
+    """
+    return MaquinaTuringKCintas(maquina['transiciones'], maquina['num_cintas'],
+                                maquina['estado_inicial'], maquina['estados_finales'],
+                                blanco=BLANCO)
+
+
+def ruta_cache(ruta, contenido, directorio_cache=None):
+    """
+    Ruta del archivo de caché para un contenido dado.
+
+    Args:
+        ruta: archivo de la máquina
+        contenido: bytes del archivo
+        directorio_cache: carpeta del caché (None = __pycache__ junto al archivo)
+    """
+    if directorio_cache is None:
+        directorio_cache = os.path.join(os.path.dirname(os.path.abspath(ruta)), '__pycache__')
+    resumen = hashlib.sha256(contenido).hexdigest()[:16]
+    return os.path.join(directorio_cache, f"{os.path.basename(ruta)}.{resumen}.mt")
+
+
+def cargar_maquina(ruta, directorio_cache=None, usar_cache=True):
+    """
+    Carga una máquina desde un archivo de turingmachinesimulator.com.
+
+    Si existe una versión compilada en caché para ese mismo contenido, se usa
+    directamente; si no, se parsea, se compila y se guarda en el caché.
+
+    Args:
+        ruta: archivo de la máquina
+        directorio_cache: carpeta del caché (None = __pycache__ junto al archivo)
+        usar_cache: si False, siempre se parsea y compila (sin leer ni escribir caché)
+
+    Returns:
+        tupla (máquina MaquinaTuringKCintas, nombre de la máquina)
+    """
+    with open(ruta, 'rb') as archivo:
+        contenido = archivo.read()
+
+    destino = ruta_cache(ruta, contenido, directorio_cache)
+    if usar_cache and os.path.exists(destino):
+        try:
+            # marshal.loads sobre los bytes ya leídos es mucho más rápido que
+            # marshal.load sobre el archivo
+            with open(destino, 'rb') as archivo:
+                version, nombre, compilada = marshal.loads(archivo.read())
+            if version == VERSION_CACHE:
+                return MaquinaTuringKCintas.desde_compilada(compilada), nombre
+        except (EOFError, ValueError, TypeError, KeyError):
+            pass                    # Caché corrupto o de otra versión: recompilar
+
+    datos = parsear_maquina(contenido.decode('utf-8'))
+    maquina = compilar_maquina(datos)
+
+    if usar_cache:
+        # Escritura atómica: otro proceso nunca ve un caché a medio escribir
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        temporal = f"{destino}.{os.getpid()}.tmp"
+        with open(temporal, 'wb') as archivo:
+            archivo.write(marshal.dumps((VERSION_CACHE, datos['nombre'],
+                                         maquina.exportar_compilada())))
+        os.replace(temporal, destino)
+
+    return maquina, datos['nombre']
+
+
+def main():
+    """Ejemplo: carga los algoritmos exportados y los ejecuta"""
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    ejemplos = [
+        ("suma_binaria_3cintas.txt", ["101+110", "1111+1", "1011+11001"], 2),
+        ("suma_binaria_1cinta.txt", ["11+1", "101+110", "1+1"], 0),
+    ]
+
+    print("=" * 70)
+    print("CARGA DE MÁQUINAS (turingmachinesimulator.com)")
+    print("=" * 70)
+
+    for nombre_archivo, entradas, cinta_resultado in ejemplos:
+        ruta = os.path.join(directorio, nombre_archivo)
+        if not os.path.exists(ruta):
+            print(f"\n'{nombre_archivo}' no existe (generarlo con el script de la máquina)")
+            continue
+
+        maquina, nombre = cargar_maquina(ruta)
+        print(f"\n{nombre_archivo}: '{nombre}', {maquina.num_cintas} cinta(s), "
+              f"{len(maquina.estados)} estados, {len(maquina.indice)} transiciones")
+
+        for entrada in entradas:
+            maquina.cargar(entrada)
+            termino = maquina.ejecutar(max_pasos=100000)
+            resultado = maquina.contenido(cinta_resultado).strip(BLANCO)
+            print(f"  {entrada:<12} -> {resultado:<10} ({maquina.pasos} pasos, "
+                  f"estado {maquina.nombre_estado}{'' if termino else ', NO TERMINÓ'})")
+
+
+if __name__ == "__main__":
+    main()
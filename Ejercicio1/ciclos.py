@@ -0,0 +1,102 @@
+"""
+Detección de Ciclos por Configuraciones Repetidas
+=================================================
+
+Con un límite de pasos, una máquina que quedó en un ciclo infinito y una que
+simplemente tarda mucho se ven igual: las dos agotan max_pasos. Pero una
+máquina de Turing es determinista, así que si la MISMA configuración aparece
+dos veces, la máquina repite para siempre lo que hizo entre esas dos veces y
+no termina nunca.
+
+La configuración se compara sin importar dónde está en la cinta:
+
+    (estado, cabezal - inicio de la región no blanca, región no blanca)
+
+(dos configuraciones que solo difieren en un desplazamiento se comportan
+igual, porque fuera de la región no blanca todo es blanco).
+
+*** MUESTREO AL ESTILO BRENT ***
+================================================================================
+Comparar en cada paso costaría O(cinta) por paso. En cambio se toma una
+"huella" de la configuración cada cierta cantidad de pasos (un tramo) y se
+compara con UNA sola huella guardada, que se renueva cuando la cantidad de
+tramos desde que se guardó llega a una potencia de 2 (algoritmo de Brent).
+Si la máquina está en un ciclo, la huella guardada termina cayendo dentro del
+ciclo y, como el tramo depende solo de la configuración, una huella posterior
+coincide con ella.
+
+- Memoria: una huella (el tamaño de la región usada de la cinta).
+- Costo: una huella cada max(TRAMO_MINIMO, 4 · celdas usadas) pasos, o sea
+  O(1) amortizado por paso y ninguna comparación dentro del bucle de pasos.
+- Nunca da falsos positivos: la huella guarda la región completa (el hash
+  solo sirve para descartar rápido las que no coinciden).
+- Un ciclo que se aleja sobre blancos para siempre (la región cambia en cada
+  vuelta) no repite configuraciones y no se detecta.
+================================================================================
+"""
+
+# Pasos mínimos entre dos huellas
+TRAMO_MINIMO = 4096
+
+
+def huella(estado, cinta, cabezal):
+    """
+    Huella de una configuración, independiente de su posición en la cinta.
+
+    Args:
+        estado: estado actual (nombre o id)
+        cinta: Cinta de la máquina
+        cabezal: posición lógica del cabezal
+
+    Returns:
+        tupla (estado, cabezal relativo, hash de la región, región); dos
+        huellas son iguales solo si las configuraciones lo son
+    """
+    if cinta.minimo is None:
+        return (estado, 0, 0, b'')
+    ids = cinta.ids(cinta.minimo, cinta.maximo)
+    return (estado, cabezal - cinta.minimo, hash(ids), ids)
+
+
+class DetectorCiclos:
+    def __init__(self, tramo_minimo=TRAMO_MINIMO):
+        """
+        Crea un detector sin huellas.
+
+        Args:
+            tramo_minimo: pasos mínimos entre dos huellas
+        """
+        self.tramo_minimo = tramo_minimo
+        self.guardada = None
+        self.paso_guardada = None
+        self.potencia = 1               # Tramos hasta renovar la huella guardada
+        self.tramos = 0                 # Tramos desde que se guardó
+        self.paso_repetido = None       # Paso en el que se repitió la guardada
+
+    def tramo(self, cinta):
+        """Pasos hasta la próxima huella (depende solo de la configuración)"""
+        return max(self.tramo_minimo, 4 * len(cinta))
+
+    def observar(self, pasos, estado, cinta, cabezal):
+        """
+        Toma la huella de la configuración actual y la compara con la guardada.
+
+        Args:
+            pasos: número de paso actual
+            estado, cinta, cabezal: configuración actual de la máquina
+
+        Returns:
+            True si la configuración repite a la guardada (la máquina no termina)
+        """
+        actual = huella(estado, cinta, cabezal)
+        if actual == self.guardada:
+            self.paso_repetido = pasos
+            return True
+
+        self.tramos += 1
+        if self.guardada is None or self.tramos == self.potencia:
+            self.guardada = actual
+            self.paso_guardada = pasos
+            self.potencia *= 2
+            self.tramos = 0
+        return False
@@ -0,0 +1,296 @@
+"""
+Cinta Bidireccional de Máquina de Turing sobre bytearray
+========================================================
+
+La cinta original era una lista de strings de 1 carácter:
+- Moverse más allá del extremo izquierdo hacía cinta.insert(0, ' '): O(n)
+- Cada celda ocupaba un puntero a un objeto str (8+ bytes)
+- Obtener el resultado reconstruía el string completo con ''.join(...)
+
+Esta cinta guarda cada celda como UN byte con el id del símbolo (ver
+tabla_compilada.py; el blanco es el id 0) dentro de un bytearray:
+
+    datos:   [ 0 0 0 | 3 1 2 1 | 0 0 0 0 ]
+                       ^origen
+    posición lógica p  ->  datos[origen + p]
+
+- Las posiciones lógicas pueden ser negativas: crecer hacia la izquierda
+  solo mueve el origen.
+- Al salirse del buffer se duplica la capacidad en ESA dirección, por lo que
+  crecer cuesta O(1) amortizado en ambos sentidos.
+- Se mantienen los límites (mínimo, máximo) de las celdas no blancas, así
+  obtener el resultado o dibujar la cinta cuesta O(celdas usadas).
+"""
+
+# Tamaño de la primera ventana de búsqueda de buscar_parada() (se duplica)
+VENTANA_BUSQUEDA_INICIAL = 64
+
+# Cada celda es un byte: a lo sumo 256 ids de símbolo
+MAX_SIMBOLOS = 256
+
+
+def tablas_texto(simbolos):
+    """
+    Arma las tablas para dibujar ids de símbolo como texto, a partir de la
+    lista de símbolos por id.
+
+    Args:
+        simbolos: lista de símbolos (el índice es el id)
+
+    Returns:
+        tupla (a_texto, traduccion): a_texto es la lista id -> string, y
+        traduccion la tabla de bytes.translate (en C) si todos los símbolos
+        son un carácter latin-1, o None si hay que dibujar con a_texto
+
+    Raises:
+        ValueError: si hay más de MAX_SIMBOLOS símbolos o alguno no es un
+                    string no vacío
+    """
+    if len(simbolos) > MAX_SIMBOLOS:
+        raise ValueError(f"El alfabeto tiene {len(simbolos)} símbolos (máximo {MAX_SIMBOLOS})")
+    for simbolo in simbolos:
+        if not isinstance(simbolo, str) or not simbolo:
+            raise ValueError(f"El símbolo {simbolo!r} no se puede representar en la cinta "
+                             f"(se esperaba un string no vacío)")
+
+    a_texto = list(simbolos)
+    traduccion = None
+    if all(len(simbolo) == 1 and ord(simbolo) < 256 for simbolo in a_texto):
+        traduccion = bytes.maketrans(bytes(range(len(a_texto))),
+                                     ''.join(a_texto).encode('latin-1'))
+    return a_texto, traduccion
+
+
+def dibujar_ids(ids, a_texto, traduccion):
+    """Dibuja una secuencia de ids con las tablas de tablas_texto()"""
+    if traduccion is not None:
+        return bytes(ids).translate(traduccion).decode('latin-1')
+    return ''.join([a_texto[simbolo] for simbolo in ids])
+
+
+def buscar_parada(datos, indice, movimiento, paradas):
+    """
+    Busca desde "indice" (inclusive) la primera celda con un símbolo de parada.
+
+    Busca en ventanas que se duplican, con bytearray.find/rfind (en C), para
+    que un símbolo de parada que no aparece cerca no obligue a recorrer todo
+    el buffer: el costo es proporcional a la distancia recorrida.
+
+    Args:
+        datos: bytearray de la cinta
+        indice: índice del buffer donde empieza la búsqueda
+        movimiento: +1 (hacia la derecha) o -1 (hacia la izquierda)
+        paradas: tupla de bytes de 1 byte con los ids de parada
+
+    Returns:
+        índice de la celda de parada, o el primer índice fuera del buffer
+        (len(datos) o -1) si no hay ninguna en esa dirección
+    """
+    ventana = VENTANA_BUSQUEDA_INICIAL
+    if movimiento > 0:
+        inicio = indice
+        while inicio < len(datos):
+            fin = min(len(datos), inicio + ventana)
+            encontrado = fin
+            for parada in paradas:
+                posicion = datos.find(parada, inicio, encontrado)
+                if posicion >= 0:
+                    encontrado = posicion
+            if encontrado < fin:
+                return encontrado
+            inicio = fin
+            ventana *= 2
+        return len(datos)
+
+    fin = indice + 1
+    while fin > 0:
+        inicio = max(0, fin - ventana)
+        encontrado = inicio - 1
+        for parada in paradas:
+            posicion = datos.rfind(parada, encontrado + 1, fin)
+            if posicion >= 0:
+                encontrado = posicion
+        if encontrado >= inicio:
+            return encontrado
+        fin = inicio
+        ventana *= 2
+    return -1
+
+
+class Cinta:
+    def __init__(self, simbolos, contenido='', capacidad_minima=16):
+        """
+        Crea una cinta con el contenido indicado a partir de la posición 0.
+
+        Args:
+            simbolos: lista de símbolos (el índice es el id; simbolos[0] es el blanco)
+            contenido: string inicial de la cinta
+            capacidad_minima: tamaño inicial del buffer
+
+        Raises:
+            ValueError: si algún símbolo no se puede representar (ver
+                        tablas_texto()) o el contenido tiene símbolos fuera
+                        del alfabeto
+        """
+        self.simbolos = simbolos
+        self.id_simbolo = {s: k for k, s in enumerate(simbolos)}
+        # Traducción id -> texto para dibujar la cinta (ver tablas_texto())
+        self._a_texto, self._traduccion = tablas_texto(simbolos)
+
+        faltantes = set(contenido) - self.id_simbolo.keys()
+        if faltantes:
+            raise ValueError(f"El contenido tiene símbolos fuera del alfabeto: "
+                             f"{sorted(faltantes)}")
+        capacidad = max(capacidad_minima, 2 * len(contenido))
+        self.datos = bytearray(capacidad)
+        self.origen = (capacidad - len(contenido)) // 2
+        self.datos[self.origen:self.origen + len(contenido)] = bytes(
+            self.id_simbolo[s] for s in contenido)
+
+        # Límites de las celdas no blancas (posiciones lógicas); None = cinta vacía
+        self.minimo = None
+        self.maximo = None
+        self.recalcular_limites()
+
+    # ========================================================================
+    # CRECIMIENTO
+    # ========================================================================
+    def asegurar(self, posicion):
+        """
+        Garantiza que la posición lógica esté dentro del buffer.
+
+        Duplica la capacidad hacia el lado necesario (O(1) amortizado).
+
+        Args:
+            posicion: posición lógica
+        """
+        indice = self.origen + posicion
+        if indice < 0:
+            extra = max(len(self.datos), -indice)
+            self.datos[0:0] = bytes(extra)          # Agregar blancos a la izquierda
+            self.origen += extra
+        elif indice >= len(self.datos):
+            extra = max(len(self.datos), indice - len(self.datos) + 1)
+            self.datos.extend(bytes(extra))         # Agregar blancos a la derecha
+
+    # ========================================================================
+    # LECTURA Y ESCRITURA
+    # ========================================================================
+    def leer_id(self, posicion):
+        """Devuelve el id del símbolo en la posición lógica"""
+        indice = self.origen + posicion
+        if 0 <= indice < len(self.datos):
+            return self.datos[indice]
+        return 0
+
+    def escribir_id(self, posicion, simbolo):
+        """Escribe un id de símbolo en la posición lógica, actualizando los límites"""
+        self.asegurar(posicion)
+        self.datos[self.origen + posicion] = simbolo
+        if simbolo:
+            if self.minimo is None or posicion < self.minimo:
+                self.minimo = posicion
+            if self.maximo is None or posicion > self.maximo:
+                self.maximo = posicion
+        elif posicion == self.minimo or posicion == self.maximo:
+            self.recalcular_limites()
+
+    def __getitem__(self, posicion):
+        return self.simbolos[self.leer_id(posicion)]
+
+    def __setitem__(self, posicion, simbolo):
+        self.escribir_id(posicion, self.id_simbolo[simbolo])
+
+    def recalcular_limites(self, desde=None, hasta=None):
+        """
+        Recalcula los límites de las celdas no blancas.
+
+        Se usa luego de que un bucle rápido escriba directamente sobre
+        "datos". La búsqueda la hacen lstrip/rstrip del bytearray (en C).
+
+        Args:
+            desde, hasta: posiciones lógicas fuera de las cuales se sabe que
+                          la cinta está en blanco (None = todo el buffer)
+        """
+        inicio = 0 if desde is None else max(0, self.origen + desde)
+        fin = len(self.datos) if hasta is None else min(len(self.datos), self.origen + hasta + 1)
+        datos = self.datos if (inicio, fin) == (0, len(self.datos)) else self.datos[inicio:fin]
+
+        sin_derecha = len(datos.rstrip(b'\x00'))
+        if sin_derecha == 0:
+            self.minimo = self.maximo = None
+            return
+        primero = len(datos) - len(datos.lstrip(b'\x00'))
+        self.minimo = inicio + primero - self.origen
+        self.maximo = inicio + sin_derecha - 1 - self.origen
+
+    def actualizar_limites(self, cabezal_inicial, pasos):
+        """
+        Recalcula los límites luego de que un bucle rápido ejecute "pasos"
+        pasos sobre "datos" desde "cabezal_inicial" (los límites guardados
+        todavía son los de antes del bucle).
+
+        Como cada paso mueve el cabezal a lo sumo una celda, solo pudieron
+        cambiar las celdas a distancia "pasos" del cabezal inicial: se busca
+        solo en esa ventana, en O(pasos), aunque la región usada o el buffer
+        sean mucho más grandes. Fuera de la ventana los límites anteriores
+        siguen valiendo.
+        """
+        desde, hasta = cabezal_inicial - pasos, cabezal_inicial + pasos
+        minimo, maximo = self.minimo, self.maximo
+        self.recalcular_limites(desde, hasta)
+        if minimo is None:
+            return
+
+        nuevo_minimo = minimo if minimo < desde else self.minimo
+        nuevo_maximo = maximo if maximo > hasta else self.maximo
+        if nuevo_minimo is None or nuevo_maximo is None:
+            # La ventana quedó en blanco: lo que queda está fuera de ella
+            self.recalcular_limites(minimo, maximo)
+        else:
+            self.minimo, self.maximo = nuevo_minimo, nuevo_maximo
+
+    # ========================================================================
+    # RESULTADO Y DIBUJO
+    # ========================================================================
+    def ids(self, desde, hasta):
+        """Devuelve los ids de las posiciones lógicas desde..hasta (inclusive)"""
+        resultado = bytearray(hasta - desde + 1)
+        inicio = max(desde, -self.origen)
+        fin = min(hasta, len(self.datos) - 1 - self.origen)
+        if inicio <= fin:
+            resultado[inicio - desde:fin - desde + 1] = \
+                self.datos[self.origen + inicio:self.origen + fin + 1]
+        return bytes(resultado)
+
+    def traducir(self, ids):
+        """
+        Dibuja una secuencia de ids como string, sin los blancos de los extremos.
+
+        Args:
+            ids: bytes o bytearray con ids de símbolos
+        """
+        return dibujar_ids(bytes(ids).strip(b'\x00'), self._a_texto, self._traduccion)
+
+    def texto(self, desde=None, hasta=None):
+        """
+        Dibuja la cinta como string.
+
+        Sin argumentos devuelve solo la región no blanca (equivalente a
+        ''.join(cinta).strip() de la versión con listas) en O(celdas usadas).
+
+        Args:
+            desde, hasta: posiciones lógicas a dibujar (inclusive)
+        """
+        if desde is None and hasta is None:
+            if self.minimo is None:
+                return ''
+            desde, hasta = self.minimo, self.maximo
+        return dibujar_ids(self.ids(desde, hasta), self._a_texto, self._traduccion)
+
+    def __len__(self):
+        """Cantidad de celdas usadas (región no blanca)"""
+        return 0 if self.minimo is None else self.maximo - self.minimo + 1
+
+    def __str__(self):
+        return self.texto()
@@ -0,0 +1,168 @@
+"""
+Bucle de Ejecución Generado para una Tabla Concreta
+===================================================
+
+El bucle de _ejecutar_compilado() es un intérprete: en cada paso busca la
+entrada en la tabla, la desempaqueta con operaciones de bits y decide si el
+estado cambió. Este módulo genera, para UNA tabla compilada, el código fuente
+de una función de Python con un bloque por estado y los símbolos comparados
+directamente, por ejemplo:
+
+    elif estado == 7:  # BUSCAR_DER_SUMAR1
+        while pasos < limite:
+            ...barrido hasta la parada...
+            s = datos[indice]
+            if s == 3:  # '+'
+                indice += 1
+                pasos += 1
+                estado = 8
+                ...crecer si hace falta...
+                break
+            else:
+                return indice, estado, pasos, False
+
+- Mientras la máquina sigue en el mismo estado no se vuelve a despachar:
+  el bloque repite su propio bucle.
+- Solo se escribe en la cinta si el símbolo cambia, y solo se revisa el
+  borde del buffer hacia el que se movió el cabezal.
+- Los estados de barrido (ver tabla_compilada.py) saltan el tramo con
+  buscar_parada(), sumando un paso por celda.
+
+El conteo de pasos y el límite se respetan exactamente, como en
+ejecutar_paso(). La fuente se compila una sola vez con compile() y la
+función queda en caché, con el hash de la tabla como clave.
+"""
+
+import hashlib
+
+from cinta import buscar_parada
+from tabla_compilada import SIN_TRANSICION, analizar_barridos, desempaquetar
+
+# Funciones ya compiladas: {hash de la tabla: función}
+_CACHE = {}
+
+
+def _crecer(cinta, indice):
+    """Hace crecer la cinta para que el índice quede dentro del buffer"""
+    posicion = indice - cinta.origen
+    cinta.asegurar(posicion)
+    return cinta.datos, cinta.origen + posicion, len(cinta.datos)
+
+
+def clave_tabla(compilada):
+    """Hash de una tabla compilada (estados, símbolos, tabla y estados finales)"""
+    contenido = repr((compilada.estados, compilada.simbolos, compilada.tabla,
+                      sorted(compilada.estados_finales)))
+    return hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+
+def generar_fuente(compilada):
+    """
+    Genera el código fuente de la función de ejecución para una tabla.
+
+    La función generada es
+
+        ejecutar(cinta, indice, estado, pasos, limite, detener_en=-1)
+            -> (indice, estado, pasos, detenido)
+
+    con "indice" el índice del cabezal en cinta.datos, y se detiene al
+    llegar a "limite" pasos, al no haber transición o (detenido=True) al
+    volver a entrar a "detener_en" luego de al menos un paso.
+
+    Args:
+        compilada: TablaCompilada
+
+    Returns:
+        string con el código fuente
+    """
+    barridos = analizar_barridos(compilada)
+    num_simbolos = compilada.num_simbolos
+    lineas = [
+        "def ejecutar(cinta, indice, estado, pasos, limite, detener_en=-1):",
+        "    datos = cinta.datos",
+        "    tam = len(datos)",
+        "    pasos_iniciales = pasos",
+        "    while pasos < limite:",
+        "        if estado == detener_en and pasos > pasos_iniciales:",
+        "            return indice, estado, pasos, True",
+    ]
+
+    for estado, nombre in enumerate(compilada.estados):
+        lineas.append(f"        elif estado == {estado}:  # {nombre!r}")
+        entradas = [(simbolo, compilada.tabla[estado * num_simbolos + simbolo])
+                    for simbolo in range(num_simbolos)]
+        entradas = [(s, e) for s, e in entradas if e != SIN_TRANSICION]
+        if not entradas:
+            lineas.append("            return indice, estado, pasos, False")
+            continue
+
+        lineas.append("            while pasos < limite:")
+        barrido = barridos[estado]
+        if barrido is not None:
+            movimiento, paradas = barrido
+            if movimiento > 0:
+                avance = ["saltos = min(destino - indice, limite - pasos)",
+                          "indice += saltos"]
+                borde = "indice == tam"
+            else:
+                avance = ["saltos = min(indice - destino, limite - pasos)",
+                          "indice -= saltos"]
+                borde = "indice < 0"
+            lineas += [f"                destino = buscar_parada(datos, indice, {movimiento}, {paradas!r})"]
+            lineas += [f"                {linea}" for linea in avance]
+            lineas += [
+                "                pasos += saltos",
+                f"                if {borde}:",
+                "                    datos, indice, tam = crecer(cinta, indice)",
+                "                    continue",
+                "                if pasos >= limite:",
+                "                    break",
+            ]
+
+        lineas.append("                s = datos[indice]")
+        for k, (simbolo, entrada) in enumerate(entradas):
+            nuevo_estado, nuevo_simbolo, movimiento = desempaquetar(entrada)
+            lineas.append(f"                {'if' if k == 0 else 'elif'} s == {simbolo}:"
+                          f"  # {compilada.simbolos[simbolo]!r}")
+            if nuevo_simbolo != simbolo:
+                lineas.append(f"                    datos[indice] = {nuevo_simbolo}")
+            if movimiento:
+                lineas.append(f"                    indice {'+' if movimiento > 0 else '-'}= 1")
+            lineas.append("                    pasos += 1")
+            if nuevo_estado != estado:
+                lineas.append(f"                    estado = {nuevo_estado}")
+            if movimiento:
+                lineas += [
+                    f"                    if {'indice == tam' if movimiento > 0 else 'indice < 0'}:",
+                    "                        datos, indice, tam = crecer(cinta, indice)",
+                ]
+            if nuevo_estado != estado:
+                lineas.append("                    break")
+        lineas += [
+            "                else:",
+            "                    return indice, estado, pasos, False",
+        ]
+
+    lineas.append("    return indice, estado, pasos, False")
+    return '\n'.join(lineas) + '\n'
+
+
+def generar_ejecutor(compilada):
+    """
+    Devuelve la función de ejecución generada para una tabla (ver
+    generar_fuente()), compilándola solo la primera vez.
+
+    Args:
+        compilada: TablaCompilada
+
+    Returns:
+        función ejecutar(cinta, indice, estado, pasos, limite, detener_en=-1)
+    """
+    clave = clave_tabla(compilada)
+    funcion = _CACHE.get(clave)
+    if funcion is None:
+        codigo = compile(generar_fuente(compilada), f"<tabla {clave[:12]}>", 'exec')
+        espacio = {'buscar_parada': buscar_parada, 'crecer': _crecer}
+        exec(codigo, espacio)
+        funcion = _CACHE[clave] = espacio['ejecutar']
+    return funcion
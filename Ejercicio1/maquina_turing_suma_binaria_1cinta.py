@@ -19,23 +19,85 @@ El algoritmo:
 5. Limpiar y presentar el resultado
 """
 
+import os
+import re
+import time
+
+from ciclos import DetectorCiclos
+from cinta import Cinta, buscar_parada
+from codigo_generado import generar_ejecutor
+from optimizador import optimizar_tabla_1cinta
+from punto_control import cargar_punto_control, guardar_punto_control
+from tabla_compilada import (BITS_MOVIMIENTO, DESPLAZAMIENTO_ESTADO, MASCARA_SIMBOLO,
+                             SIN_TRANSICION, analizar_barridos, compilar_tabla)
+from traza import RegistroTraza
+
+# Pasos que ejecutar(verbose=True) muestra en detalle
+PASOS_DETALLADOS = 20
+
+# Pasos simulados entre puntos de control de ejecutar(punto_control=...)
+INTERVALO_PUNTO_CONTROL = 10_000_000
+
+# Configuración al inicio de cada ciclo restar-1/sumar-1: ' ' a '+' b ' '
+PATRON_CICLO = re.compile(r'([01]+)\+([01]*)')
+
+
+def _suma_ceros_finales(n):
+    """Suma de los ceros finales (en binario) de 1, 2, ..., n: vale n - popcount(n)"""
+    return n - bin(n).count('1')
+
+
+def _suma_longitudes_binarias(n):
+    """Suma de la cantidad de bits de 1, 2, ..., n"""
+    total = 0
+    for longitud in range(1, n.bit_length() + 1):
+        total += longitud * (min(n, (1 << longitud) - 1) - (1 << (longitud - 1)) + 1)
+    return total
+
+
 class MaquinaTuring1Cinta:
-    def __init__(self, entrada):
+    def __init__(self, entrada, optimizar_tabla=False):
         """
         Inicializa la máquina de Turing con la entrada proporcionada
         
         Args:
             entrada: string en formato 'a+b' donde a y b son números binarios
+            optimizar_tabla: si True, la tabla se optimiza antes de compilarla
+                             (ver optimizador.py); el informe queda en
+                             self.informe_optimizacion
         """
-        self.cinta = list(' ' + entrada + ' ' * 20)  
-        self.cabezal = 1  
         self.estado = 'VERIFICAR_SI_CERO'
         self.entrada_original = entrada
         self.pasos = 0
         self.max_pasos = 10000
         
+        # Avanzar muchos ciclos restar-1/sumar-1 de una vez (ver _avanzar_ciclos())
+        self.acelerar_ciclos = True
+        self._modelo_ciclo_verificado = None
+        
+        # Ejecutar con una función generada para esta tabla (ver codigo_generado.py)
+        self.usar_codigo_generado = False
+        
+        # Detener la ejecución si una configuración se repite (ver ciclos.py)
+        self.detectar_ciclos = True
+        self.no_termina = False
+        self.detenido_por_error = False
+        
         # Tabla de transiciones según el pseudocódigo
         self.transiciones = self._crear_tabla_transiciones()
+        self.informe_optimizacion = None
+        if optimizar_tabla:
+            self.transiciones, self.informe_optimizacion = optimizar_tabla_1cinta(
+                self.transiciones, 'VERIFICAR_SI_CERO', {'FIN'})
+        
+        # Versión compilada a enteros y sus barridos (se generan en compilar())
+        self._compilada = None
+        self._barridos = None
+        
+        # Cinta de bytes con los ids de la tabla compilada (ver cinta.py):
+        # la posición 0 es un blanco inicial y crece sola hacia ambos lados
+        self.cinta = Cinta(self.compilar().simbolos, ' ' + entrada)
+        self.cabezal = 1
     
     def _crear_tabla_transiciones(self):
         """
@@ -193,11 +255,13 @@ class MaquinaTuring1Cinta:
         # Buscar transición
         if self.estado not in self.transiciones:
             print(f"Error: Estado '{self.estado}' no definido")
+            self.detenido_por_error = True
             return False
         
         if simbolo_actual not in self.transiciones[self.estado]:
             print(f"Error: No hay transición para estado '{self.estado}' y símbolo '{simbolo_actual}'")
             print(f"Transiciones disponibles: {list(self.transiciones[self.estado].keys())}")
+            self.detenido_por_error = True
             return False
         
         nuevo_estado, nuevo_simbolo, direccion = self.transiciones[self.estado][simbolo_actual]
@@ -211,51 +275,643 @@ class MaquinaTuring1Cinta:
         elif direccion == 'L':
             self.cabezal -= 1
         
-        # Asegurar que no salimos de la cinta
-        if self.cabezal < 0:
-            self.cinta.insert(0, ' ')
-            self.cabezal = 0
-        elif self.cabezal >= len(self.cinta):
-            self.cinta.append(' ')
-        
         self.pasos += 1
         return True
     
-    def ejecutar(self, verbose=True):
+    def compilar(self):
+        """
+        Compila la tabla de transiciones a enteros (ver tabla_compilada.py).
+        
+        Estados y símbolos se numeran con enteros chicos y la tabla se aplana
+        en una lista indexada por estado * |alfabeto| + símbolo, con cada
+        transición empaquetada en un entero. Se compila una sola vez.
+        
+        Returns:
+            TablaCompilada
+        """
+        if self._compilada is None:
+            self._compilada = compilar_tabla(self.transiciones, 'VERIFICAR_SI_CERO', {'FIN'},
+                                             blanco=' ', simbolos_extra=set(self.entrada_original))
+            self._barridos = analizar_barridos(self._compilada)
+        return self._compilada
+    
+    def _ejecutar_compilado(self, limite, detener_en=None):
+        """
+        Ejecuta pasos con la tabla compilada hasta terminar o llegar a "limite" pasos.
+        
+        Es equivalente a llamar ejecutar_paso() repetidamente, pero cada paso
+        es un índice en una lista y operaciones de bits en lugar de búsquedas
+        en diccionarios y comparaciones de strings.
+        
+        Además, al entrar a un estado de barrido (ver analizar_barridos()) el
+        tramo de celdas que solo se recorren se salta de una vez con
+        buscar_parada(), sumando un paso por celda: self.pasos y el límite
+        de pasos se respetan exactamente.
+        
+        Args:
+            limite: valor máximo de self.pasos al que se puede llegar
+            detener_en: id de estado; si se indica, se detiene al volver a
+                        entrar a ese estado (luego de al menos un paso)
+        
+        Returns:
+            True si se detuvo por llegar a "detener_en"
+        """
+        if self.usar_codigo_generado:
+            return self._ejecutar_generado(limite, detener_en)
+        
+        compilada = self.compilar()
+        tabla = compilada.tabla
+        num_simbolos = compilada.num_simbolos
+        barridos = self._barridos
+        
+        # Estado de la máquina en variables locales (acceso más rápido).
+        # Se trabaja directamente sobre el bytearray de la cinta, con el
+        # cabezal como índice del buffer (no como posición lógica).
+        cinta = self.cinta
+        cinta.asegurar(self.cabezal)
+        datos = cinta.datos
+        indice = cinta.origen + self.cabezal
+        tam = len(datos)
+        estado = compilada.id_estado[self.estado]
+        pasos = self.pasos
+        pasos_iniciales = pasos
+        revisar_barrido = True
+        detenido = False
+        
+        while pasos < limite:
+            # Macro-paso: al entrar a un estado de barrido, saltar hasta la parada
+            if revisar_barrido:
+                if estado == detener_en and pasos > pasos_iniciales:
+                    detenido = True
+                    break
+                revisar_barrido = False
+                barrido = barridos[estado]
+                if barrido is not None:
+                    movimiento, paradas = barrido
+                    destino = buscar_parada(datos, indice, movimiento, paradas)
+                    saltos = min(abs(destino - indice), limite - pasos)
+                    indice += movimiento * saltos
+                    pasos += saltos
+                    
+                    # Sin parada dentro del buffer: crecer y seguir barriendo
+                    if indice < 0 or indice == tam:
+                        posicion = indice - cinta.origen
+                        cinta.asegurar(posicion)
+                        datos = cinta.datos
+                        indice = cinta.origen + posicion
+                        tam = len(datos)
+                        revisar_barrido = True
+                    continue
+            
+            entrada = tabla[estado * num_simbolos + datos[indice]]
+            if entrada == SIN_TRANSICION:
+                break                       # Estado final (o transición no definida)
+            
+            datos[indice] = (entrada >> BITS_MOVIMIENTO) & MASCARA_SIMBOLO
+            nuevo_estado = entrada >> DESPLAZAMIENTO_ESTADO
+            if nuevo_estado != estado:
+                estado = nuevo_estado
+                revisar_barrido = True
+            indice += (entrada & 3) - 1
+            
+            # Al salir del buffer, la cinta duplica su capacidad hacia ese lado
+            if indice < 0 or indice == tam:
+                posicion = indice - cinta.origen
+                cinta.asegurar(posicion)
+                datos = cinta.datos
+                indice = cinta.origen + posicion
+                tam = len(datos)
+                revisar_barrido = True
+            
+            pasos += 1
+        
+        # Volcar el estado de vuelta al objeto
+        cinta.actualizar_limites(self.cabezal, pasos - self.pasos)
+        self.cabezal = indice - cinta.origen
+        self.estado = compilada.estados[estado]
+        self.pasos = pasos
+        
+        # Si se detuvo por una transición no definida, ejecutar_paso() informa el error
+        if not detenido and pasos < limite and estado not in compilada.estados_finales:
+            self.ejecutar_paso()
+        return detenido
+    
+    def _ejecutar_generado(self, limite, detener_en=None):
+        """
+        Igual que _ejecutar_compilado(), pero con la función generada para
+        esta tabla (un bloque de código por estado, ver codigo_generado.py).
+        
+        Args:
+            limite: valor máximo de self.pasos al que se puede llegar
+            detener_en: id de estado; si se indica, se detiene al volver a
+                        entrar a ese estado (luego de al menos un paso)
+        
+        Returns:
+            True si se detuvo por llegar a "detener_en"
+        """
+        compilada = self.compilar()
+        ejecutar = generar_ejecutor(compilada)
+        
+        cinta = self.cinta
+        cinta.asegurar(self.cabezal)
+        indice, estado, pasos, detenido = ejecutar(
+            cinta, cinta.origen + self.cabezal, compilada.id_estado[self.estado], self.pasos,
+            limite, -1 if detener_en is None else detener_en)
+        
+        # Volcar el estado de vuelta al objeto
+        cinta.actualizar_limites(self.cabezal, pasos - self.pasos)
+        self.cabezal = indice - cinta.origen
+        self.estado = compilada.estados[estado]
+        self.pasos = pasos
+        
+        if not detenido and pasos < limite and estado not in compilada.estados_finales:
+            self.ejecutar_paso()
+        return detenido
+    
+    def _ejecutar_trazado(self, limite, traza, informar_error=True):
+        """
+        Ejecuta pasos con la tabla compilada registrando cada uno en la traza.
+        
+        A diferencia de _ejecutar_compilado(), no salta barridos: cada paso
+        queda registrado como (paso, estado, cabezal, leído, escrito).
+        
+        Args:
+            limite: valor máximo de self.pasos al que se puede llegar
+            traza: RegistroTraza donde se registran los pasos
+            informar_error: si True, una transición no definida se informa
+                            con ejecutar_paso()
+        """
+        compilada = self.compilar()
+        tabla = compilada.tabla
+        num_simbolos = compilada.num_simbolos
+        registrar = traza.registrar
+        
+        cinta = self.cinta
+        cinta.asegurar(self.cabezal)
+        datos = cinta.datos
+        indice = cinta.origen + self.cabezal
+        tam = len(datos)
+        estado = compilada.id_estado[self.estado]
+        pasos = self.pasos
+        
+        while pasos < limite:
+            leido = datos[indice]
+            entrada = tabla[estado * num_simbolos + leido]
+            if entrada == SIN_TRANSICION:
+                break                       # Estado final (o transición no definida)
+            
+            escrito = (entrada >> BITS_MOVIMIENTO) & MASCARA_SIMBOLO
+            datos[indice] = escrito
+            pasos += 1
+            registrar(pasos, estado, indice - cinta.origen, leido, escrito)
+            estado = entrada >> DESPLAZAMIENTO_ESTADO
+            indice += (entrada & 3) - 1
+            
+            # Al salir del buffer, la cinta duplica su capacidad hacia ese lado
+            if indice < 0 or indice == tam:
+                posicion = indice - cinta.origen
+                cinta.asegurar(posicion)
+                datos = cinta.datos
+                indice = cinta.origen + posicion
+                tam = len(datos)
+        
+        # Volcar el estado de vuelta al objeto
+        cinta.actualizar_limites(self.cabezal, pasos - self.pasos)
+        self.cabezal = indice - cinta.origen
+        self.estado = compilada.estados[estado]
+        self.pasos = pasos
+        
+        if informar_error and pasos < limite and estado not in compilada.estados_finales:
+            self.ejecutar_paso()
+    
+    def _ejecutar_perfilado(self, limite, perfil):
+        """
+        Ejecuta pasos con la tabla compilada contándolos en un perfil.
+        
+        Es un bucle aparte para que las ejecuciones sin perfil no paguen
+        ningún contador. Como _ejecutar_trazado(), no salta barridos: cada
+        paso se cuenta en su transición (ver perfil.py).
+        
+        Args:
+            limite: valor máximo de self.pasos al que se puede llegar
+            perfil: PerfilEjecucion donde se acumulan los contadores
+        """
+        compilada = self.compilar()
+        tabla = compilada.tabla
+        num_simbolos = compilada.num_simbolos
+        golpes = perfil.golpes
+        recorrido = perfil.recorrido
+        visitas = perfil.visitas
+        tiempo = perfil.tiempo
+        reloj = time.perf_counter
+        
+        cinta = self.cinta
+        cinta.asegurar(self.cabezal)
+        datos = cinta.datos
+        indice = cinta.origen + self.cabezal
+        tam = len(datos)
+        estado = compilada.id_estado[self.estado]
+        pasos = self.pasos
+        
+        inicio_grupo = reloj()
+        while pasos < limite:
+            clave = estado * num_simbolos + datos[indice]
+            entrada = tabla[clave]
+            if entrada == SIN_TRANSICION:
+                break                       # Estado final (o transición no definida)
+            
+            golpes[clave] += 1
+            datos[indice] = (entrada >> BITS_MOVIMIENTO) & MASCARA_SIMBOLO
+            movimiento = (entrada & 3) - 1
+            if movimiento:
+                recorrido[estado] += 1
+                indice += movimiento
+            
+            # Al cambiar de estado se cierra el grupo de pasos del estado anterior
+            nuevo_estado = entrada >> DESPLAZAMIENTO_ESTADO
+            if nuevo_estado != estado:
+                ahora = reloj()
+                tiempo[estado] += ahora - inicio_grupo
+                inicio_grupo = ahora
+                estado = nuevo_estado
+                visitas[estado] += 1
+            
+            # Al salir del buffer, la cinta duplica su capacidad hacia ese lado
+            if indice < 0 or indice == tam:
+                posicion = indice - cinta.origen
+                cinta.asegurar(posicion)
+                datos = cinta.datos
+                indice = cinta.origen + posicion
+                tam = len(datos)
+            
+            pasos += 1
+        tiempo[estado] += reloj() - inicio_grupo
+        
+        # Volcar el estado de vuelta al objeto
+        cinta.actualizar_limites(self.cabezal, pasos - self.pasos)
+        self.cabezal = indice - cinta.origen
+        self.estado = compilada.estados[estado]
+        self.pasos = pasos
+        
+        if pasos < limite and estado not in compilada.estados_finales:
+            self.ejecutar_paso()
+    
+    # ========================================================================
+    # AVANCE RÁPIDO DE CICLOS COMPLETOS
+    # ========================================================================
+    # Cada vuelta VERIFICAR_SI_CERO -> ... -> BUSCAR_IZQ_CONTINUAR resta 1 a "a"
+    # y suma 1 a "b" sin cambiar la forma de la cinta (' ' a '+' b ' ', con el
+    # cabezal en la posición 1). Recorriendo la tabla, una vuelta con a > 0
+    # cuesta exactamente:
+    #
+    #   2·z(a) + 2·t(a) + 4·La + 2·Lb + 10        (+ 2·Lb + 2 si b = 1...1)
+    #
+    # con La, Lb las longitudes de a y b, z(a) los ceros a la izquierda de a y
+    # t(a) sus ceros finales. Si b = 1...1, b pasa a 1 0...0 (Lb + 1 dígitos).
+    # Las sumas de z y t sobre muchos valores consecutivos tienen forma cerrada,
+    # así que k vueltas se avanzan en O(log) operaciones más reescribir a y b.
+    
+    def _ciclo_actual(self):
+        """
+        Reconoce la configuración de inicio de ciclo.
+        
+        Returns:
+            tupla (a, b) de strings binarios, o None si la configuración no es
+            ' ' a '+' b ' ' con el cabezal en la posición 1 y a > 0
+        """
+        if self.estado != 'VERIFICAR_SI_CERO' or self.cabezal != 1 or self.cinta.minimo != 1:
+            return None
+        coincidencia = PATRON_CICLO.fullmatch(self.cinta.texto())
+        if coincidencia is None or '1' not in coincidencia.group(1):
+            return None
+        return coincidencia.group(1), coincidencia.group(2)
+    
+    @staticmethod
+    def _costo_ciclos(valor_a, largo_a, largo_b, k):
+        """
+        Pasos de k vueltas sin desborde de b, empezando con a = valor_a.
+        
+        Args:
+            valor_a: valor de a al empezar (k <= valor_a)
+            largo_a, largo_b: longitudes de a y b (fijas mientras b no desborda)
+            k: cantidad de vueltas
+        """
+        fin = valor_a - k
+        ceros_izq = k * largo_a - (_suma_longitudes_binarias(valor_a) - _suma_longitudes_binarias(fin))
+        ceros_fin = _suma_ceros_finales(valor_a) - _suma_ceros_finales(fin)
+        return 2 * ceros_izq + 2 * ceros_fin + k * (4 * largo_a + 2 * largo_b + 10)
+    
+    def _avanzar_ciclos(self, ciclo, limite):
+        """
+        Avanza de una vez todas las vueltas posibles sin pasar de "limite".
+        
+        Se detiene antes de una vuelta en la que b desborda (esa vuelta la
+        ejecuta el simulador normal) y nunca deja a self.pasos por encima del
+        límite: si la tanda completa no entra, se busca por bisección la
+        mayor cantidad de vueltas que sí entra.
+        
+        Args:
+            ciclo: tupla (a, b) devuelta por _ciclo_actual()
+            limite: valor máximo de self.pasos
+        
+        Returns:
+            cantidad de vueltas avanzadas
+        """
+        a, b = ciclo
+        valor_a, valor_b = int(a, 2), int(b or '0', 2)
+        largo_a, largo_b = len(a), len(b)
+        
+        # Vueltas hasta que a llegue a 0 o b esté por desbordar (b = 1...1)
+        k = min(valor_a, (1 << largo_b) - 1 - valor_b)
+        disponibles = limite - self.pasos
+        if k > 0 and self._costo_ciclos(valor_a, largo_a, largo_b, k) > disponibles:
+            bajo, alto = 0, k
+            while bajo < alto:
+                medio = (bajo + alto + 1) // 2
+                if self._costo_ciclos(valor_a, largo_a, largo_b, medio) <= disponibles:
+                    bajo = medio
+                else:
+                    alto = medio - 1
+            k = bajo
+        if k == 0:
+            return 0
+        
+        # Reescribir a y b en la cinta (mismas longitudes)
+        self.pasos += self._costo_ciclos(valor_a, largo_a, largo_b, k)
+        nuevo = f"{valor_a - k:0{largo_a}b}+{valor_b + k:0{largo_b}b}"
+        for posicion, simbolo in enumerate(nuevo, 1):
+            self.cinta[posicion] = simbolo
+        return k
+    
+    def _verificar_modelo_ciclo(self, ciclo, limite, inicio_ciclo):
+        """
+        Ejecuta una vuelta con el simulador normal y la compara con la fórmula.
+        
+        Deja self._modelo_ciclo_verificado en True o False (o sin cambios si
+        el límite de pasos no dejó completar la vuelta).
+        
+        Returns:
+            True si la vuelta terminó en el inicio del ciclo siguiente
+        """
+        a, b = ciclo
+        valor_a, valor_b = int(a, 2), int(b or '0', 2)
+        costo = self._costo_ciclos(valor_a, len(a), len(b), 1)
+        if valor_b == (1 << len(b)) - 1:
+            costo += 2 * len(b) + 2         # Vuelta con desborde de b
+        esperado = f"{valor_a - 1:0{len(a)}b}+{valor_b + 1:0{len(b)}b}"
+        
+        pasos_iniciales = self.pasos
+        if not self._ejecutar_compilado(limite, detener_en=inicio_ciclo):
+            return False
+        self._modelo_ciclo_verificado = (self.pasos - pasos_iniciales == costo
+                                         and self.cabezal == 1
+                                         and self.cinta.minimo == 1
+                                         and self.cinta.texto() == esperado)
+        return True
+    
+    def _ejecutar_acelerado(self, limite, tramo=None):
+        """
+        Ejecuta como _ejecutar_compilado(), avanzando ciclos completos de una vez.
+        
+        En cada inicio de ciclo se intenta _avanzar_ciclos(); si la
+        configuración no coincide, se ejecuta una vuelta con el simulador
+        normal. La primera vez, la fórmula de costo se verifica contra una
+        vuelta ejecutada paso a paso: si no coincide (por ejemplo, porque se
+        modificó la tabla), no se vuelve a usar.
+        
+        Args:
+            limite: valor máximo de self.pasos
+            tramo: si se indica, se detiene luego de simular (sin contar los
+                   ciclos avanzados de una vez) al menos esa cantidad de pasos
+        
+        Returns:
+            cantidad de pasos simulados (sin contar los ciclos avanzados)
+        """
+        inicio_ciclo = self.compilar().id_estado['VERIFICAR_SI_CERO']
+        simulados = 0
+        while self.pasos < limite and self.estado != 'FIN':
+            if tramo is not None and simulados >= tramo:
+                break
+            pasos_antes = self.pasos
+            ciclo = self._ciclo_actual()
+            if ciclo is not None:
+                if self._modelo_ciclo_verificado is None:
+                    continuar = self._verificar_modelo_ciclo(ciclo, limite, inicio_ciclo)
+                    simulados += self.pasos - pasos_antes
+                    if not continuar:
+                        break
+                    continue
+                if self._modelo_ciclo_verificado and self._avanzar_ciclos(ciclo, limite):
+                    continue
+            
+            tope = limite if tramo is None else min(limite, self.pasos + tramo - simulados)
+            detenido = self._ejecutar_compilado(tope, detener_en=inicio_ciclo)
+            simulados += self.pasos - pasos_antes
+            if not detenido:
+                break                       # Fin, error o límite de pasos
+        return simulados
+    
+    def guardar_punto_control(self, ruta, traza=None):
+        """
+        Guarda la configuración completa en un archivo (ver punto_control.py).
+        
+        Args:
+            ruta: archivo de destino (se reemplaza de forma atómica)
+            traza: RegistroTraza opcional a guardar junto con la configuración
+        """
+        cinta = self.cinta
+        if cinta.minimo is None:
+            desde, ids = self.cabezal, b''
+        else:
+            desde, ids = cinta.minimo, cinta.ids(cinta.minimo, cinta.maximo)
+        guardar_punto_control(ruta, {
+            'entrada': self.entrada_original,
+            'estado': self.estado,
+            'pasos': self.pasos,
+            'max_pasos': self.max_pasos,
+            'cabezal': self.cabezal,
+            'desde': desde,
+            'simbolos': self.compilar().simbolos,
+            'cinta': ids,
+        }, traza)
+    
+    @classmethod
+    def desde_punto_control(cls, ruta):
+        """
+        Reconstruye una máquina a partir de un punto de control.
+        
+        Args:
+            ruta: archivo guardado con guardar_punto_control()
+        
+        Returns:
+            tupla (máquina, RegistroTraza guardado o None)
+        
+        Raises:
+            ValueError: si el archivo no es válido o no corresponde a esta tabla
+        """
+        configuracion, traza = cargar_punto_control(ruta)
+        mt = cls(configuracion['entrada'])
+        compilada = mt.compilar()
+        if (configuracion['simbolos'] != compilada.simbolos
+                or configuracion['estado'] not in compilada.id_estado):
+            raise ValueError(f"'{ruta}' fue guardado con otra tabla de transiciones")
+        
+        mt.estado = configuracion['estado']
+        mt.pasos = configuracion['pasos']
+        mt.max_pasos = configuracion['max_pasos']
+        mt.cabezal = configuracion['cabezal']
+        
+        cinta = Cinta(compilada.simbolos)
+        ids = configuracion['cinta']
+        if ids:
+            desde = configuracion['desde']
+            cinta.asegurar(desde)
+            cinta.asegurar(desde + len(ids) - 1)
+            cinta.datos[cinta.origen + desde:cinta.origen + desde + len(ids)] = ids
+            cinta.recalcular_limites()
+        mt.cinta = cinta
+        return mt, traza
+    
+    def _ejecutar_hasta(self, limite, traza=None, perfil=None, tramo=None):
+        """
+        Ejecuta sin imprimir hasta terminar o llegar a "limite" pasos.
+        
+        Args:
+            limite: valor máximo de self.pasos
+            traza, perfil: ver ejecutar()
+            tramo: si se indica, se detiene luego de simular esa cantidad de
+                   pasos (sin contar los ciclos avanzados de una vez)
+        
+        Returns:
+            cantidad de pasos simulados
+        """
+        if self.acelerar_ciclos and traza is None and perfil is None:
+            return self._ejecutar_acelerado(limite, tramo)
+        
+        pasos_antes = self.pasos
+        if tramo is not None:
+            limite = min(limite, self.pasos + tramo)
+        if traza is not None:
+            self._ejecutar_trazado(limite, traza)
+        elif perfil is not None:
+            self._ejecutar_perfilado(limite, perfil)
+        else:
+            self._ejecutar_compilado(limite)
+        return self.pasos - pasos_antes
+    
+    def _ejecutar_por_tramos(self, traza, perfil, punto_control, intervalo_control):
+        """
+        Ejecuta el resto de la ejecución, deteniéndose donde haga falta para
+        guardar puntos de control y para tomar huellas de la configuración.
+        
+        Los bucles se detienen exactamente en el límite que reciben y
+        retoman desde cualquier configuración, así que cortar la ejecución
+        en tramos no cambia el resultado ni la cantidad de pasos.
+        
+        Args:
+            traza, perfil, punto_control, intervalo_control: ver ejecutar()
+        """
+        detector = None
+        restante = None
+        if self.detectar_ciclos:
+            detector = DetectorCiclos()
+            detector.observar(self.pasos, self.estado, self.cinta, self.cabezal)
+            restante = detector.tramo(self.cinta)
+        # Los puntos de control se cuentan en pasos simulados, igual que las
+        # huellas: un salto de muchos ciclos (_avanzar_ciclos()) no se corta
+        hasta_control = None if punto_control is None else intervalo_control
+        
+        while True:
+            tramos = [t for t in (restante, hasta_control) if t is not None]
+            simulados = self._ejecutar_hasta(self.max_pasos, traza, perfil,
+                                             min(tramos) if tramos else None)
+            terminado = (self.estado == 'FIN' or self.detenido_por_error
+                         or self.pasos >= self.max_pasos)
+            
+            # Huella al completar el tramo (la cantidad de pasos del tramo
+            # depende solo de la configuración, nunca del punto de control)
+            if not terminado and detector is not None:
+                restante -= simulados
+                if restante <= 0:
+                    if detector.observar(self.pasos, self.estado, self.cinta, self.cabezal):
+                        self.no_termina = True
+                        terminado = True
+                        print(f"La máquina no termina: la configuración del paso "
+                              f"{detector.paso_guardada} se repite en el paso {self.pasos}")
+                    restante = detector.tramo(self.cinta)
+            
+            if hasta_control is not None:
+                hasta_control -= simulados
+                if terminado or hasta_control <= 0:
+                    self.guardar_punto_control(punto_control, traza)
+                    hasta_control = intervalo_control
+            if terminado:
+                break
+    
+    def ejecutar(self, verbose=True, traza=None, punto_control=None,
+                 intervalo_control=INTERVALO_PUNTO_CONTROL, perfil=None):
         """
         Ejecuta la máquina de Turing hasta terminar
         
         Args:
             verbose: si True, imprime información detallada
+            traza: RegistroTraza opcional; si se indica, TODOS los pasos se
+                   registran en ella (sin saltar barridos ni ciclos), para
+                   poder exportar los últimos pasos al depurar
+            punto_control: archivo opcional donde se guarda la configuración
+                           cada "intervalo_control" pasos simulados y al
+                           terminar; para reanudar, ver desde_punto_control()
+            intervalo_control: pasos simulados entre puntos de control (los
+                               ciclos avanzados de una vez no cuentan)
+            perfil: PerfilEjecucion opcional; si se indica, cada paso se
+                    cuenta en él (ver perfil.py). No se puede combinar con traza
         """
+        if traza is not None and perfil is not None:
+            raise ValueError("No se puede usar traza y perfil en la misma ejecución")
+        
         if verbose:
             print(f"Entrada: '{self.entrada_original}'")
             print(f"Estado inicial: {self.estado}")
-            print(f"Cinta inicial: {''.join(self.cinta).strip()}")
+            print(f"Cinta inicial: {self.cinta.texto()}")
             print("-" * 60)
         
-        paso = 0
-        while self.estado != 'FIN' and self.pasos < self.max_pasos:
-            simbolo_actual = self.cinta[self.cabezal]
-            estado_anterior = self.estado
-            
-            if not self.ejecutar_paso():
-                break
+        error = False
+        # Los primeros pasos se muestran en detalle: se ejecutan registrándolos
+        # en una traza y la cinta de cada paso se dibuja recién al imprimir
+        if verbose and self.estado != 'FIN' and self.pasos < self.max_pasos:
+            compilada = self.compilar()
+            inicial = RegistroTraza(PASOS_DETALLADOS)
+            pasos_iniciales = self.pasos
+            self._ejecutar_trazado(min(self.max_pasos, self.pasos + PASOS_DETALLADOS), inicial,
+                                   informar_error=False)
             
-            paso += 1
-            
-            # Imprimir cada 10 pasos o en estados importantes
-            if verbose and (paso <= 20 or paso % 50 == 0 or estado_anterior != self.estado):
-                cinta_str = ''.join(self.cinta).strip()
+            instantaneas = inicial.instantaneas(self.cinta, compilada.id_estado[self.estado],
+                                                self.cabezal)
+            for registro, estado_despues, cabezal_despues, cinta_str in instantaneas:
+                paso, estado_anterior, _, leido, _ = registro
                 # Marcar posición del cabezal
-                if self.cabezal < len(self.cinta):
-                    cinta_visual = list(cinta_str)
-                    pos_visual = self.cabezal - 1  # Ajustar por el espacio inicial
-                    if 0 <= pos_visual < len(cinta_visual):
-                        if paso <= 20:
-                            print(f"Paso {paso}: Estado={estado_anterior}->{self.estado}, "
-                                  f"Pos={self.cabezal}, Símbolo='{simbolo_actual}', "
-                                  f"Cinta: {cinta_str}")
+                pos_visual = cabezal_despues - 1  # Ajustar por el espacio inicial
+                if 0 <= pos_visual < len(cinta_str):
+                    print(f"Paso {paso - pasos_iniciales}: "
+                          f"Estado={compilada.estados[estado_anterior]}->{compilada.estados[estado_despues]}, "
+                          f"Pos={cabezal_despues}, Símbolo='{compilada.simbolos[leido]}', "
+                          f"Cinta: {cinta_str}")
+                if traza is not None:
+                    traza.registrar(*registro)
+                if perfil is not None:
+                    perfil.contar(estado_anterior, leido, cabezal_despues - registro[2],
+                                  estado_despues)
+            
+            # Transición no definida dentro de los primeros pasos
+            if (self.estado != 'FIN' and self.pasos < self.max_pasos
+                    and self.pasos - pasos_iniciales < PASOS_DETALLADOS):
+                error = not self.ejecutar_paso()
+        
+        # El resto de la ejecución no imprime nada: se usa la tabla compilada
+        if not error and self.estado != 'FIN':
+            self._ejecutar_por_tramos(traza, perfil, punto_control, intervalo_control)
+        elif punto_control is not None:
+            self.guardar_punto_control(punto_control, traza)
         
         if verbose:
             print("-" * 60)
@@ -269,9 +925,8 @@ class MaquinaTuring1Cinta:
         return resultado
     
     def obtener_resultado(self):
-        """Obtiene el resultado de la cinta"""
-        cinta_str = ''.join(self.cinta).strip()
-        return cinta_str
+        """Obtiene el resultado de la cinta (solo recorre la región no blanca)"""
+        return self.cinta.texto()
     
     def exportar_algoritmo(self, nombre_archivo="suma_binaria_1cinta.txt"):
         """
@@ -319,6 +974,9 @@ class MaquinaTuring1Cinta:
                         'BUSCAR_IZQ_CONTINUAR', 'BUSCAR_IZQ_CERO', 'BUSCAR_INICIO', 
                         'MOVER_DER_UNA_VEZ', 'FIN']
         
+        # Estados que no figuran en el orden (por ejemplo, de una tabla modificada)
+        estados_orden += [e for e in self.transiciones if e not in estados_orden]
+        
         for estado in estados_orden:
             if estado not in self.transiciones:
                 continue
@@ -396,6 +1054,41 @@ def suma_binaria_tradicional(bin1, bin2):
     return bin(suma)[2:]
 
 
+def ejecutar_reanudable(entrada, ruta, max_pasos=10000, intervalo=INTERVALO_PUNTO_CONTROL,
+                        traza=None):
+    """
+    Ejecuta una suma guardando puntos de control, reanudando si ya hay uno.
+    
+    Si "ruta" existe y corresponde a la misma entrada, la ejecución sigue
+    desde la configuración guardada (con su traza, si se guardó una); si
+    no, empieza desde cero. Así un proceso interrumpido se vuelve a lanzar
+    con los mismos argumentos y pierde a lo sumo "intervalo" pasos simulados.
+    
+    Args:
+        entrada: string en formato 'a+b'
+        ruta: archivo del punto de control
+        max_pasos: límite de pasos de la ejecución completa
+        intervalo: pasos simulados entre puntos de control
+        traza: RegistroTraza a usar si no hay un punto de control previo
+    
+    Returns:
+        la máquina luego de ejecutar
+    """
+    mt = None
+    if os.path.exists(ruta):
+        mt, traza_guardada = MaquinaTuring1Cinta.desde_punto_control(ruta)
+        if mt.entrada_original != entrada:
+            mt = None                       # Punto de control de otra ejecución
+        elif traza_guardada is not None:
+            traza = traza_guardada
+    if mt is None:
+        mt = MaquinaTuring1Cinta(entrada)
+    
+    mt.max_pasos = max_pasos
+    mt.ejecutar(verbose=False, traza=traza, punto_control=ruta, intervalo_control=intervalo)
+    return mt
+
+
 def main():
     """Función principal"""
     print("=" * 70)
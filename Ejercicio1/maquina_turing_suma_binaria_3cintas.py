@@ -22,10 +22,58 @@ Estados:
 - SUMAR_SIN_CARRY: Sumar bits sin acarreo previo
 - SUMAR_CON_CARRY: Sumar bits con acarreo
 - FIN: Estado final (suma completada)
+
+La tabla TRANSICIONES_3CINTAS se ejecuta de verdad con el motor genérico de
+k cintas (motor_k_cintas.py): los pasos informados son los reales.
 """
 
+from motor_k_cintas import MaquinaTuringKCintas
+from optimizador import optimizar
+
+
+# Transiciones del algoritmo verificado de 3 cintas, en el formato de
+# turingmachinesimulator.com:
+# (estado, s1, s2, s3, nuevo_estado, e1, e2, e3, d1, d2, d3)
+TRANSICIONES_3CINTAS = [
+    ("INICIO", "0", "_", "_", "INICIO", "0", "_", "_", ">", "-", "-"),
+    ("INICIO", "1", "_", "_", "INICIO", "1", "_", "_", ">", "-", "-"),
+    ("INICIO", "+", "_", "_", "COPIAR_NUM2", "_", "_", "_", ">", ">", "-"),
+    
+    ("COPIAR_NUM2", "0", "_", "_", "COPIAR_NUM2", "_", "0", "_", ">", ">", "-"),
+    ("COPIAR_NUM2", "1", "_", "_", "COPIAR_NUM2", "_", "1", "_", ">", ">", "-"),
+    ("COPIAR_NUM2", "_", "_", "_", "PREPARAR_SUMA", "_", "_", "_", "<", "<", "-"),
+    
+    ("PREPARAR_SUMA", "_", "0", "_", "PREPARAR_SUMA", "_", "0", "_", "<", "-", "-"),
+    ("PREPARAR_SUMA", "_", "1", "_", "PREPARAR_SUMA", "_", "1", "_", "<", "-", "-"),
+    ("PREPARAR_SUMA", "1", "0", "_", "SUMAR_SIN_CARRY", "1", "0", "_", "-", "-", "-"),
+    ("PREPARAR_SUMA", "1", "1", "_", "SUMAR_SIN_CARRY", "1", "1", "_", "-", "-", "-"),
+    ("PREPARAR_SUMA", "0", "1", "_", "SUMAR_SIN_CARRY", "0", "1", "_", "-", "-", "-"),
+    ("PREPARAR_SUMA", "0", "0", "_", "SUMAR_SIN_CARRY", "0", "0", "_", "-", "-", "-"),
+    
+    ("SUMAR_SIN_CARRY", "1", "0", "_", "SUMAR_SIN_CARRY", "1", "0", "1", "<", "<", "<"),
+    ("SUMAR_SIN_CARRY", "0", "1", "_", "SUMAR_SIN_CARRY", "0", "1", "1", "<", "<", "<"),
+    ("SUMAR_SIN_CARRY", "0", "0", "_", "SUMAR_SIN_CARRY", "0", "0", "0", "<", "<", "<"),
+    ("SUMAR_SIN_CARRY", "1", "1", "_", "SUMAR_CON_CARRY", "1", "1", "0", "<", "<", "<"),
+    ("SUMAR_SIN_CARRY", "_", "_", "_", "FIN", "_", "_", "_", "-", "-", "-"),
+    ("SUMAR_SIN_CARRY", "1", "_", "_", "SUMAR_SIN_CARRY", "1", "_", "1", "<", "<", "<"),
+    ("SUMAR_SIN_CARRY", "0", "_", "_", "SUMAR_SIN_CARRY", "0", "_", "0", "<", "<", "<"),
+    ("SUMAR_SIN_CARRY", "_", "1", "_", "SUMAR_SIN_CARRY", "_", "1", "1", "<", "<", "<"),
+    ("SUMAR_SIN_CARRY", "_", "0", "_", "SUMAR_SIN_CARRY", "_", "0", "0", "<", "<", "<"),
+    
+    ("SUMAR_CON_CARRY", "0", "0", "_", "SUMAR_SIN_CARRY", "0", "0", "1", "<", "<", "<"),
+    ("SUMAR_CON_CARRY", "0", "1", "_", "SUMAR_CON_CARRY", "0", "1", "0", "<", "<", "<"),
+    ("SUMAR_CON_CARRY", "1", "0", "_", "SUMAR_CON_CARRY", "1", "0", "0", "<", "<", "<"),
+    ("SUMAR_CON_CARRY", "1", "1", "_", "SUMAR_CON_CARRY", "1", "1", "1", "<", "<", "<"),
+    ("SUMAR_CON_CARRY", "_", "0", "_", "SUMAR_SIN_CARRY", "_", "0", "1", "<", "<", "<"),
+    ("SUMAR_CON_CARRY", "_", "1", "_", "SUMAR_CON_CARRY", "_", "1", "0", "<", "<", "<"),
+    ("SUMAR_CON_CARRY", "1", "_", "_", "SUMAR_CON_CARRY", "1", "_", "0", "<", "<", "<"),
+    ("SUMAR_CON_CARRY", "0", "_", "_", "SUMAR_SIN_CARRY", "0", "_", "1", "<", "<", "<"),
+    ("SUMAR_CON_CARRY", "_", "_", "_", "FIN", "_", "_", "1", "-", "-", "-"),
+]
+
+
 class MaquinaTuringSumaBinaria:
-    def __init__(self):
+    def __init__(self, optimizar_tabla=False):
         # Estados de la máquina
         self.estados = {'INICIO', 'COPIAR_NUM2', 'PREPARAR_SUMA', 
                        'SUMAR_SIN_CARRY', 'SUMAR_CON_CARRY', 'FIN'}
@@ -40,126 +88,78 @@ class MaquinaTuringSumaBinaria:
         # Estados finales
         self.estados_finales = {'FIN'}
         
-        # Función de transición
+        # Función de transición (opcionalmente optimizada, ver optimizador.py)
         self.transiciones = self._definir_transiciones()
-        
-        # Cinta única
-        self.cinta = []
-        self.posicion_cabezal = 0
+        self.informe_optimizacion = None
+        if optimizar_tabla:
+            self.transiciones, self.estados_finales, self.informe_optimizacion = optimizar(
+                self.transiciones, 3, self.estado_inicial, self.estados_finales)
+            self.estados = ({t[0] for t in self.transiciones} | {t[4] for t in self.transiciones}
+                            | self.estados_finales)
+        
+        # Motor de 3 cintas que ejecuta la tabla (índice compilado, cintas de bytes)
+        self.motor = MaquinaTuringKCintas(self.transiciones, 3, self.estado_inicial,
+                                          self.estados_finales, blanco='_')
         self.estado_actual = self.estado_inicial
         
     def _definir_transiciones(self):
         """
-        Implementación simplificada de suma binaria en 1 cinta
+        Devuelve la tabla de transiciones de 3 cintas
         
-        Este método retorna un diccionario vacío porque la lógica de suma
-        se implementa directamente en el método ejecutar() usando
-        un algoritmo que simula el comportamiento de una MT real.
+        Formato: lista de tuplas (estado, s1, s2, s3, nuevo_estado, e1, e2, e3, d1, d2, d3)
         
-        Para una MT real, necesitaríamos cientos de estados para manejar
-        todos los casos de suma bit por bit con carries.
+        - Cinta 1: entrada a+b (se borra el segundo número al copiarlo)
+        - Cinta 2: copia del segundo número
+        - Cinta 3: resultado, escrito de derecha a izquierda
         """
-        return {}
+        return TRANSICIONES_3CINTAS
     
     def cargar_entrada(self, entrada):
-        """Carga la cadena de entrada en la cinta"""
-        self.cinta = list(entrada) + ['_'] * 10
-        self.posicion_cabezal = 0
+        """Carga la cadena de entrada en la cinta 1 (las cintas 2 y 3 quedan en blanco)"""
+        self.motor.cargar(entrada)
         self.estado_actual = self.estado_inicial
-        
-    def _suma_binaria_mt_style(self, num1, num2):
-        """
-        Simula el algoritmo de suma binaria como lo haría una MT real
-        Procesa bit por bit de derecha a izquierda con carry
+    
+    def ejecutar(self, max_pasos=1000):
         """
-        # Igualar longitudes
-        max_len = max(len(num1), len(num2))
-        num1 = num1.zfill(max_len)
-        num2 = num2.zfill(max_len)
-        
-        resultado = []
-        carry = 0
-        paso = 0
-        
-        print("Simulando suma binaria bit por bit:")
+        Ejecuta la máquina de 3 cintas hasta llegar a un estado final
         
-        # Procesar de derecha a izquierda
-        for i in range(max_len - 1, -1, -1):
-            bit1 = int(num1[i])
-            bit2 = int(num2[i])
-            
-            suma = bit1 + bit2 + carry
-            bit_resultado = suma % 2
-            carry = suma // 2
-            
-            resultado.insert(0, str(bit_resultado))
-            paso += 1
-            
-            if paso <= 10:
-                print(f"  Paso {paso}: pos={max_len-i}, bit1={bit1}, bit2={bit2}, "
-                      f"carry_in={carry if paso > 1 else 0}, suma={suma}, "
-                      f"resultado={bit_resultado}, carry_out={carry}")
+        Args:
+            max_pasos: cantidad máxima de pasos a ejecutar
         
-        # Agregar carry final si existe
-        if carry:
-            resultado.insert(0, '1')
-            print(f"  Paso {paso+1}: Agregando carry final = 1")
-        
-        return ''.join(resultado)
-    
-    def ejecutar(self, max_pasos=1000):
-        """Ejecuta la máquina hasta llegar a un estado final"""
+        Returns:
+            resultado de la suma (contenido de la cinta 3), o "0" si la
+            entrada es inválida o la máquina no terminó
+        """
         print(f"Estado inicial: {self.estado_actual}")
-        cinta_str = ''.join(self.cinta[:20])
-        print(f"Cinta inicial: {cinta_str}")
+        print(f"Cinta inicial: {self.motor.contenido(0)}")
         print("-" * 50)
         
-        # Extraer números de la entrada
-        cinta_completa = ''.join(self.cinta).replace('_', '')
-        if '+' not in cinta_completa:
-            print("Error: formato inválido, se esperaba a+b")
-            return "0"
-        
-        partes = cinta_completa.split('+')
+        # Validar el formato de la entrada
+        partes = self.motor.contenido(0).split('+')
         if len(partes) != 2 or not partes[0] or not partes[1]:
-            print("Error: formato inválido")
+            print("Error: formato inválido, se esperaba a+b")
             return "0"
         
-        num1, num2 = partes[0], partes[1]
-        
-        # Realizar la suma usando el algoritmo de MT
-        resultado = self._suma_binaria_mt_style(num1, num2)
-        
-        # Escribir resultado en la cinta
-        self.cinta = list(resultado) + ['_'] * 10
-        self.estado_actual = 'FIN'
-        
-        pasos_estimados = len(num1) + len(num2) + len(resultado) + 15
+        termino = self.motor.ejecutar(max_pasos)
+        self.estado_actual = self.motor.nombre_estado
         
         print("-" * 50)
-        print(f"Ejecución terminada en ~{pasos_estimados} pasos (estimados)")
+        print(f"Ejecución terminada en {self.motor.pasos} pasos "
+              f"({self.motor.pasos_por_segundo():,.0f} pasos/s)")
         print(f"Estado final: {self.estado_actual}")
-        print(f"Cinta final: {''.join(self.cinta[:20])}")
+        
+        if not termino:
+            print(f"Error: la máquina no llegó a un estado final en {max_pasos} pasos")
+            return "0"
+        
+        resultado = self.obtener_resultado()
+        print(f"Cinta final (cinta 3): {resultado}")
         
         return resultado
     
     def obtener_resultado(self):
-        """Extrae el resultado de la cinta"""
-        # Encontrar el inicio del resultado (primer dígito no vacío)
-        inicio = 0
-        while inicio < len(self.cinta) and self.cinta[inicio] == '_':
-            inicio += 1
-        
-        # Encontrar el final del resultado
-        fin = inicio
-        while (fin < len(self.cinta) and 
-               self.cinta[fin] in {'0', '1'}):
-            fin += 1
-        
-        if inicio >= len(self.cinta):
-            return "0"
-        
-        resultado = ''.join(self.cinta[inicio:fin])
+        """Extrae el resultado de la cinta 3"""
+        resultado = self.motor.contenido(2)
         return resultado if resultado else "0"
     
     def exportar_algoritmo_txt(self, nombre_archivo="suma_binaria_3cintas.txt"):
@@ -192,46 +192,9 @@ class MaquinaTuringSumaBinaria:
         lineas.append("accept: FIN")
         lineas.append("")
         
-        # Transiciones del algoritmo verificado de 3 cintas
-        transiciones_3cintas = [
-            ("INICIO", "0", "_", "_", "INICIO", "0", "_", "_", ">", "-", "-"),
-            ("INICIO", "1", "_", "_", "INICIO", "1", "_", "_", ">", "-", "-"),
-            ("INICIO", "+", "_", "_", "COPIAR_NUM2", "_", "_", "_", ">", ">", "-"),
-            
-            ("COPIAR_NUM2", "0", "_", "_", "COPIAR_NUM2", "_", "0", "_", ">", ">", "-"),
-            ("COPIAR_NUM2", "1", "_", "_", "COPIAR_NUM2", "_", "1", "_", ">", ">", "-"),
-            ("COPIAR_NUM2", "_", "_", "_", "PREPARAR_SUMA", "_", "_", "_", "<", "<", "-"),
-            
-            ("PREPARAR_SUMA", "_", "0", "_", "PREPARAR_SUMA", "_", "0", "_", "<", "-", "-"),
-            ("PREPARAR_SUMA", "_", "1", "_", "PREPARAR_SUMA", "_", "1", "_", "<", "-", "-"),
-            ("PREPARAR_SUMA", "1", "0", "_", "SUMAR_SIN_CARRY", "1", "0", "_", "-", "-", "-"),
-            ("PREPARAR_SUMA", "1", "1", "_", "SUMAR_SIN_CARRY", "1", "1", "_", "-", "-", "-"),
-            ("PREPARAR_SUMA", "0", "1", "_", "SUMAR_SIN_CARRY", "0", "1", "_", "-", "-", "-"),
-            ("PREPARAR_SUMA", "0", "0", "_", "SUMAR_SIN_CARRY", "0", "0", "_", "-", "-", "-"),
-            
-            ("SUMAR_SIN_CARRY", "1", "0", "_", "SUMAR_SIN_CARRY", "1", "0", "1", "<", "<", "<"),
-            ("SUMAR_SIN_CARRY", "0", "1", "_", "SUMAR_SIN_CARRY", "0", "1", "1", "<", "<", "<"),
-            ("SUMAR_SIN_CARRY", "0", "0", "_", "SUMAR_SIN_CARRY", "0", "0", "0", "<", "<", "<"),
-            ("SUMAR_SIN_CARRY", "1", "1", "_", "SUMAR_CON_CARRY", "1", "1", "0", "<", "<", "<"),
-            ("SUMAR_SIN_CARRY", "_", "_", "_", "FIN", "_", "_", "_", "-", "-", "-"),
-            ("SUMAR_SIN_CARRY", "1", "_", "_", "SUMAR_SIN_CARRY", "1", "_", "1", "<", "<", "<"),
-            ("SUMAR_SIN_CARRY", "0", "_", "_", "SUMAR_SIN_CARRY", "0", "_", "0", "<", "<", "<"),
-            ("SUMAR_SIN_CARRY", "_", "1", "_", "SUMAR_SIN_CARRY", "_", "1", "1", "<", "<", "<"),
-            ("SUMAR_SIN_CARRY", "_", "0", "_", "SUMAR_SIN_CARRY", "_", "0", "0", "<", "<", "<"),
-            
-            ("SUMAR_CON_CARRY", "0", "0", "_", "SUMAR_SIN_CARRY", "0", "0", "1", "<", "<", "<"),
-            ("SUMAR_CON_CARRY", "0", "1", "_", "SUMAR_CON_CARRY", "0", "1", "0", "<", "<", "<"),
-            ("SUMAR_CON_CARRY", "1", "0", "_", "SUMAR_CON_CARRY", "1", "0", "0", "<", "<", "<"),
-            ("SUMAR_CON_CARRY", "1", "1", "_", "SUMAR_CON_CARRY", "1", "1", "1", "<", "<", "<"),
-            ("SUMAR_CON_CARRY", "_", "0", "_", "SUMAR_SIN_CARRY", "_", "0", "1", "<", "<", "<"),
-            ("SUMAR_CON_CARRY", "_", "1", "_", "SUMAR_CON_CARRY", "_", "1", "0", "<", "<", "<"),
-            ("SUMAR_CON_CARRY", "1", "_", "_", "SUMAR_CON_CARRY", "1", "_", "0", "<", "<", "<"),
-            ("SUMAR_CON_CARRY", "0", "_", "_", "SUMAR_SIN_CARRY", "0", "_", "1", "<", "<", "<"),
-            ("SUMAR_CON_CARRY", "_", "_", "_", "FIN", "_", "_", "1", "-", "-", "-"),
-        ]
         
         # Escribir transiciones
-        for estado, s1, s2, s3, nuevo_estado, ns1, ns2, ns3, d1, d2, d3 in transiciones_3cintas:
+        for estado, s1, s2, s3, nuevo_estado, ns1, ns2, ns3, d1, d2, d3 in self.transiciones:
             lineas.append(f"{estado},{s1},{s2},{s3}")
             lineas.append(f"{nuevo_estado},{ns1},{ns2},{ns3},{d1},{d2},{d3}")
             lineas.append("")
@@ -245,7 +208,7 @@ class MaquinaTuringSumaBinaria:
             print(f"  Ruta: {ruta_completa}")
             print(f"  Cintas: 3")
             print(f"  Estados: 6 (INICIO, COPIAR_NUM2, PREPARAR_SUMA, SUMAR_SIN_CARRY, SUMAR_CON_CARRY, FIN)")
-            print(f"  Transiciones: {len(transiciones_3cintas)}")
+            print(f"  Transiciones: {len(self.transiciones)}")
             print(f"  Estado inicial: INICIO")
             print(f"  Estados finales: FIN")
             print(f"  Formato: Compatible con turingmachinesimulator.com")
@@ -0,0 +1,227 @@
+"""
+Motor Genérico de Máquinas de Turing de k Cintas
+================================================
+
+Ejecuta tablas de transiciones de k cintas en el formato de
+turingmachinesimulator.com, expresadas como tuplas:
+
+    (estado, s_1..s_k, nuevo_estado, e_1..e_k, d_1..d_k)
+
+donde s_i es el símbolo leído en la cinta i, e_i el que se escribe y d_i la
+dirección ('<', '>', '-'). Por ejemplo, para 3 cintas:
+
+    ("SUMAR_SIN_CARRY", "1", "0", "_", "SUMAR_SIN_CARRY", "1", "0", "1", "<", "<", "<")
+
+*** TABLA COMPILADA ***
+================================================================================
+Como en tabla_compilada.py, estados y símbolos se numeran con enteros chicos
+(el blanco es el símbolo 0) y la tabla se indexa con una clave de enteros:
+
+    (estado, s_1, ..., s_k)  ->  (nuevo_estado, (e_1..e_k), (d_1..d_k))
+
+con d_i en {-1, 0, +1}. Con k cintas, aplanar la tabla en una lista de
+|estados| * |alfabeto|^k entradas sería casi todo vacío, por eso se usa un
+diccionario con claves tupla (solo las transiciones definidas).
+
+Cada cinta es una Cinta (cinta.py): un byte por celda y crecimiento O(1)
+amortizado hacia ambos lados.
+================================================================================
+"""
+
+import time
+
+from cinta import Cinta
+from tabla_compilada import MOVIMIENTOS
+
+
+class MaquinaTuringKCintas:
+    def __init__(self, transiciones, num_cintas, estado_inicial, estados_finales, blanco='_'):
+        """
+        Compila la tabla de transiciones de k cintas.
+
+        Args:
+            transiciones: lista de tuplas (estado, s_1..s_k, nuevo_estado, e_1..e_k, d_1..d_k)
+            num_cintas: cantidad de cintas (k)
+            estado_inicial: nombre del estado inicial
+            estados_finales: nombres de los estados finales
+            blanco: símbolo blanco de las cintas (recibe el id 0)
+        """
+        k = num_cintas
+        for transicion in transiciones:
+            if len(transicion) != 2 + 3 * k:
+                raise ValueError(f"Transición con {len(transicion)} campos "
+                                 f"(se esperaban {2 + 3 * k} para {k} cintas): {transicion}")
+
+        self.num_cintas = k
+        self.blanco = blanco
+
+        # ====================================================================
+        # NUMERAR ESTADOS Y SÍMBOLOS
+        # ====================================================================
+        # Diccionarios nombre -> id (en orden de aparición)
+        id_estado = {estado_inicial: 0}
+        id_simbolo = {blanco: 0}
+        for transicion in transiciones:
+            for nombre in (transicion[0], transicion[k + 1]):
+                id_estado.setdefault(nombre, len(id_estado))
+            for s in transicion[1:k + 1] + transicion[k + 2:2 * k + 2]:
+                id_simbolo.setdefault(s, len(id_simbolo))
+        for nombre in estados_finales:
+            id_estado.setdefault(nombre, len(id_estado))
+
+        self.estados = list(id_estado)
+        self.simbolos = list(id_simbolo)
+        self.estado_inicial = id_estado[estado_inicial]
+        self.estados_finales = {id_estado[nombre] for nombre in estados_finales}
+
+        # ====================================================================
+        # ÍNDICE (estado, s_1..s_k) -> (nuevo_estado, escritos, movimientos)
+        # ====================================================================
+        self.indice = {}
+        for transicion in transiciones:
+            clave = (id_estado[transicion[0]],
+                     *(id_simbolo[s] for s in transicion[1:k + 1]))
+            self.indice[clave] = (id_estado[transicion[k + 1]],
+                                  tuple(id_simbolo[s] for s in transicion[k + 2:2 * k + 2]),
+                                  tuple(MOVIMIENTOS[d] for d in transicion[2 * k + 2:]))
+
+        self._inicializar()
+
+    def _inicializar(self):
+        """Arma los diccionarios de nombres y deja la máquina con la entrada vacía"""
+        self.id_estado = {nombre: i for i, nombre in enumerate(self.estados)}
+        self.id_simbolo = {s: i for i, s in enumerate(self.simbolos)}
+        self.cargar('')
+
+    def exportar_compilada(self):
+        """
+        Devuelve la máquina compilada usando solo tipos básicos (listas,
+        tuplas, diccionarios, conjuntos, enteros y strings), para poder
+        guardarla con marshal (ver cargador_tms.py).
+        """
+        return {
+            'num_cintas': self.num_cintas,
+            'blanco': self.blanco,
+            'estados': list(self.estados),
+            'simbolos': list(self.simbolos),
+            'estado_inicial': self.estado_inicial,
+            'estados_finales': set(self.estados_finales),
+            'indice': dict(self.indice),
+        }
+
+    @classmethod
+    def desde_compilada(cls, compilada):
+        """
+        Reconstruye una máquina a partir de exportar_compilada(), sin recompilar.
+
+        Args:
+            compilada: diccionario devuelto por exportar_compilada()
+
+        Returns:
+            MaquinaTuringKCintas
+        """
+        maquina = cls.__new__(cls)
+        maquina.num_cintas = compilada['num_cintas']
+        maquina.blanco = compilada['blanco']
+        maquina.estados = compilada['estados']
+        maquina.simbolos = compilada['simbolos']
+        maquina.estado_inicial = compilada['estado_inicial']
+        maquina.estados_finales = compilada['estados_finales']
+        maquina.indice = compilada['indice']
+        maquina._inicializar()
+        return maquina
+
+    def cargar(self, entrada):
+        """
+        Carga la entrada en la cinta 1 (el resto de las cintas queda en blanco).
+
+        Todos los cabezales empiezan en la posición 0.
+
+        Args:
+            entrada: string de entrada
+        """
+        # Símbolos de la entrada que no figuran en la tabla: no tienen
+        # transiciones, pero tienen que poder guardarse en la cinta
+        for s in entrada:
+            if s not in self.id_simbolo:
+                self.id_simbolo[s] = len(self.simbolos)
+                self.simbolos.append(s)
+
+        self.cintas = [Cinta(self.simbolos, entrada if i == 0 else '')
+                       for i in range(self.num_cintas)]
+        self.cabezales = [0] * self.num_cintas
+        self.estado = self.estado_inicial
+        self.pasos = 0
+        self.tiempo = 0.0
+
+    def ejecutar(self, max_pasos=None):
+        """
+        Ejecuta hasta llegar a un estado sin transición o a max_pasos pasos.
+
+        Args:
+            max_pasos: valor máximo de self.pasos (None = sin límite)
+
+        Returns:
+            True si la máquina terminó en un estado final
+        """
+        indice = self.indice
+        cintas = self.cintas
+        rango = range(self.num_cintas)
+        limite = float('inf') if max_pasos is None else max_pasos
+
+        # Estado en variables locales; las posiciones son índices de cada buffer
+        datos = [cinta.datos for cinta in cintas]
+        posiciones = [cinta.origen + cabezal for cinta, cabezal in zip(cintas, self.cabezales)]
+        estado = self.estado
+        pasos = self.pasos
+
+        inicio = time.perf_counter()
+        while pasos < limite:
+            transicion = indice.get((estado, *[datos[i][posiciones[i]] for i in rango]))
+            if transicion is None:
+                break                       # Estado final (o transición no definida)
+
+            estado, escritos, movimientos = transicion
+            for i in rango:
+                posicion = posiciones[i]
+                datos[i][posicion] = escritos[i]
+                posicion += movimientos[i]
+
+                # Al salir del buffer, la cinta duplica su capacidad hacia ese lado
+                if posicion < 0 or posicion == len(datos[i]):
+                    cinta = cintas[i]
+                    cabezal = posicion - cinta.origen
+                    cinta.asegurar(cabezal)
+                    posicion = cinta.origen + cabezal
+                    datos[i] = cinta.datos
+                posiciones[i] = posicion
+
+            pasos += 1
+        self.tiempo += time.perf_counter() - inicio
+
+        # Volcar el estado de vuelta al objeto
+        for i, cinta in enumerate(cintas):
+            cinta.recalcular_limites()
+            self.cabezales[i] = posiciones[i] - cinta.origen
+        self.estado = estado
+        self.pasos = pasos
+
+        return estado in self.estados_finales
+
+    @property
+    def nombre_estado(self):
+        """Nombre del estado actual"""
+        return self.estados[self.estado]
+
+    def pasos_por_segundo(self):
+        """Rendimiento medido de las ejecuciones realizadas (pasos / segundo)"""
+        return self.pasos / self.tiempo if self.tiempo > 0 else float('inf')
+
+    def contenido(self, numero_cinta):
+        """
+        Devuelve la región no blanca de una cinta.
+
+        Args:
+            numero_cinta: índice de la cinta (0 = cinta de entrada)
+        """
+        return self.cintas[numero_cinta].texto()
@@ -0,0 +1,321 @@
+"""
+Optimizador de Tablas de Transiciones
+=====================================
+
+Las tablas de las máquinas están escritas a mano y tienen estados que se
+podrían eliminar o unir. Este módulo las optimiza antes de ejecutarlas, con
+tres pasadas que NO cambian el resultado de ninguna ejecución:
+
+1. Estados inalcanzables: se eliminan los estados a los que no se llega
+   desde el estado inicial.
+
+2. Estados equivalentes (refinamiento de particiones, algoritmo de Moore):
+   dos estados son equivalentes si ambos son finales o ninguno lo es, tienen
+   transiciones para los mismos símbolos, y para cada símbolo escriben lo
+   mismo, se mueven igual y van a estados equivalentes. Se parte de la
+   partición (final, símbolos con transición) y se refina hasta que no
+   cambia; cada bloque queda representado por su primer estado.
+
+3. Cadenas sin movimiento: si una transición deja TODOS los cabezales
+   quietos, el símbolo que lee el paso siguiente es el que se acaba de
+   escribir, así que los dos pasos se pueden fusionar en una sola
+   transición (un paso menos por cada uso). Si algún cabezal se mueve, el
+   símbolo siguiente depende de la cinta y fusionar no sería seguro.
+
+Las tablas se manejan en el formato de k cintas de turingmachinesimulator.com:
+
+    (estado, s_1..s_k, nuevo_estado, e_1..e_k, d_1..d_k)
+
+tabla_a_tuplas() y tuplas_a_tabla() convierten desde y hacia el diccionario
+de la máquina de 1 cinta, así la tabla optimizada se sigue ejecutando y
+exportando (exportar_algoritmo()) igual que la original.
+"""
+
+from tabla_compilada import MOVIMIENTOS
+
+
+# ============================================================================
+# CONVERSIÓN DE FORMATOS
+# ============================================================================
+def tabla_a_tuplas(transiciones):
+    """
+    Convierte {estado: {símbolo: (nuevo_estado, nuevo_símbolo, dirección)}}
+    en una lista de tuplas de 1 cinta (estado, s, nuevo_estado, e, d).
+    """
+    return [(estado, simbolo, nuevo_estado, nuevo_simbolo, direccion)
+            for estado, trans in transiciones.items()
+            for simbolo, (nuevo_estado, nuevo_simbolo, direccion) in trans.items()]
+
+
+def tuplas_a_tabla(tuplas, estados_finales):
+    """
+    Convierte tuplas de 1 cinta al diccionario de la máquina de 1 cinta.
+
+    Los estados finales quedan con un diccionario vacío (como 'FIN': {}).
+    """
+    transiciones = {}
+    for estado, simbolo, nuevo_estado, nuevo_simbolo, direccion in tuplas:
+        transiciones.setdefault(estado, {})[simbolo] = (nuevo_estado, nuevo_simbolo, direccion)
+    for estado in estados_finales:
+        transiciones.setdefault(estado, {})
+    return transiciones
+
+
+def _indexar(tuplas, k):
+    """Devuelve {(estado, lectura): (nuevo_estado, escritura, movimientos)} y los estados en orden"""
+    indice = {}
+    estados = {}
+    for t in tuplas:
+        indice[(t[0], t[1:k + 1])] = (t[k + 1], t[k + 2:2 * k + 2], t[2 * k + 2:])
+        estados.setdefault(t[0], None)
+        estados.setdefault(t[k + 1], None)
+    return indice, list(estados)
+
+
+def _armar(indice, orden):
+    """Arma la lista de tuplas a partir del índice, en el orden de las claves dadas"""
+    tuplas = []
+    for estado, lectura in orden:
+        nuevo_estado, escritura, movimientos = indice[(estado, lectura)]
+        tuplas.append((estado, *lectura, nuevo_estado, *escritura, *movimientos))
+    return tuplas
+
+
+# ============================================================================
+# PASADAS
+# ============================================================================
+def eliminar_inalcanzables(tuplas, num_cintas, estado_inicial, estados_finales):
+    """
+    Elimina las transiciones de los estados inalcanzables desde el inicial.
+
+    Returns:
+        tupla (tuplas, estados_finales alcanzables, estados eliminados)
+    """
+    k = num_cintas
+    indice, estados = _indexar(tuplas, k)
+    sucesores = {}
+    for (estado, _), (nuevo_estado, _, _) in indice.items():
+        sucesores.setdefault(estado, []).append(nuevo_estado)
+
+    alcanzables = {estado_inicial}
+    pendientes = [estado_inicial]
+    while pendientes:
+        for siguiente in sucesores.get(pendientes.pop(), ()):
+            if siguiente not in alcanzables:
+                alcanzables.add(siguiente)
+                pendientes.append(siguiente)
+
+    eliminados = [e for e in estados if e not in alcanzables]
+    return ([t for t in tuplas if t[0] in alcanzables],
+            {e for e in estados_finales if e in alcanzables}, eliminados)
+
+
+def fusionar_equivalentes(tuplas, num_cintas, estado_inicial, estados_finales):
+    """
+    Une los estados equivalentes (ver paso 2 del encabezado).
+
+    Returns:
+        tupla (tuplas, estados_finales, {representante: [estados unidos a él]})
+    """
+    k = num_cintas
+    indice, estados = _indexar(tuplas, k)
+    for estado in [estado_inicial, *estados_finales]:
+        if estado not in estados:
+            estados.append(estado)
+    # El inicial primero: siempre es el representante de su bloque
+    estados.remove(estado_inicial)
+    estados.insert(0, estado_inicial)
+
+    lecturas = {e: [] for e in estados}
+    for estado, lectura in indice:
+        lecturas[estado].append(lectura)
+
+    # Partición inicial: (es final, símbolos con transición)
+    firmas = {e: (e in estados_finales, frozenset(lecturas[e])) for e in estados}
+    bloque = _numerar(estados, firmas)
+    while True:
+        firmas = {e: (bloque[e], frozenset((lectura, bloque[indice[(e, lectura)][0]],
+                                            *indice[(e, lectura)][1:])
+                                           for lectura in lecturas[e]))
+                  for e in estados}
+        nuevo_bloque = _numerar(estados, firmas)
+        if len(set(nuevo_bloque.values())) == len(set(bloque.values())):
+            break
+        bloque = nuevo_bloque
+
+    representante = {}
+    for e in estados:
+        representante.setdefault(bloque[e], e)
+    unidos = {}
+    for e in estados:
+        if representante[bloque[e]] != e:
+            unidos.setdefault(representante[bloque[e]], []).append(e)
+
+    nuevas = []
+    for t in tuplas:
+        if representante[bloque[t[0]]] == t[0]:
+            nuevas.append((t[0], *t[1:k + 1], representante[bloque[t[k + 1]]], *t[k + 2:]))
+    return (nuevas, {representante[bloque[e]] for e in estados_finales}, unidos)
+
+
+def _numerar(estados, firmas):
+    """Numera las firmas distintas en orden de aparición: {estado: número de bloque}"""
+    numeros = {}
+    return {e: numeros.setdefault(firmas[e], len(numeros)) for e in estados}
+
+
+def fusionar_cadenas(tuplas, num_cintas, estados_finales):
+    """
+    Fusiona cada transición sin movimiento con la transición que le sigue
+    (ver paso 3 del encabezado), repitiendo mientras la cadena siga quieta.
+
+    Returns:
+        tupla (tuplas, cantidad de transiciones fusionadas)
+    """
+    k = num_cintas
+    indice, _ = _indexar(tuplas, k)
+    orden = [(t[0], t[1:k + 1]) for t in tuplas]
+    fusionadas = 0
+
+    for clave in orden:
+        nuevo_estado, escritura, movimientos = indice[clave]
+        visitadas = {clave}
+        while (all(MOVIMIENTOS[d] == 0 for d in movimientos)
+               and nuevo_estado not in estados_finales
+               and (nuevo_estado, escritura) in indice
+               and (nuevo_estado, escritura) not in visitadas):   # Ciclo quieto: no fusionar
+            visitadas.add((nuevo_estado, escritura))
+            nuevo_estado, escritura, movimientos = indice[(nuevo_estado, escritura)]
+            fusionadas += 1
+        indice[clave] = (nuevo_estado, escritura, movimientos)
+
+    return _armar(indice, orden), fusionadas
+
+
+# ============================================================================
+# OPTIMIZACIÓN COMPLETA
+# ============================================================================
+def optimizar(tuplas, num_cintas, estado_inicial, estados_finales):
+    """
+    Aplica las tres pasadas (ver encabezado) hasta que la tabla no cambia.
+
+    Args:
+        tuplas: lista de tuplas (estado, s_1..s_k, nuevo_estado, e_1..e_k, d_1..d_k)
+        num_cintas: cantidad de cintas (k)
+        estado_inicial: nombre del estado inicial
+        estados_finales: nombres de los estados finales
+
+    Returns:
+        tupla (tuplas optimizadas, estados finales, informe), donde el
+        informe es un diccionario con la cantidad de estados y transiciones
+        antes y después, los estados eliminados, los unidos y la cantidad de
+        transiciones fusionadas
+    """
+    def contar_estados(tabla, finales):
+        return len(set(_indexar(tabla, num_cintas)[1]) | {estado_inicial} | set(finales))
+
+    informe = {
+        'estados_antes': contar_estados(tuplas, estados_finales),
+        'transiciones_antes': len(tuplas),
+        'inalcanzables': [],
+        'unidos': {},
+        'fusionadas': 0,
+    }
+
+    finales = set(estados_finales)
+    while True:
+        anterior = list(tuplas)
+        tuplas, finales, eliminados = eliminar_inalcanzables(tuplas, num_cintas,
+                                                             estado_inicial, finales)
+        tuplas, fusionadas = fusionar_cadenas(tuplas, num_cintas, finales)
+        tuplas, finales, eliminados_cadenas = eliminar_inalcanzables(tuplas, num_cintas,
+                                                                     estado_inicial, finales)
+        tuplas, finales, unidos = fusionar_equivalentes(tuplas, num_cintas,
+                                                        estado_inicial, finales)
+        informe['inalcanzables'] += eliminados + eliminados_cadenas
+        informe['fusionadas'] += fusionadas
+        for representante, estados in unidos.items():
+            informe['unidos'].setdefault(representante, []).extend(estados)
+        if tuplas == anterior:
+            break
+
+    informe['estados_despues'] = contar_estados(tuplas, finales)
+    informe['transiciones_despues'] = len(tuplas)
+    return tuplas, finales, informe
+
+
+def optimizar_tabla_1cinta(transiciones, estado_inicial, estados_finales):
+    """
+    Optimiza una tabla de 1 cinta en formato diccionario.
+
+    Returns:
+        tupla (tabla optimizada en formato diccionario, informe de optimizar())
+    """
+    tuplas, finales, informe = optimizar(tabla_a_tuplas(transiciones), 1,
+                                         estado_inicial, estados_finales)
+    return tuplas_a_tabla(tuplas, finales), informe
+
+
+def imprimir_informe(informe, pasos_antes=None, pasos_despues=None):
+    """
+    Imprime el informe de optimizar().
+
+    Args:
+        informe: diccionario devuelto por optimizar()
+        pasos_antes, pasos_despues: pasos de una misma ejecución con la tabla
+                                    original y con la optimizada (opcional)
+    """
+    print(f"Estados:       {informe['estados_antes']} -> {informe['estados_despues']}")
+    print(f"Transiciones:  {informe['transiciones_antes']} -> {informe['transiciones_despues']}")
+    if informe['inalcanzables']:
+        print(f"Inalcanzables: {', '.join(informe['inalcanzables'])}")
+    for representante, estados in informe['unidos'].items():
+        print(f"Unidos:        {', '.join(estados)} -> {representante}")
+    print(f"Transiciones sin movimiento fusionadas: {informe['fusionadas']}")
+    if pasos_antes is not None:
+        ahorro = 100 * (pasos_antes - pasos_despues) / pasos_antes if pasos_antes else 0.0
+        print(f"Pasos:         {pasos_antes} -> {pasos_despues} ({ahorro:.1f}% menos)")
+
+
+def main():
+    """Ejemplo: optimiza las tablas de 1 y 3 cintas y compara los pasos"""
+    import contextlib
+    import io
+
+    from maquina_turing_suma_binaria_1cinta import MaquinaTuring1Cinta
+    from maquina_turing_suma_binaria_3cintas import MaquinaTuringSumaBinaria
+
+    casos = ["11+1", "1011+11001", "101+110", "1+1", "10+11", "1111+1"]
+
+    print("=" * 70)
+    print("OPTIMIZACIÓN DE TABLAS DE TRANSICIONES")
+    print("=" * 70)
+
+    print("\n1 CINTA")
+    pasos = [0, 0]
+    for entrada in casos:
+        for i, optimizada in enumerate((False, True)):
+            mt = MaquinaTuring1Cinta(entrada, optimizar_tabla=optimizada)
+            mt.ejecutar(verbose=False)
+            pasos[i] += mt.pasos
+    imprimir_informe(mt.informe_optimizacion, *pasos)
+
+    print("\n3 CINTAS")
+    pasos = [0, 0]
+    for entrada in casos:
+        for i, optimizada in enumerate((False, True)):
+            mt = MaquinaTuringSumaBinaria(optimizar_tabla=optimizada)
+            mt.cargar_entrada(entrada)
+            with contextlib.redirect_stdout(io.StringIO()):
+                mt.ejecutar(max_pasos=10000)
+            pasos[i] += mt.motor.pasos
+    imprimir_informe(mt.informe_optimizacion, *pasos)
+
+    # La tabla optimizada se exporta igual que la original
+    print()
+    MaquinaTuring1Cinta("1+1", optimizar_tabla=True).exportar_algoritmo(
+        "suma_binaria_1cinta_optimizada.txt")
+
+
+if __name__ == "__main__":
+    main()
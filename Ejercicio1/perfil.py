@@ -0,0 +1,119 @@
+"""
+Perfil de Ejecución por Estado y por Transición
+===============================================
+
+Para saber dónde gasta sus pasos una máquina hay que contar, en cada paso,
+qué transición se usó. Hacerlo dentro del bucle normal le agregaría trabajo
+a todas las ejecuciones, por eso la máquina usa un bucle instrumentado
+aparte (_ejecutar_perfilado()) solo cuando se le pasa un PerfilEjecucion.
+
+Los contadores son arrays de tamaño fijo, reservados al crear el perfil:
+
+- golpes[estado * |alfabeto| + símbolo]: veces que se usó cada transición
+- recorrido[estado]: celdas que se movió el cabezal estando en ese estado
+- visitas[estado]: veces que se entró al estado desde otro estado
+- tiempo[estado]: segundos de reloj pasados en el estado
+
+El tiempo se mide por "grupo" de pasos consecutivos en el mismo estado (se
+toma el reloj solo al cambiar de estado), no paso por paso.
+"""
+
+import json
+from array import array
+
+
+class PerfilEjecucion:
+    def __init__(self, compilada):
+        """
+        Crea un perfil vacío para una tabla compilada.
+
+        Args:
+            compilada: TablaCompilada de la máquina a perfilar
+        """
+        self.estados = compilada.estados
+        self.simbolos = compilada.simbolos
+        self.num_simbolos = compilada.num_simbolos
+        num_estados = len(self.estados)
+        self.golpes = array('q', bytes(8 * num_estados * self.num_simbolos))
+        self.recorrido = array('q', bytes(8 * num_estados))
+        self.visitas = array('q', bytes(8 * num_estados))
+        self.tiempo = array('d', bytes(8 * num_estados))
+
+    def contar(self, estado, simbolo, movimiento, nuevo_estado):
+        """Cuenta un paso ejecutado fuera del bucle instrumentado (sin tiempo)"""
+        self.golpes[estado * self.num_simbolos + simbolo] += 1
+        if movimiento:
+            self.recorrido[estado] += 1
+        if nuevo_estado != estado:
+            self.visitas[nuevo_estado] += 1
+
+    @property
+    def total_pasos(self):
+        """Pasos contados en total"""
+        return sum(self.golpes)
+
+    def pasos_por_estado(self):
+        """Devuelve una lista con los pasos ejecutados en cada estado (por id)"""
+        n = self.num_simbolos
+        return [sum(self.golpes[e * n:(e + 1) * n]) for e in range(len(self.estados))]
+
+    def informe(self):
+        """
+        Arma el informe ordenado por proporción de pasos.
+
+        Returns:
+            diccionario con total_pasos, estados (lista de diccionarios con
+            pasos, proporción, recorrido, visitas y tiempo) y transiciones
+            (lista de diccionarios con estado, símbolo, pasos y proporción),
+            ambas listas de mayor a menor cantidad de pasos
+        """
+        total = self.total_pasos
+        proporcion = (lambda pasos: pasos / total) if total else (lambda pasos: 0.0)
+
+        estados = []
+        for e, pasos in enumerate(self.pasos_por_estado()):
+            if pasos or self.visitas[e]:
+                estados.append({'estado': self.estados[e], 'pasos': pasos,
+                                'proporcion': proporcion(pasos),
+                                'recorrido': self.recorrido[e], 'visitas': self.visitas[e],
+                                'tiempo': self.tiempo[e]})
+        estados.sort(key=lambda fila: -fila['pasos'])
+
+        transiciones = []
+        for i, pasos in enumerate(self.golpes):
+            if pasos:
+                e, s = divmod(i, self.num_simbolos)
+                transiciones.append({'estado': self.estados[e], 'simbolo': self.simbolos[s],
+                                     'pasos': pasos, 'proporcion': proporcion(pasos)})
+        transiciones.sort(key=lambda fila: -fila['pasos'])
+
+        return {'total_pasos': total, 'estados': estados, 'transiciones': transiciones}
+
+    def imprimir(self, max_transiciones=10):
+        """
+        Imprime el informe como tabla.
+
+        Args:
+            max_transiciones: cantidad de transiciones más usadas a mostrar
+        """
+        informe = self.informe()
+        print(f"Perfil: {informe['total_pasos']} pasos")
+        print(f"{'Estado':<36} {'Pasos':>12} {'%':>6} {'Recorrido':>12} "
+              f"{'Visitas':>10} {'Tiempo (ms)':>12}")
+        for fila in informe['estados']:
+            print(f"{fila['estado']:<36} {fila['pasos']:>12} {100 * fila['proporcion']:>6.2f} "
+                  f"{fila['recorrido']:>12} {fila['visitas']:>10} {1000 * fila['tiempo']:>12.3f}")
+
+        print("\nTransiciones más usadas:")
+        for fila in informe['transiciones'][:max_transiciones]:
+            print(f"  {fila['estado']:<36} '{fila['simbolo']}' "
+                  f"{fila['pasos']:>12} {100 * fila['proporcion']:>6.2f}%")
+
+    def exportar_json(self, archivo):
+        """
+        Escribe el informe en formato JSON.
+
+        Args:
+            archivo: archivo abierto en modo texto
+        """
+        json.dump(self.informe(), archivo, ensure_ascii=False, indent=2)
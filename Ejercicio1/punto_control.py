@@ -0,0 +1,134 @@
+"""
+Puntos de Control (checkpoints) de Ejecuciones Largas
+=====================================================
+
+Una ejecución de miles de millones de pasos no puede perderse porque se
+interrumpe el proceso. Un punto de control guarda la configuración completa
+de la máquina en un archivo binario compacto:
+
+    encabezado   "MTPC", versión
+    enteros      pasos, max_pasos, cabezal, desde (largo + bytes con signo)
+    strings      entrada original, estado actual, alfabeto (largo + UTF-8)
+    cinta        ids de la región usada de la cinta (un byte por celda, zlib)
+    traza        capacidad, total, siguiente y los arrays del RegistroTraza
+
+"desde" es la posición lógica de la primera celda guardada. El estado se
+guarda por nombre (no por id), así el archivo no depende de cómo se numeren
+los estados al compilar. Los enteros no tienen tamaño fijo: el avance de
+ciclos completos llega a cantidades de pasos que no entran en 64 bits.
+
+La escritura es atómica (archivo temporal + os.replace): si el proceso muere
+mientras guarda, queda el punto de control anterior completo.
+"""
+
+import os
+import struct
+import zlib
+from array import array
+
+from traza import RegistroTraza
+
+MAGIA = b'MTPC'
+VERSION = 2
+
+# magia, versión
+ENCABEZADO = struct.Struct('<4sH')
+LARGO = struct.Struct('<Q')
+
+# Enteros de la configuración, en el orden en que se guardan
+CAMPOS_ENTEROS = ('pasos', 'max_pasos', 'cabezal', 'desde')
+
+CAMPOS_TRAZA = ('pasos', 'estados', 'cabezales', 'leidos', 'escritos')
+
+
+def _escribir_bloque(archivo, datos):
+    archivo.write(LARGO.pack(len(datos)))
+    archivo.write(datos)
+
+
+def _leer_bloque(archivo):
+    largo, = LARGO.unpack(archivo.read(LARGO.size))
+    datos = archivo.read(largo)
+    if len(datos) != largo:
+        raise ValueError("Punto de control truncado")
+    return datos
+
+
+def _escribir_entero(archivo, valor):
+    _escribir_bloque(archivo, valor.to_bytes(valor.bit_length() // 8 + 1, 'little', signed=True))
+
+
+def _leer_entero(archivo):
+    return int.from_bytes(_leer_bloque(archivo), 'little', signed=True)
+
+
+def guardar_punto_control(ruta, configuracion, traza=None):
+    """
+    Guarda una configuración en un archivo de punto de control.
+
+    Args:
+        ruta: archivo de destino (se reemplaza de forma atómica)
+        configuracion: diccionario con entrada, estado, pasos, max_pasos,
+                       cabezal, desde, simbolos (lista) y cinta (bytes de ids)
+        traza: RegistroTraza opcional a guardar junto con la configuración
+    """
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as archivo:
+        archivo.write(ENCABEZADO.pack(MAGIA, VERSION))
+        for campo in CAMPOS_ENTEROS:
+            _escribir_entero(archivo, configuracion[campo])
+        _escribir_bloque(archivo, configuracion['entrada'].encode('utf-8'))
+        _escribir_bloque(archivo, configuracion['estado'].encode('utf-8'))
+        _escribir_bloque(archivo, '\0'.join(configuracion['simbolos']).encode('utf-8'))
+        _escribir_bloque(archivo, zlib.compress(configuracion['cinta'], 1))
+
+        if traza is None:
+            archivo.write(struct.pack('<qqq', 0, 0, 0))
+        else:
+            archivo.write(struct.pack('<qqq', traza.capacidad, traza.total, traza.siguiente))
+            for campo in CAMPOS_TRAZA:
+                _escribir_bloque(archivo, getattr(traza, campo).tobytes())
+    os.replace(temporal, ruta)
+
+
+def cargar_punto_control(ruta):
+    """
+    Lee un archivo de punto de control.
+
+    Args:
+        ruta: archivo guardado con guardar_punto_control()
+
+    Returns:
+        tupla (configuración, traza): la configuración con las mismas claves
+        que recibe guardar_punto_control(), y el RegistroTraza guardado (o None)
+
+    Raises:
+        ValueError: si el archivo no es un punto de control válido
+    """
+    with open(ruta, 'rb') as archivo:
+        encabezado = archivo.read(ENCABEZADO.size)
+        if len(encabezado) != ENCABEZADO.size:
+            raise ValueError("Punto de control truncado")
+        magia, version = ENCABEZADO.unpack(encabezado)
+        if magia != MAGIA or version != VERSION:
+            raise ValueError(f"'{ruta}' no es un punto de control (versión {VERSION})")
+
+        configuracion = {campo: _leer_entero(archivo) for campo in CAMPOS_ENTEROS}
+        configuracion.update({
+            'entrada': _leer_bloque(archivo).decode('utf-8'),
+            'estado': _leer_bloque(archivo).decode('utf-8'),
+            'simbolos': _leer_bloque(archivo).decode('utf-8').split('\0'),
+            'cinta': zlib.decompress(_leer_bloque(archivo)),
+        })
+
+        capacidad, total, siguiente = struct.unpack('<qqq', archivo.read(24))
+        traza = None
+        if capacidad:
+            traza = RegistroTraza(capacidad)
+            traza.total, traza.siguiente = total, siguiente
+            for campo in CAMPOS_TRAZA:
+                arreglo = array(getattr(traza, campo).typecode)
+                arreglo.frombytes(_leer_bloque(archivo))
+                setattr(traza, campo, arreglo)
+
+    return configuracion, traza
@@ -0,0 +1,241 @@
+"""
+Simulación por Lotes de Muchas Entradas con NumPy
+=================================================
+
+Para validar la máquina con todos los pares de operandos de n bits se crea
+una MaquinaTuring1Cinta por entrada y cada una ejecuta sus pasos en Python:
+el costo lo domina el intérprete, no la máquina. SimuladorLotes ejecuta B
+máquinas con la MISMA tabla compilada en paralelo ("lockstep"):
+
+    cintas      matriz B x ancho de uint8 (ids de símbolo, el blanco es 0)
+    cabezales   vector con el índice del cabezal de cada máquina
+    estados     vector con el id de estado de cada máquina
+    detenidas   vector de bool (llegó a un estado final o no hubo transición)
+
+Cada paso avanza TODAS las máquinas activas con unas pocas operaciones
+vectorizadas: se leen los símbolos bajo los cabezales, se buscan las
+entradas en la tabla compilada (ver tabla_compilada.py) y se aplican
+escritura, movimiento y nuevo estado. Las máquinas que se detienen salen
+del conjunto de activas, así que no cuestan nada en los pasos siguientes.
+
+- Los pasos y el límite max_pasos se cuentan igual que en ejecutar_paso().
+- No hay barridos ni atajos de ciclos: cada paso es un paso de la máquina.
+  Conviene cuando hay miles de entradas cortas; para UNA entrada larga es
+  mejor MaquinaTuring1Cinta.
+- La cinta crece hacia ambos lados (duplicando el ancho) cuando algún
+  cabezal llega al borde.
+"""
+
+import numpy as np
+
+from cinta import dibujar_ids, tablas_texto
+from maquina_turing_suma_binaria_1cinta import MaquinaTuring1Cinta, suma_binaria_tradicional
+from tabla_compilada import (BITS_MOVIMIENTO, DESPLAZAMIENTO_ESTADO, MASCARA_SIMBOLO,
+                             compilar_tabla)
+
+# Celdas blancas que se dejan a cada lado del contenido inicial
+MARGEN_INICIAL = 16
+
+
+class SimuladorLotes:
+    def __init__(self, compilada, contenidos, cabezal=0, max_pasos=10000):
+        """
+        Prepara B máquinas con la misma tabla y distinto contenido inicial.
+
+        Args:
+            compilada: TablaCompilada común a todas las máquinas
+            contenidos: lista de strings con la cinta inicial de cada máquina
+                        (a partir de la posición 0)
+            cabezal: posición inicial del cabezal (la misma para todas)
+            max_pasos: límite de pasos de cada máquina
+
+        Raises:
+            ValueError: si algún contenido tiene símbolos fuera del alfabeto
+        """
+        self.compilada = compilada
+        self.max_pasos = max_pasos
+        self.tabla = np.array(compilada.tabla, dtype=np.int64)
+        self.es_final = np.zeros(len(compilada.estados), dtype=bool)
+        self.es_final[list(compilada.estados_finales)] = True
+        # Traducción id -> texto para dibujar los resultados (ver cinta.py)
+        self._a_texto, self._traduccion = tablas_texto(compilada.simbolos)
+
+        # ====================================================================
+        # CINTAS: una fila por máquina, la posición 0 en la columna "origen"
+        # ====================================================================
+        cantidad = len(contenidos)
+        largo = max([len(c) for c in contenidos] + [cabezal + 1])
+        self.origen = MARGEN_INICIAL
+        self.cintas = np.zeros((cantidad, largo + 2 * MARGEN_INICIAL), dtype=np.uint8)
+        id_simbolo = compilada.id_simbolo
+        for fila, contenido in enumerate(contenidos):
+            if not id_simbolo.keys() >= set(contenido):
+                raise ValueError(f"La entrada '{contenido}' tiene símbolos fuera del alfabeto")
+            ids = bytes([id_simbolo[s] for s in contenido])
+            self.cintas[fila, self.origen:self.origen + len(ids)] = np.frombuffer(ids, dtype=np.uint8)
+
+        self.cabezales = np.full(cantidad, self.origen + cabezal, dtype=np.int64)
+        self.estados = np.full(cantidad, compilada.estado_inicial, dtype=np.int64)
+        self.pasos = np.zeros(cantidad, dtype=np.int64)
+        self.detenidas = np.full(cantidad, self.es_final[compilada.estado_inicial])
+        self.sin_transicion = np.zeros(cantidad, dtype=bool)
+
+    def __len__(self):
+        return len(self.cintas)
+
+    def _crecer(self):
+        """Duplica el ancho de las cintas, agregando blancos a ambos lados"""
+        margen = self.cintas.shape[1] // 2
+        self.cintas = np.pad(self.cintas, ((0, 0), (margen, margen)))
+        self.origen += margen
+        return margen
+
+    def ejecutar(self):
+        """
+        Ejecuta todas las máquinas hasta que se detengan o lleguen a max_pasos.
+
+        Returns:
+            cantidad de pasos de la máquina que más pasos ejecutó
+        """
+        tabla = self.tabla
+        es_final = self.es_final
+        num_simbolos = self.compilada.num_simbolos
+
+        # Copias compactas de las máquinas activas (se reducen al detenerse);
+        # todas las activas llevan los mismos pasos, así que se puede seguir
+        # una ejecución anterior subiendo max_pasos
+        activas = np.flatnonzero(~self.detenidas)
+        estados = self.estados[activas]
+        cabezales = self.cabezales[activas]
+        paso = int(self.pasos[activas[0]]) if len(activas) else 0
+
+        while len(activas) and paso < self.max_pasos:
+            ancho = self.cintas.shape[1]
+            plano = self.cintas.reshape(-1)
+            posiciones = activas * ancho + cabezales
+            entradas = tabla[estados * num_simbolos + plano[posiciones]]
+
+            # Sin transición: la máquina se detiene sin contar el paso
+            faltantes = entradas < 0
+            if faltantes.any():
+                quedan = ~faltantes
+                detenidas = activas[faltantes]
+                self.sin_transicion[detenidas] = True
+                self._detener(detenidas, estados[faltantes], cabezales[faltantes], paso)
+                activas, estados, cabezales = activas[quedan], estados[quedan], cabezales[quedan]
+                posiciones, entradas = posiciones[quedan], entradas[quedan]
+                if not len(activas):
+                    break
+
+            plano[posiciones] = (entradas >> BITS_MOVIMIENTO) & MASCARA_SIMBOLO
+            cabezales = cabezales + (entradas & 3) - 1
+            estados = entradas >> DESPLAZAMIENTO_ESTADO
+            paso += 1
+
+            if cabezales.min() < 0 or cabezales.max() >= ancho:
+                cabezales = cabezales + self._crecer()
+
+            finales = es_final[estados]
+            if finales.any():
+                quedan = ~finales
+                self._detener(activas[finales], estados[finales], cabezales[finales], paso)
+                activas, estados, cabezales = activas[quedan], estados[quedan], cabezales[quedan]
+
+        # Las que agotaron el límite quedan en su configuración actual
+        self.estados[activas] = estados
+        self.cabezales[activas] = cabezales
+        self.pasos[activas] = paso
+        return paso
+
+    def _detener(self, maquinas, estados, cabezales, paso):
+        """Guarda la configuración final de las máquinas que se detienen"""
+        self.detenidas[maquinas] = True
+        self.estados[maquinas] = estados
+        self.cabezales[maquinas] = cabezales
+        self.pasos[maquinas] = paso
+
+    def resultado(self, maquina):
+        """
+        Cinta de una máquina como string (solo la región no blanca, igual
+        que MaquinaTuring1Cinta.obtener_resultado())
+        """
+        fila = self.cintas[maquina]
+        usadas = np.flatnonzero(fila)
+        if not len(usadas):
+            return ''
+        return dibujar_ids(fila[usadas[0]:usadas[-1] + 1].tobytes(), self._a_texto,
+                           self._traduccion)
+
+    def resultados(self):
+        """Lista con el resultado de cada máquina"""
+        return [self.resultado(k) for k in range(len(self))]
+
+    def estado(self, maquina):
+        """Nombre del estado actual de una máquina"""
+        return self.compilada.estados[self.estados[maquina]]
+
+    def cabezal(self, maquina):
+        """Posición lógica del cabezal de una máquina"""
+        return int(self.cabezales[maquina]) - self.origen
+
+
+def simulador_suma_1cinta(entradas, max_pasos=10000, optimizar_tabla=False):
+    """
+    Crea un SimuladorLotes con la tabla de MaquinaTuring1Cinta, con la
+    cinta y el cabezal iniciales de esa máquina (' ' + entrada, cabezal 1).
+
+    Args:
+        entradas: lista de strings 'a+b'
+        max_pasos: límite de pasos de cada máquina
+        optimizar_tabla: si True, se usa la tabla optimizada (ver optimizador.py)
+
+    Returns:
+        SimuladorLotes sin ejecutar
+    """
+    mt = MaquinaTuring1Cinta('', optimizar_tabla=optimizar_tabla)
+    compilada = compilar_tabla(mt.transiciones, 'VERIFICAR_SI_CERO', {'FIN'}, blanco=' ',
+                               simbolos_extra=set(''.join(entradas)))
+    return SimuladorLotes(compilada, [' ' + entrada for entrada in entradas], cabezal=1,
+                          max_pasos=max_pasos)
+
+
+def main():
+    """Ejemplo: todas las sumas de operandos de hasta 6 bits en un lote"""
+    import time
+
+    bits = 6
+    operandos = [format(v, f'0{n}b') for n in range(1, bits + 1) for v in range(1 << n)]
+    entradas = [f"{a}+{b}" for a in operandos for b in operandos]
+
+    print("=" * 70)
+    print(f"SIMULACIÓN POR LOTES: {len(entradas)} sumas (operandos de hasta {bits} bits)")
+    print("=" * 70)
+
+    inicio = time.perf_counter()
+    lote = simulador_suma_1cinta(entradas, max_pasos=100_000)
+    pasos_lote = lote.ejecutar()
+    tiempo_lote = time.perf_counter() - inicio
+
+    errores = 0
+    for k, entrada in enumerate(entradas):
+        a, b = entrada.split('+')
+        limpio = lote.resultado(k).replace(' ', '').replace('+', '').replace('_', '')
+        if lote.estado(k) != 'FIN' or int(limpio, 2) != int(suma_binaria_tradicional(a, b), 2):
+            errores += 1
+    print(f"Lote:        {tiempo_lote:.2f} s, {pasos_lote} pasos en lockstep, "
+          f"{int(lote.pasos.sum())} pasos en total, {errores} errores")
+
+    # Las mismas entradas, una máquina por entrada y paso por paso
+    inicio = time.perf_counter()
+    for entrada in entradas:
+        mt = MaquinaTuring1Cinta(entrada)
+        mt.max_pasos = 100_000
+        mt.acelerar_ciclos = False
+        mt.detectar_ciclos = False
+        mt.ejecutar(verbose=False)
+    tiempo_individual = time.perf_counter() - inicio
+    print(f"Individual:  {tiempo_individual:.2f} s ({tiempo_individual / tiempo_lote:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
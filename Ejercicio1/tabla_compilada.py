@@ -0,0 +1,197 @@
+"""
+Tabla de Transiciones Compilada para Máquinas de Turing
+=======================================================
+
+La tabla "humana" de las máquinas es un diccionario anidado:
+
+    {estado: {símbolo: (nuevo_estado, nuevo_símbolo, dirección)}}
+
+y ejecutar un paso requiere dos búsquedas en diccionarios con claves string
+más comparar strings para la dirección. Como la simulación repite eso en
+CADA paso, se compila la tabla a enteros:
+
+1. Estados y símbolos se numeran con enteros chicos (el blanco es el símbolo 0).
+2. La tabla se aplana en una única lista indexada por
+
+       estado * |alfabeto| + símbolo
+
+3. Cada entrada empaqueta (nuevo_estado, símbolo_a_escribir, movimiento) en
+   un solo entero, o vale SIN_TRANSICION (-1) si no hay transición:
+
+       entrada = (nuevo_estado << 10) | (símbolo << 2) | (movimiento + 1)
+
+   con movimiento -1 (izquierda), 0 (quieto) o +1 (derecha).
+
+Un paso compilado es entonces: un índice en la lista y tres operaciones de bits.
+
+*** BARRIDOS ***
+================================================================================
+Un "barrido" es una transición que deja el estado y el símbolo iguales y mueve
+el cabezal (por ejemplo, BUSCAR_DER_SUMAR1 avanzando sobre 0s y 1s). Mientras
+el símbolo bajo el cabezal sea uno de esos, la máquina solo se desplaza, así
+que todo el tramo se puede ejecutar de un salto: se busca la primera celda
+con un símbolo de "parada" y se suman tantos pasos como celdas recorridas.
+analizar_barridos() detecta esos estados en la tabla compilada.
+================================================================================
+"""
+
+SIN_TRANSICION = -1
+
+BITS_MOVIMIENTO = 2
+BITS_SIMBOLO = 8
+MASCARA_SIMBOLO = (1 << BITS_SIMBOLO) - 1
+DESPLAZAMIENTO_ESTADO = BITS_MOVIMIENTO + BITS_SIMBOLO
+
+# Direcciones aceptadas: las de la tabla Python (L/R) y las del simulador (</>/-)
+MOVIMIENTOS = {'L': -1, '<': -1, 'R': 1, '>': 1, 'S': 0, '-': 0}
+
+
+def empaquetar(nuevo_estado, simbolo, movimiento):
+    """Empaqueta una transición en un único entero"""
+    return (nuevo_estado << DESPLAZAMIENTO_ESTADO) | (simbolo << BITS_MOVIMIENTO) | (movimiento + 1)
+
+
+def desempaquetar(entrada):
+    """
+    Desempaqueta una entrada de la tabla.
+
+    Returns:
+        tupla (nuevo_estado, simbolo, movimiento)
+    """
+    return (entrada >> DESPLAZAMIENTO_ESTADO,
+            (entrada >> BITS_MOVIMIENTO) & MASCARA_SIMBOLO,
+            (entrada & 3) - 1)
+
+
+class TablaCompilada:
+    def __init__(self, estados, simbolos, tabla, estado_inicial, estados_finales):
+        """
+        Tabla de transiciones ya compilada a enteros.
+
+        Args:
+            estados: lista de nombres de estado (el índice es el id)
+            simbolos: lista de símbolos (el índice es el id; el 0 es el blanco)
+            tabla: lista plana de entradas empaquetadas
+            estado_inicial: id del estado inicial
+            estados_finales: conjunto de ids de estados finales
+        """
+        self.estados = estados
+        self.simbolos = simbolos
+        self.tabla = tabla
+        self.estado_inicial = estado_inicial
+        self.estados_finales = estados_finales
+        self.num_simbolos = len(simbolos)
+        self.id_estado = {nombre: k for k, nombre in enumerate(estados)}
+        self.id_simbolo = {simbolo: k for k, simbolo in enumerate(simbolos)}
+
+    def transicion(self, estado, simbolo):
+        """
+        Devuelve la entrada empaquetada para (estado, símbolo) en ids.
+
+        Returns:
+            entero empaquetado o SIN_TRANSICION
+        """
+        return self.tabla[estado * self.num_simbolos + simbolo]
+
+    def codificar(self, texto):
+        """Convierte un string de símbolos a la lista de ids correspondiente"""
+        return [self.id_simbolo[s] for s in texto]
+
+    def decodificar(self, ids):
+        """Convierte una secuencia de ids de símbolo al string correspondiente"""
+        simbolos = self.simbolos
+        return ''.join(simbolos[s] for s in ids)
+
+
+def compilar_tabla(transiciones, estado_inicial, estados_finales, blanco=' ', simbolos_extra=()):
+    """
+    Compila una tabla {estado: {símbolo: (nuevo_estado, nuevo_símbolo, dirección)}}.
+
+    Args:
+        transiciones: tabla en formato diccionario anidado
+        estado_inicial: nombre del estado inicial
+        estados_finales: nombres de los estados finales
+        blanco: símbolo blanco de la cinta (recibe el id 0)
+        simbolos_extra: símbolos que pueden aparecer en la cinta aunque no
+                        figuren en la tabla (por ejemplo, los de la entrada)
+
+    Returns:
+        TablaCompilada
+    """
+    # ========================================================================
+    # PASO 1: NUMERAR ESTADOS Y SÍMBOLOS
+    # ========================================================================
+    estados = list(transiciones)
+    for trans in transiciones.values():
+        for nuevo_estado, _, _ in trans.values():
+            if nuevo_estado not in estados:
+                estados.append(nuevo_estado)
+    for nombre in [estado_inicial, *estados_finales]:
+        if nombre not in estados:
+            estados.append(nombre)
+
+    simbolos = [blanco]
+    for trans in transiciones.values():
+        for simbolo, (_, nuevo_simbolo, _) in trans.items():
+            for s in (simbolo, nuevo_simbolo):
+                if s not in simbolos:
+                    simbolos.append(s)
+    for s in simbolos_extra:
+        if s not in simbolos:
+            simbolos.append(s)
+
+    if len(simbolos) > MASCARA_SIMBOLO + 1:
+        raise ValueError(f"El alfabeto tiene {len(simbolos)} símbolos (máximo {MASCARA_SIMBOLO + 1})")
+
+    id_estado = {nombre: k for k, nombre in enumerate(estados)}
+    id_simbolo = {s: k for k, s in enumerate(simbolos)}
+
+    # ========================================================================
+    # PASO 2: APLANAR LA TABLA (estado * |alfabeto| + símbolo)
+    # ========================================================================
+    num_simbolos = len(simbolos)
+    tabla = [SIN_TRANSICION] * (len(estados) * num_simbolos)
+    for estado, trans in transiciones.items():
+        for simbolo, (nuevo_estado, nuevo_simbolo, direccion) in trans.items():
+            tabla[id_estado[estado] * num_simbolos + id_simbolo[simbolo]] = empaquetar(
+                id_estado[nuevo_estado], id_simbolo[nuevo_simbolo], MOVIMIENTOS[direccion])
+
+    return TablaCompilada(estados, simbolos, tabla, id_estado[estado_inicial],
+                          {id_estado[nombre] for nombre in estados_finales})
+
+
+def analizar_barridos(compilada):
+    """
+    Detecta los estados con transiciones de barrido (ver *** BARRIDOS ***).
+
+    Un estado barre si todas sus transiciones que no cambian ni el estado ni
+    el símbolo mueven el cabezal en la misma dirección. Sus símbolos de
+    parada son todos los demás (incluidos los que no tienen transición).
+
+    Args:
+        compilada: TablaCompilada
+
+    Returns:
+        lista indexada por id de estado con None (no barre) o
+        (movimiento, paradas), donde paradas es una tupla de bytes de 1 byte
+        con los ids de los símbolos de parada (listos para bytearray.find)
+    """
+    num_simbolos = compilada.num_simbolos
+    barridos = []
+    for estado in range(len(compilada.estados)):
+        movimientos = set()
+        paradas = []
+        for simbolo in range(num_simbolos):
+            entrada = compilada.transicion(estado, simbolo)
+            if entrada != SIN_TRANSICION:
+                nuevo_estado, nuevo_simbolo, movimiento = desempaquetar(entrada)
+                if nuevo_estado == estado and nuevo_simbolo == simbolo and movimiento != 0:
+                    movimientos.add(movimiento)
+                    continue
+            paradas.append(bytes([simbolo]))
+
+        if len(movimientos) == 1 and paradas:
+            barridos.append((movimientos.pop(), tuple(paradas)))
+        else:
+            barridos.append(None)
+    return barridos
@@ -0,0 +1,130 @@
+"""
+Registro de Traza en Buffer Circular
+====================================
+
+Para depurar una ejecución interesa ver los últimos pasos, no todos: guardar
+cada paso como strings (o dibujar la cinta en cada paso) cuesta más que
+ejecutar la máquina. RegistroTraza guarda un registro compacto por paso en
+arrays de tamaño fijo (buffer circular: al llenarse, se pisan los más viejos):
+
+    (paso, estado, cabezal, leído, escrito)
+
+- paso: número de paso (1 = primer paso)
+- estado: id del estado en el que se ejecutó el paso
+- cabezal: posición del cabezal ANTES de moverse (donde se escribió)
+- leído / escrito: ids de los símbolos leído y escrito en esa celda
+
+La cinta de cada paso NO se guarda: instantaneas() la reconstruye a pedido,
+partiendo de la cinta actual y deshaciendo las escrituras hacia atrás
+(en cada registro, la celda "cabezal" vuelve a tener el símbolo "leído").
+"""
+
+from array import array
+
+
+class RegistroTraza:
+    def __init__(self, capacidad=1024):
+        """
+        Crea un registro vacío.
+
+        Args:
+            capacidad: cantidad de pasos que se conservan (los últimos)
+        """
+        self.capacidad = capacidad
+        self.pasos = array('q', bytes(8 * capacidad))
+        self.estados = array('i', bytes(4 * capacidad))
+        self.cabezales = array('q', bytes(8 * capacidad))
+        self.leidos = array('B', bytes(capacidad))
+        self.escritos = array('B', bytes(capacidad))
+        self.siguiente = 0          # Índice donde se escribe el próximo registro
+        self.total = 0              # Registros recibidos (incluye los pisados)
+
+    def registrar(self, paso, estado, cabezal, leido, escrito):
+        """Agrega un registro, pisando el más viejo si el buffer está lleno"""
+        i = self.siguiente
+        self.pasos[i] = paso
+        self.estados[i] = estado
+        self.cabezales[i] = cabezal
+        self.leidos[i] = leido
+        self.escritos[i] = escrito
+        self.siguiente = i + 1 if i + 1 < self.capacidad else 0
+        self.total += 1
+
+    def __len__(self):
+        return min(self.total, self.capacidad)
+
+    def vaciar(self):
+        """Descarta todos los registros"""
+        self.siguiente = 0
+        self.total = 0
+
+    def registros(self, n=None):
+        """
+        Devuelve los últimos n registros, del más viejo al más nuevo.
+
+        Args:
+            n: cantidad de registros (None = todos los conservados)
+
+        Returns:
+            lista de tuplas (paso, estado, cabezal, leido, escrito)
+        """
+        cantidad = len(self) if n is None else min(n, len(self))
+        inicio = (self.siguiente - cantidad) % self.capacidad
+        resultado = []
+        for j in range(cantidad):
+            i = (inicio + j) % self.capacidad
+            resultado.append((self.pasos[i], self.estados[i], self.cabezales[i],
+                              self.leidos[i], self.escritos[i]))
+        return resultado
+
+    def instantaneas(self, cinta, estado_actual, cabezal_actual, n=None):
+        """
+        Reconstruye la configuración luego de cada uno de los últimos n pasos.
+
+        La cinta se dibuja solo para los pasos pedidos, deshaciendo escrituras
+        sobre una copia de la región usada de la cinta actual.
+
+        Args:
+            cinta: Cinta en su estado actual (luego del último registro)
+            estado_actual: id del estado actual de la máquina
+            cabezal_actual: posición actual del cabezal
+            n: cantidad de pasos (None = todos los conservados)
+
+        Returns:
+            lista, del paso más viejo al más nuevo, de tuplas
+            (registro, estado_despues, cabezal_despues, texto_de_la_cinta_despues)
+        """
+        registros = self.registros(n)
+        if not registros:
+            return []
+
+        # Región que cubre la cinta usada y todas las celdas escritas
+        posiciones = [r[2] for r in registros]
+        desde = min(posiciones + ([cinta.minimo] if cinta.minimo is not None else []))
+        hasta = max(posiciones + ([cinta.maximo] if cinta.maximo is not None else []))
+        ids = bytearray(cinta.ids(desde, hasta))
+
+        resultado = []
+        estado_despues, cabezal_despues = estado_actual, cabezal_actual
+        for registro in reversed(registros):
+            resultado.append((registro, estado_despues, cabezal_despues, cinta.traducir(ids)))
+            _, estado, cabezal, leido, _ = registro
+            ids[cabezal - desde] = leido            # Deshacer la escritura
+            estado_despues, cabezal_despues = estado, cabezal
+        resultado.reverse()
+        return resultado
+
+    def exportar(self, archivo, estados, simbolos, n=None):
+        """
+        Escribe los últimos n registros como texto (una línea por paso).
+
+        Args:
+            archivo: archivo abierto en modo texto
+            estados: lista de nombres de estado (el índice es el id)
+            simbolos: lista de símbolos (el índice es el id)
+            n: cantidad de registros (None = todos los conservados)
+        """
+        archivo.write("paso,estado,cabezal,leido,escrito\n")
+        for paso, estado, cabezal, leido, escrito in self.registros(n):
+            archivo.write(f"{paso},{estados[estado]},{cabezal},"
+                          f"{simbolos[leido]!r},{simbolos[escrito]!r}\n")
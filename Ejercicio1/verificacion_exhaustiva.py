@@ -0,0 +1,208 @@
+"""
+Verificación Exhaustiva de las Dos Máquinas de Suma
+===================================================
+
+main() de cada máquina prueba cinco casos elegidos a mano. Este módulo prueba
+TODOS los pares de operandos de 1 a "bits" dígitos (incluidos los que tienen
+ceros a la izquierda) con las dos máquinas, y compara cada resultado con
+suma_binaria_tradicional() y las dos máquinas entre sí.
+
+- El espacio de entradas se divide en tareas (un rango de valores del primer
+  operando para un par de largos) que se reparten en un pool de procesos.
+- La máquina de 1 cinta ejecuta cada tarea como un lote (ver
+  simulacion_lotes.py), paso por paso y sin atajos; la de 3 cintas ejecuta
+  cada entrada con su motor de k cintas.
+- max_pasos se calcula según "bits" (ver max_pasos_1cinta() y
+  max_pasos_3cintas()); una máquina que no termina cuenta como error.
+
+*** CONTRAEJEMPLO MÍNIMO ***
+================================================================================
+Las entradas se ordenan por (largo total, largo de a, a, b) y las tareas se
+entregan en ese orden (Pool.imap). Cada tarea se detiene en su primer error,
+y el primer error que se recibe corta la verificación: todas las tareas
+anteriores ya pasaron, así que ninguna entrada menor falla.
+================================================================================
+
+Uso:
+    python verificacion_exhaustiva.py --bits 6
+"""
+
+import argparse
+import time
+from multiprocessing import Pool
+
+from maquina_turing_suma_binaria_1cinta import suma_binaria_tradicional
+from maquina_turing_suma_binaria_3cintas import MaquinaTuringSumaBinaria
+from simulacion_lotes import simulador_suma_1cinta
+
+# Entradas (como máximo) por tarea
+ENTRADAS_POR_TAREA = 4096
+
+
+def max_pasos_1cinta(bits):
+    """
+    Límite de pasos de la máquina de 1 cinta para operandos de hasta "bits"
+    dígitos. La máquina repite hasta 2^bits veces un ciclo de O(bits) pasos;
+    el peor caso medido (hasta 8 bits) usa dos tercios de este límite.
+    """
+    return (1 << bits) * (8 * bits + 32)
+
+
+def max_pasos_3cintas(bits):
+    """
+    Límite de pasos de la máquina de 3 cintas: hace una pasada de copia y una
+    de suma (4 * bits + 5 pasos en el peor caso), con el doble de margen.
+    """
+    return 8 * bits + 16
+
+
+def _normalizar(resultado):
+    """Deja solo los dígitos del resultado, sin ceros a la izquierda"""
+    limpio = resultado.replace(' ', '').replace('+', '').replace('_', '')
+    if not limpio or limpio.strip('01'):
+        return limpio
+    return limpio.lstrip('0') or '0'
+
+
+def _tareas(bits, entradas_por_tarea):
+    """Genera las tareas (largo_a, largo_b, desde, hasta) en el orden de las entradas"""
+    largos = sorted(((largo_a, largo_b) for largo_a in range(1, bits + 1)
+                     for largo_b in range(1, bits + 1)),
+                    key=lambda largos: (sum(largos), largos[0]))
+    for largo_a, largo_b in largos:
+        paso = max(1, entradas_por_tarea >> largo_b)
+        for desde in range(0, 1 << largo_a, paso):
+            yield largo_a, largo_b, desde, min(desde + paso, 1 << largo_a)
+
+
+def _verificar_tarea(tarea):
+    """
+    Verifica las entradas de una tarea (se ejecuta en un proceso trabajador).
+
+    Args:
+        tarea: tupla (largo_a, largo_b, desde, hasta, max_pasos_1, max_pasos_3),
+               con [desde, hasta) el rango de valores del primer operando
+
+    Returns:
+        diccionario con largo, entradas verificadas, pasos (suma y máximo de
+        cada máquina), tiempo y contraejemplo (None si no hubo errores)
+    """
+    largo_a, largo_b, desde, hasta, max_pasos_1, max_pasos_3 = tarea
+    operandos_b = [format(valor, f'0{largo_b}b') for valor in range(1 << largo_b)]
+    pares = [(format(valor, f'0{largo_a}b'), b) for valor in range(desde, hasta)
+             for b in operandos_b]
+
+    inicio = time.perf_counter()
+    lote = simulador_suma_1cinta([f"{a}+{b}" for a, b in pares], max_pasos=max_pasos_1)
+    lote.ejecutar()
+    mt = MaquinaTuringSumaBinaria()
+
+    resumen = {'largo': largo_a + largo_b, 'entradas': 0, 'pasos_1': 0, 'maximo_1': 0,
+               'pasos_3': 0, 'maximo_3': 0, 'contraejemplo': None}
+    for k, (a, b) in enumerate(pares):
+        esperado = suma_binaria_tradicional(a, b)
+        resultado_1 = _normalizar(lote.resultado(k)) if lote.estado(k) == 'FIN' else None
+        mt.cargar_entrada(f"{a}+{b}")
+        termino = mt.motor.ejecutar(max_pasos_3)
+        resultado_3 = _normalizar(mt.obtener_resultado()) if termino else None
+
+        pasos_1, pasos_3 = int(lote.pasos[k]), mt.motor.pasos
+        resumen['entradas'] += 1
+        resumen['pasos_1'] += pasos_1
+        resumen['pasos_3'] += pasos_3
+        resumen['maximo_1'] = max(resumen['maximo_1'], pasos_1)
+        resumen['maximo_3'] = max(resumen['maximo_3'], pasos_3)
+
+        if resultado_1 != esperado or resultado_3 != esperado:
+            resumen['contraejemplo'] = {'entrada': f"{a}+{b}", 'esperado': esperado,
+                                        'resultado_1': resultado_1, 'pasos_1': pasos_1,
+                                        'resultado_3': resultado_3, 'pasos_3': pasos_3}
+            break
+
+    resumen['tiempo'] = time.perf_counter() - inicio
+    return resumen
+
+
+def verificar_sumas(bits, procesos=None, entradas_por_tarea=ENTRADAS_POR_TAREA):
+    """
+    Verifica las dos máquinas con todos los pares de operandos de hasta "bits" dígitos.
+
+    Args:
+        bits: cantidad máxima de dígitos de cada operando
+        procesos: cantidad de procesos (None = cantidad de CPUs)
+        entradas_por_tarea: entradas (como máximo) por tarea
+
+    Returns:
+        diccionario con entradas verificadas, tiempo total, max_pasos de cada
+        máquina, pasos por largo total de la entrada ({largo: [entradas,
+        pasos_1, maximo_1, pasos_3, maximo_3]}) y el contraejemplo mínimo
+        (None si todas las entradas dieron bien)
+    """
+    max_pasos_1, max_pasos_3 = max_pasos_1cinta(bits), max_pasos_3cintas(bits)
+    tareas = [(*tarea, max_pasos_1, max_pasos_3) for tarea in _tareas(bits, entradas_por_tarea)]
+    informe = {'bits': bits, 'entradas': 0, 'max_pasos_1': max_pasos_1,
+               'max_pasos_3': max_pasos_3, 'por_largo': {}, 'contraejemplo': None}
+
+    inicio = time.perf_counter()
+    with Pool(procesos) as pool:
+        # imap entrega los resultados en el orden de las tareas
+        for resumen in pool.imap(_verificar_tarea, tareas):
+            informe['entradas'] += resumen['entradas']
+            fila = informe['por_largo'].setdefault(resumen['largo'], [0, 0, 0, 0, 0])
+            fila[0] += resumen['entradas']
+            fila[1] += resumen['pasos_1']
+            fila[2] = max(fila[2], resumen['maximo_1'])
+            fila[3] += resumen['pasos_3']
+            fila[4] = max(fila[4], resumen['maximo_3'])
+            if resumen['contraejemplo'] is not None:
+                informe['contraejemplo'] = resumen['contraejemplo']
+                pool.terminate()
+                break
+    informe['tiempo'] = time.perf_counter() - inicio
+    return informe
+
+
+def imprimir_informe(informe):
+    """Imprime el informe de verificar_sumas()"""
+    print(f"max_pasos: {informe['max_pasos_1']} (1 cinta), {informe['max_pasos_3']} (3 cintas)")
+    print(f"{'Largo a+b':>9} {'Entradas':>9} {'Prom. 1c':>10} {'Máx. 1c':>9} "
+          f"{'Prom. 3c':>9} {'Máx. 3c':>8}")
+    for largo, (entradas, pasos_1, maximo_1, pasos_3, maximo_3) in sorted(
+            informe['por_largo'].items()):
+        print(f"{largo:>9} {entradas:>9} {pasos_1 / entradas:>10.1f} {maximo_1:>9} "
+              f"{pasos_3 / entradas:>9.1f} {maximo_3:>8}")
+
+    pasos = sum(fila[1] + fila[3] for fila in informe['por_largo'].values())
+    tiempo = informe['tiempo']
+    print(f"\n{informe['entradas']} entradas en {tiempo:.2f} s "
+          f"({informe['entradas'] / tiempo if tiempo else 0:,.0f} entradas/s, "
+          f"{pasos / tiempo if tiempo else 0:,.0f} pasos/s)")
+
+    contraejemplo = informe['contraejemplo']
+    if contraejemplo is None:
+        print(f"✓ Las dos máquinas suman bien todos los operandos de hasta {informe['bits']} bits")
+    else:
+        print(f"✗ Contraejemplo mínimo: {contraejemplo['entrada']} "
+              f"(esperado {contraejemplo['esperado']})")
+        print(f"  1 cinta:  {contraejemplo['resultado_1']} en {contraejemplo['pasos_1']} pasos")
+        print(f"  3 cintas: {contraejemplo['resultado_3']} en {contraejemplo['pasos_3']} pasos")
+        print("  (None = no llegó a FIN dentro de max_pasos)")
+
+
+def main():
+    """Función principal: verifica las dos máquinas desde la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Verificación exhaustiva de las máquinas de suma")
+    parser.add_argument("--bits", type=int, default=6, help="dígitos máximos de cada operando")
+    parser.add_argument("--procesos", type=int, help="cantidad de procesos (por defecto, CPUs)")
+    parser.add_argument("--entradas-por-tarea", type=int, default=ENTRADAS_POR_TAREA,
+                        help="entradas (como máximo) por tarea")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"VERIFICACIÓN EXHAUSTIVA: operandos de hasta {args.bits} bits")
+    print("=" * 70)
+    imprimir_informe(verificar_sumas(args.bits, args.procesos, args.entradas_por_tarea))
+
+
+if __name__ == "__main__":
+    main()
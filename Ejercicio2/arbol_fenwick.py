@@ -0,0 +1,85 @@
+"""
+Árbol de Fenwick (Binary Indexed Tree)
+======================================
+
+Estructura auxiliar para los conteos incrementales de inversiones.
+
+Mantiene frecuencias sobre rangos comprimidos 1..m y permite:
+- sumar(k, delta): agregar delta a la frecuencia del rango k  -> O(log m)
+- prefijo(k): cantidad de elementos con rango <= k            -> O(log m)
+
+Si los elementos se insertan de izquierda a derecha, la cantidad de elementos
+ya insertados MAYORES que x es (total - prefijo(rango(x))), que es justamente
+la cantidad de inversiones que x forma con los elementos anteriores.
+
+Complejidad:
+- Tiempo: O(log m) por operación
+- Espacio: O(m)
+"""
+
+
+class ArbolFenwick:
+    def __init__(self, tamano):
+        """
+        Inicializa un árbol de Fenwick vacío.
+
+        Args:
+            tamano: cantidad de rangos distintos (los rangos válidos son 1..tamano)
+        """
+        self.tamano = tamano
+        self.arbol = [0] * (tamano + 1)   # Índice 0 sin uso (el árbol es 1-indexado)
+        self.total = 0                    # Cantidad de elementos insertados
+
+    def sumar(self, rango, delta=1):
+        """
+        Suma delta a la frecuencia del rango indicado.
+
+        Args:
+            rango: rango comprimido (1..tamano)
+            delta: +1 para insertar, -1 para quitar
+        """
+        self.total += delta
+        arbol = self.arbol
+        tamano = self.tamano
+        while rango <= tamano:
+            arbol[rango] += delta
+            rango += rango & (-rango)     # Siguiente nodo responsable del rango
+
+    def prefijo(self, rango):
+        """
+        Cuenta los elementos con rango menor o igual al indicado.
+
+        Args:
+            rango: rango comprimido (0..tamano)
+
+        Returns:
+            cantidad de elementos con rango <= rango
+        """
+        arbol = self.arbol
+        suma = 0
+        while rango > 0:
+            suma += arbol[rango]
+            rango -= rango & (-rango)     # Quitar el bit menos significativo
+        return suma
+
+    def mayores_que(self, rango):
+        """Cuenta los elementos insertados con rango estrictamente mayor"""
+        return self.total - self.prefijo(rango)
+
+
+def comprimir_rangos(valores):
+    """
+    Asigna a cada valor su rango denso (1..m) respetando el orden.
+
+    Valores iguales reciben el mismo rango, de modo que las comparaciones
+    estrictas (A[i] > A[j]) se preservan.
+
+    Args:
+        valores: secuencia de valores comparables
+
+    Returns:
+        tupla (rangos, m) con la lista de rangos y la cantidad de rangos distintos
+    """
+    distintos = sorted(set(valores))
+    rango_de = {valor: k for k, valor in enumerate(distintos, 1)}
+    return [rango_de[valor] for valor in valores], len(distintos)
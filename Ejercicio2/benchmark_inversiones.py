@@ -0,0 +1,295 @@
+"""
+Benchmark de los Motores de Conteo de Inversiones
+=================================================
+
+CASOS_DE_PRUEBA solo tiene arrays de longitud 10, que no dicen nada sobre
+cómo escala contar_inversiones(). Este módulo mide cada motor disponible
+sobre entradas reproducibles de 10^3 a 10^7 elementos:
+
+- Generadores (con semilla fija): ordenado, inverso, aleatorio,
+  casi_ordenado y muchos_duplicados.
+- Por cada (motor, tipo, n): mejor tiempo de varias repeticiones y pico de
+  memoria (tracemalloc, en una corrida aparte para no distorsionar el tiempo).
+- Exponente de crecimiento empírico: pendiente de la recta de mínimos
+  cuadrados de log(tiempo) vs log(n). Para O(n log n) se espera algo
+  levemente mayor que 1; un valor cercano a 2 indica un comportamiento O(n²).
+- Resultados en JSON, comparables contra una línea base guardada para
+  detectar regresiones de rendimiento.
+
+Uso:
+    python benchmark_inversiones.py --salida resultados.json
+    python benchmark_inversiones.py --base resultados.json --tolerancia 0.25
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from conteo_inversiones import contar_inversiones
+from conteo_inversiones_numpy import contar_inversiones_numpy
+
+
+# ============================================================================
+# GENERADORES DE ENTRADAS REPRODUCIBLES
+# ============================================================================
+def _ordenado(n, generador):
+    return np.arange(n, dtype=np.int64)
+
+
+def _inverso(n, generador):
+    return np.arange(n, 0, -1, dtype=np.int64)
+
+
+def _aleatorio(n, generador):
+    return generador.permutation(n).astype(np.int64)
+
+
+def _casi_ordenado(n, generador):
+    # Ordenado con ~1% de posiciones intercambiadas con su vecina
+    arr = np.arange(n, dtype=np.int64)
+    if n > 1:
+        posiciones = generador.integers(0, n - 1, size=max(1, n // 100))
+        for p in posiciones:
+            arr[p], arr[p + 1] = arr[p + 1], arr[p]
+    return arr
+
+
+def _muchos_duplicados(n, generador):
+    # Solo 10 valores distintos
+    return generador.integers(0, 10, size=n, dtype=np.int64)
+
+
+GENERADORES = {
+    "ordenado": _ordenado,
+    "inverso": _inverso,
+    "aleatorio": _aleatorio,
+    "casi_ordenado": _casi_ordenado,
+    "muchos_duplicados": _muchos_duplicados,
+}
+
+
+def generar_entrada(tipo, n, semilla=0):
+    """
+    Genera una entrada reproducible del tipo indicado.
+
+    Args:
+        tipo: clave de GENERADORES
+        n: cantidad de elementos
+        semilla: semilla del generador aleatorio
+
+    Returns:
+        array int64 de longitud n
+    """
+    return GENERADORES[tipo](n, np.random.default_rng(semilla))
+
+
+# ============================================================================
+# MOTORES A MEDIR
+# ============================================================================
+# Cada motor: (preparar la entrada, contar, n máximo razonable)
+# La preparación (por ejemplo, convertir a lista) no se incluye en el tiempo.
+MOTORES = {
+    "recursivo": (lambda arr: arr.tolist(),
+                  lambda entrada: contar_inversiones(entrada)[1],
+                  10 ** 6),
+    "numpy": (lambda arr: arr,
+              lambda entrada: contar_inversiones_numpy(entrada, devolver_ordenado=False)[1],
+              None),
+}
+
+
+def medir(motor, tipo, n, repeticiones=3, semilla=0):
+    """
+    Mide un motor sobre una entrada.
+
+    Args:
+        motor: clave de MOTORES
+        tipo: clave de GENERADORES
+        n: cantidad de elementos
+        repeticiones: se informa el mejor tiempo de estas repeticiones
+        semilla: semilla del generador de la entrada
+
+    Returns:
+        diccionario con motor, tipo, n, segundos, memoria_pico_bytes e inversiones
+    """
+    preparar, contar, _ = MOTORES[motor]
+    entrada = preparar(generar_entrada(tipo, n, semilla))
+
+    mejor = math.inf
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        inversiones = contar(entrada)
+        mejor = min(mejor, time.perf_counter() - inicio)
+
+    # Pico de memoria en una corrida aparte (tracemalloc hace lento al código)
+    tracemalloc.start()
+    contar(entrada)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "motor": motor,
+        "tipo": tipo,
+        "n": n,
+        "segundos": mejor,
+        "memoria_pico_bytes": pico,
+        "inversiones": int(inversiones),
+    }
+
+
+def ajustar_exponente(tamanos, tiempos):
+    """
+    Ajusta tiempo ≈ c · n^k por mínimos cuadrados en escala log-log.
+
+    Args:
+        tamanos: lista de n
+        tiempos: lista de segundos (mismo largo)
+
+    Returns:
+        exponente k, o None si hay menos de dos puntos válidos
+    """
+    puntos = [(math.log(n), math.log(t)) for n, t in zip(tamanos, tiempos) if t > 0]
+    if len(puntos) < 2:
+        return None
+    media_x = sum(x for x, _ in puntos) / len(puntos)
+    media_y = sum(y for _, y in puntos) / len(puntos)
+    covarianza = sum((x - media_x) * (y - media_y) for x, y in puntos)
+    varianza = sum((x - media_x) ** 2 for x, _ in puntos)
+    return covarianza / varianza if varianza else None
+
+
+def ejecutar_benchmark(motores=None, tipos=None, exponentes=range(3, 8), repeticiones=3, semilla=0):
+    """
+    Ejecuta el benchmark completo.
+
+    Args:
+        motores: lista de claves de MOTORES (None = todos)
+        tipos: lista de claves de GENERADORES (None = todos)
+        exponentes: tamaños como potencias de 10 (3..7 = 10^3..10^7)
+        repeticiones: repeticiones por medición
+        semilla: semilla de las entradas
+
+    Returns:
+        diccionario serializable a JSON con metadatos, resultados y exponentes
+    """
+    motores = motores or list(MOTORES)
+    tipos = tipos or list(GENERADORES)
+
+    resultados = []
+    crecimiento = {}
+    for motor in motores:
+        n_maximo = MOTORES[motor][2]
+        crecimiento[motor] = {}
+        for tipo in tipos:
+            mediciones = []
+            for e in exponentes:
+                n = 10 ** e
+                if n_maximo is not None and n > n_maximo:
+                    continue
+                medicion = medir(motor, tipo, n, repeticiones, semilla)
+                print(f"  {motor:<10} {tipo:<18} n=10^{e}: {medicion['segundos']:.4f} s, "
+                      f"pico={medicion['memoria_pico_bytes'] / 2**20:.1f} MiB")
+                mediciones.append(medicion)
+            resultados.extend(mediciones)
+            crecimiento[motor][tipo] = ajustar_exponente([m["n"] for m in mediciones],
+                                                         [m["segundos"] for m in mediciones])
+
+    return {
+        "metadatos": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "repeticiones": repeticiones,
+            "semilla": semilla,
+        },
+        "resultados": resultados,
+        "exponentes": crecimiento,
+    }
+
+
+def comparar_con_base(actual, base, tolerancia=0.25, minimo_segundos=0.01):
+    """
+    Compara resultados contra una línea base guardada.
+
+    Una medición es regresión si es más lenta que la base en más de la
+    tolerancia relativa, o si el número de inversiones no coincide.
+    Las mediciones muy cortas (ruido del reloj) no se comparan en tiempo.
+
+    Args:
+        actual: resultado de ejecutar_benchmark()
+        base: resultado guardado previamente (mismo formato)
+        tolerancia: aumento relativo de tiempo permitido (0.25 = 25%)
+        minimo_segundos: tiempos de base menores a esto no se comparan
+
+    Returns:
+        lista de strings describiendo cada regresión (vacía si no hay)
+    """
+    clave = lambda r: (r["motor"], r["tipo"], r["n"])
+    referencia = {clave(r): r for r in base["resultados"]}
+
+    regresiones = []
+    for r in actual["resultados"]:
+        previo = referencia.get(clave(r))
+        if previo is None:
+            continue
+        if r["inversiones"] != previo["inversiones"]:
+            regresiones.append(f"{clave(r)}: inversiones {r['inversiones']} != {previo['inversiones']}")
+        elif (previo["segundos"] >= minimo_segundos
+              and r["segundos"] > previo["segundos"] * (1 + tolerancia)):
+            regresiones.append(f"{clave(r)}: {r['segundos']:.4f} s vs. base {previo['segundos']:.4f} s "
+                               f"(+{100 * (r['segundos'] / previo['segundos'] - 1):.0f}%)")
+    return regresiones
+
+
+def main():
+    """Función principal: ejecuta el benchmark y opcionalmente compara con una base"""
+    parser = argparse.ArgumentParser(description="Benchmark de conteo de inversiones")
+    parser.add_argument("--motores", nargs="+", choices=list(MOTORES))
+    parser.add_argument("--tipos", nargs="+", choices=list(GENERADORES))
+    parser.add_argument("--exponente-min", type=int, default=3)
+    parser.add_argument("--exponente-max", type=int, default=7)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--base", help="archivo JSON de línea base para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("BENCHMARK: CONTEO DE INVERSIONES")
+    print("=" * 70)
+    resultado = ejecutar_benchmark(args.motores, args.tipos,
+                                   range(args.exponente_min, args.exponente_max + 1),
+                                   args.repeticiones, args.semilla)
+
+    print("\nExponente de crecimiento empírico (tiempo ≈ c · n^k):")
+    for motor, por_tipo in resultado["exponentes"].items():
+        for tipo, k in por_tipo.items():
+            print(f"  {motor:<10} {tipo:<18} k = {k:.2f}" if k is not None
+                  else f"  {motor:<10} {tipo:<18} k = (insuficientes puntos)")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultado, archivo, indent=2)
+        print(f"\n✓ Resultados guardados en '{args.salida}'")
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar_con_base(resultado, base, args.tolerancia)
+        if regresiones:
+            print(f"\n✗ {len(regresiones)} regresiones respecto de '{args.base}':")
+            for regresion in regresiones:
+                print(f"  - {regresion}")
+            sys.exit(1)
+        print(f"\n✓ Sin regresiones respecto de '{args.base}'")
+
+
+if __name__ == "__main__":
+    main()
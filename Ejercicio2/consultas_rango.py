@@ -0,0 +1,227 @@
+"""
+Consultas de Inversiones por Rango sobre un Array Fijo
+======================================================
+
+Problema: responder muchas consultas "¿cuántas inversiones hay en A[l..r]?"
+sobre el MISMO array. Cortar el array y llamar a contar_inversiones() cuesta
+O(k log k) por consulta (k = r - l + 1).
+
+Se preprocesa el array una sola vez y se ofrecen dos modos:
+
+1. OFFLINE (consultar_lote) - Algoritmo de Mo + árbol de Fenwick:
+   Se ordenan las consultas por (bloque de l, r) y se mueve una ventana
+   [l, r] agregando/quitando elementos en los extremos. Cada movimiento
+   actualiza el conteo en O(log n) con el árbol de Fenwick.
+   -> O((n + q) · √n · log n) en total.
+
+2. ONLINE (consultar) - Descomposición en bloques de tamaño B ≈ √n:
+   - inv_bloques[a][b]: inversiones de la unión de los bloques a..b
+   - prefijos[k][v]:     elementos con rango <= v en los primeros k bloques
+   Una consulta = bloques completos (tabla) + elementos sueltos de los bordes
+   (a lo sumo 2B), que se cruzan con los bloques completos usando "prefijos".
+   -> O(√n log n) por consulta.
+
+*** RECURRENCIA PARA LA TABLA DE BLOQUES ***
+================================================================================
+    inv[a][b] = inv[a][b-1] + inv[a+1][b] - inv[a+1][b-1] + cruce(a, b)
+
+Igual que en divide y vencerás: inversiones totales = las de la izquierda
++ las de la derecha + las que cruzan; el término restado es la parte común
+contada dos veces, y cruce(a, b) son los pares (x en bloque a, y en bloque b)
+con x > y.
+================================================================================
+
+Complejidad del preprocesamiento (modo online):
+- Tiempo: O(n √n)
+- Memoria: O(n √n) enteros de 4 bytes (se construye recién en la primera
+  consulta online; el modo offline solo usa O(n))
+"""
+
+import math
+from array import array
+
+from arbol_fenwick import ArbolFenwick, comprimir_rangos
+from conteo_inversiones import contar_inversiones
+
+
+class ConsultasRangoInversiones:
+    def __init__(self, arr, tam_bloque=None):
+        """
+        Preprocesa el array para responder consultas de inversiones por rango.
+
+        Args:
+            arr: array de valores comparables (no se modifica)
+            tam_bloque: tamaño de bloque (None = ⌊√n⌋)
+        """
+        self.n = len(arr)
+        self.rangos, self.m = comprimir_rangos(arr)
+        self.tam_bloque = tam_bloque or max(1, math.isqrt(self.n))
+        self.num_bloques = (self.n + self.tam_bloque - 1) // self.tam_bloque
+
+        # Índice del modo online (se construye en la primera consulta)
+        self.prefijos = None
+        self.inv_bloques = None
+
+    # ========================================================================
+    # MODO OFFLINE: ALGORITMO DE MO
+    # ========================================================================
+    def consultar_lote(self, consultas):
+        """
+        Responde un lote de consultas con el algoritmo de Mo.
+
+        Args:
+            consultas: lista de tuplas (l, r) con 0 <= l <= r < n (inclusivas)
+
+        Returns:
+            lista con las inversiones de cada consulta, en el orden recibido
+        """
+        for l, r in consultas:
+            self._validar(l, r)
+
+        B = self.tam_bloque
+        # Orden de Mo: por bloque de l; r ascendente o descendente alternando
+        # entre bloques para no volver a recorrer todo el array con r
+        orden = sorted(range(len(consultas)),
+                       key=lambda q: (consultas[q][0] // B,
+                                      consultas[q][1] if (consultas[q][0] // B) % 2 == 0
+                                      else -consultas[q][1]))
+
+        rangos = self.rangos
+        arbol = ArbolFenwick(self.m)
+        respuestas = [0] * len(consultas)
+        inversiones = 0
+        actual_l, actual_r = 0, -1          # Ventana vacía
+
+        for q in orden:
+            l, r = consultas[q]
+            # Primero se expande la ventana y después se contrae,
+            # así nunca queda con l > r + 1
+            while actual_l > l:             # Entra un elemento por la izquierda
+                actual_l -= 1
+                inversiones += arbol.prefijo(rangos[actual_l] - 1)
+                arbol.sumar(rangos[actual_l])
+            while actual_r < r:             # Entra un elemento por la derecha
+                actual_r += 1
+                inversiones += arbol.mayores_que(rangos[actual_r])
+                arbol.sumar(rangos[actual_r])
+            while actual_l < l:             # Sale un elemento por la izquierda
+                arbol.sumar(rangos[actual_l], -1)
+                inversiones -= arbol.prefijo(rangos[actual_l] - 1)
+                actual_l += 1
+            while actual_r > r:             # Sale un elemento por la derecha
+                arbol.sumar(rangos[actual_r], -1)
+                inversiones -= arbol.mayores_que(rangos[actual_r])
+                actual_r -= 1
+            respuestas[q] = inversiones
+
+        return respuestas
+
+    # ========================================================================
+    # MODO ONLINE: DESCOMPOSICIÓN EN BLOQUES
+    # ========================================================================
+    def consultar(self, l, r):
+        """
+        Responde una consulta de inversiones en A[l..r] (inclusivo).
+
+        Args:
+            l: índice inicial
+            r: índice final
+
+        Returns:
+            número de inversiones en A[l..r]
+        """
+        self._validar(l, r)
+        if self.inv_bloques is None:
+            self._construir_indice()
+
+        B = self.tam_bloque
+        rangos = self.rangos
+        a = (l + B - 1) // B                # Primer bloque completo
+        b = (r + 1) // B - 1                # Último bloque completo
+        if a > b:
+            # Sin bloques completos: el rango mide menos de 2B
+            return contar_inversiones(rangos[l:r + 1])[1]
+
+        inicio_medio, fin_medio = a * B, (b + 1) * B
+        prefijo_a, prefijo_b = self.prefijos[a], self.prefijos[b + 1]
+        total_medio = prefijo_b[self.m] - prefijo_a[self.m]
+
+        # Inversiones dentro de los bloques completos
+        inversiones = self.inv_bloques[a][b - a]
+
+        # Suelto izquierdo x vs. bloques completos: elementos del medio menores que x
+        izquierda = rangos[l:inicio_medio]
+        for x in izquierda:
+            inversiones += prefijo_b[x - 1] - prefijo_a[x - 1]
+
+        # Bloques completos vs. suelto derecho y: elementos del medio mayores que y
+        derecha = rangos[fin_medio:r + 1]
+        for y in derecha:
+            inversiones += total_medio - (prefijo_b[y] - prefijo_a[y])
+
+        # Sueltos entre sí (izquierda antes que derecha)
+        inversiones += contar_inversiones(izquierda + derecha)[1]
+        return inversiones
+
+    def _construir_indice(self):
+        """Construye las tablas "prefijos" e "inv_bloques" del modo online"""
+        B, m = self.tam_bloque, self.m
+        rangos = self.rangos
+        nb = self.num_bloques
+
+        # prefijos[k][v] = elementos con rango <= v en rangos[0 : k*B]
+        frecuencias = array('i', [0]) * (m + 1)
+        prefijos = [array('i', [0]) * (m + 1)]
+        for k in range(nb):
+            for x in rangos[k * B:(k + 1) * B]:
+                frecuencias[x] += 1
+            acumulado = array('i', frecuencias)
+            for v in range(1, m + 1):
+                acumulado[v] += acumulado[v - 1]
+            prefijos.append(acumulado)
+
+        # inv_bloques[a][b - a] = inversiones de los bloques a..b
+        inv = [[0] * (nb - a) for a in range(nb)]
+        for a in range(nb):
+            inv[a][0] = contar_inversiones(rangos[a * B:(a + 1) * B])[1]
+        for largo in range(1, nb):
+            for a in range(nb - largo):
+                b = a + largo
+                # cruce(a, b): x en el bloque a, elementos menores en el bloque b
+                prefijo_b, siguiente_b = prefijos[b], prefijos[b + 1]
+                cruce = 0
+                for x in rangos[a * B:(a + 1) * B]:
+                    cruce += siguiente_b[x - 1] - prefijo_b[x - 1]
+                interior = inv[a + 1][largo - 2] if largo >= 2 else 0
+                inv[a][largo] = inv[a][largo - 1] + inv[a + 1][largo - 1] - interior + cruce
+
+        self.prefijos = prefijos
+        self.inv_bloques = inv
+
+    def _validar(self, l, r):
+        """Verifica que 0 <= l <= r < n"""
+        if not 0 <= l <= r < self.n:
+            raise IndexError(f"Rango inválido [{l}, {r}] para un array de longitud {self.n}")
+
+
+def main():
+    """Ejemplo: consultas online y offline sobre un array de prueba"""
+    arr = [3, 1, 5, 2, 8, 4, 9, 6, 10, 7]
+    consultas = [(0, 9), (0, 4), (2, 7), (5, 9), (3, 3)]
+
+    print("=" * 70)
+    print("CONSULTAS DE INVERSIONES POR RANGO")
+    print("=" * 70)
+    print(f"array: {arr}")
+
+    motor = ConsultasRangoInversiones(arr)
+    lote = motor.consultar_lote(consultas)
+    for (l, r), offline in zip(consultas, lote):
+        online = motor.consultar(l, r)
+        directo = contar_inversiones(arr[l:r + 1])[1]
+        estado = "CORRECTO" if online == offline == directo else "ERROR"
+        print(f"  - A[{l}..{r}]: online={online}, offline={offline}, directo={directo} -> {estado}")
+
+
+if __name__ == "__main__":
+    main()
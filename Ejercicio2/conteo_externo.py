@@ -0,0 +1,216 @@
+"""
+Conteo de Inversiones en Memoria Externa (archivos más grandes que la RAM)
+==========================================================================
+
+contar_inversiones() necesita toda la entrada como lista de enteros de Python
+(28+ bytes cada uno). Para archivos binarios int32/int64 más grandes que la
+memoria se usa la versión "externa" de Merge Sort:
+
+1. CORRIDAS: se leen bloques de tamaño fijo del archivo (numpy.memmap), se
+   ordenan y cuentan en memoria, y se escriben ordenados en archivos temporales.
+   -> Inversiones dentro de cada corrida.
+
+2. MEZCLA k-VÍAS: se recorren las k corridas ordenadas a la vez, con buffers
+   de lectura de tamaño fijo, y se cuentan las inversiones ENTRE corridas.
+
+*** CONTEO ENTRE CORRIDAS POR LOTES ***
+================================================================================
+Una inversión entre corridas es un par (x en la corrida i, y en la corrida j)
+con i < j y x > y. Usando la clave (valor, corrida) todas las claves de
+corridas distintas son diferentes, y en cada lote:
+
+- Umbral t = menor clave entre los ÚLTIMOS elementos de los buffers.
+- Se procesan todos los elementos con clave <= t (en particular, el buffer
+  completo de la corrida que define t: siempre hay progreso).
+- Todo elemento NO procesado de una corrida anterior tiene clave > t, es decir,
+  es mayor que todo elemento del lote de una corrida posterior:
+  cada y del lote de la corrida j suma "restantes de las corridas i < j".
+- Los pares dentro del mismo lote se cuentan como las inversiones de la
+  concatenación de los trozos del lote en orden de corrida.
+================================================================================
+
+Complejidad:
+- Tiempo: O(n log n) más dos lecturas y una escritura secuencial del archivo
+- Memoria: acotada por el presupuesto "memoria_max" (independiente de n)
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from conteo_inversiones_numpy import contar_inversiones_numpy
+
+
+# Bytes de RAM por elemento al contar en memoria con el motor NumPy (rangos,
+# claves, resultado del sort e índices auxiliares), medidos con tracemalloc:
+# 77 a 81 por elemento del arreglo YA RELLENADO a potencia de 2. Por eso las
+# corridas y los lotes de la mezcla se dimensionan en potencias de 2: con n
+# apenas mayor que una potencia de 2, el costo por elemento real se duplica
+BYTES_POR_ELEMENTO = 88
+
+MEMORIA_MAX_POR_DEFECTO = 256 * 1024 * 1024     # 256 MiB
+
+
+def contar_inversiones_archivo(ruta, dtype='int64', memoria_max=MEMORIA_MAX_POR_DEFECTO,
+                               directorio_temporal=None):
+    """
+    Cuenta exactamente las inversiones de un archivo binario de enteros.
+
+    Args:
+        ruta: archivo binario con enteros contiguos (sin encabezado)
+        dtype: 'int32' o 'int64' (orden de bytes nativo)
+        memoria_max: presupuesto de memoria en bytes para corridas y buffers
+        directorio_temporal: dónde escribir las corridas (None = el del sistema)
+
+    Returns:
+        número de inversiones
+
+    Raises:
+        ValueError: si el tamaño del archivo no es múltiplo del tamaño del
+                    dtype (dtype equivocado o archivo corrupto)
+    """
+    dtype = np.dtype(dtype)
+    tamano = os.path.getsize(ruta)
+    n, sobrantes = divmod(tamano, dtype.itemsize)
+    if sobrantes:
+        raise ValueError(f"El archivo '{ruta}' tiene {tamano} bytes, que no es "
+                         f"múltiplo de {dtype.itemsize} ({dtype.name})")
+    # Cada corrida: el bloque leído más el conteo en memoria
+    tam_corrida = _mayor_potencia_de_2(memoria_max // (BYTES_POR_ELEMENTO + dtype.itemsize))
+
+    inversiones = 0
+    with tempfile.TemporaryDirectory(dir=directorio_temporal) as carpeta:
+        # ====================================================================
+        # FASE 1: CORRIDAS ORDENADAS (inversiones dentro de cada corrida)
+        # ====================================================================
+        corridas = []
+        for k, inicio in enumerate(range(0, n, tam_corrida)):
+            largo = min(tam_corrida, n - inicio)
+
+            # Se mapea solo la porción de la corrida y se libera al terminar,
+            # así las páginas del archivo no se acumulan en memoria
+            vista = np.memmap(ruta, dtype=dtype, mode='r',
+                              offset=inicio * dtype.itemsize, shape=(largo,))
+            bloque = np.array(vista)
+            del vista
+
+            bloque_ordenado, inv_bloque = contar_inversiones_numpy(bloque)
+            inversiones += inv_bloque
+
+            ruta_corrida = os.path.join(carpeta, f"corrida_{k}.bin")
+            bloque_ordenado.astype(dtype, copy=False).tofile(ruta_corrida)
+            corridas.append((ruta_corrida, largo))
+            del bloque, bloque_ordenado
+
+        # ====================================================================
+        # FASE 2: MEZCLA k-VÍAS (inversiones entre corridas)
+        # ====================================================================
+        if len(corridas) > 1:
+            # Los k buffers, la concatenación del lote y su conteo en memoria;
+            # el lote tiene a lo sumo k * tam_buffer <= tam_lote elementos
+            tam_lote = _mayor_potencia_de_2(memoria_max // (BYTES_POR_ELEMENTO
+                                                            + 2 * dtype.itemsize))
+            tam_buffer = max(1, tam_lote // len(corridas))
+            inversiones += _mezclar_y_contar_corridas(corridas, dtype, tam_buffer)
+
+    return inversiones
+
+
+def _mayor_potencia_de_2(elementos):
+    """Mayor potencia de 2 que no supera "elementos" (al menos 1)"""
+    return 1 << (max(1, elementos).bit_length() - 1)
+
+
+def _mezclar_y_contar_corridas(corridas, dtype, tam_buffer):
+    """
+    Mezcla k corridas ordenadas en disco contando las inversiones entre ellas.
+
+    Args:
+        corridas: lista de (ruta, largo) en el orden original del archivo
+        dtype: tipo de dato de los archivos
+        tam_buffer: elementos leídos por corrida en cada lectura
+
+    Returns:
+        número de inversiones entre corridas
+    """
+    k = len(corridas)
+    # Sin buffer de Python: np.fromfile ya lee en bloque, y con muchas corridas
+    # los buffers de 8 KiB de cada archivo se salían del presupuesto
+    archivos = [open(ruta, 'rb', buffering=0) for ruta, _ in corridas]
+    restantes = [largo for _, largo in corridas]     # Incluye lo que está en buffer
+    buffers = [np.empty(0, dtype=dtype) for _ in range(k)]
+    inversiones = 0
+
+    try:
+        while True:
+            # Rellenar los buffers vacíos con una lectura en bloque
+            for r in range(k):
+                if len(buffers[r]) == 0 and restantes[r] > 0:
+                    buffers[r] = np.fromfile(archivos[r], dtype=dtype, count=tam_buffer)
+
+            activas = [r for r in range(k) if len(buffers[r]) > 0]
+            if not activas:
+                break
+
+            # Umbral: menor clave (último valor del buffer, corrida)
+            r_umbral = min(activas, key=lambda r: (buffers[r][-1], r))
+            v_umbral = buffers[r_umbral][-1]
+
+            # Tomar de cada buffer los elementos con clave <= umbral
+            piezas = []
+            tomados = [0] * k
+            for r in activas:
+                lado = 'right' if r <= r_umbral else 'left'
+                corte = int(np.searchsorted(buffers[r], v_umbral, side=lado))
+                if corte:
+                    piezas.append(buffers[r][:corte])
+                    buffers[r] = buffers[r][corte:]
+                    tomados[r] = corte
+                    restantes[r] -= corte
+
+            # Pares dentro del lote: inversiones de la concatenación en orden
+            if len(piezas) > 1:
+                lote = np.concatenate(piezas)
+                inversiones += contar_inversiones_numpy(lote, devolver_ordenado=False)[1]
+
+            # Pares (no procesado de corrida anterior, elemento del lote)
+            restantes_anteriores = 0
+            for r in range(k):
+                inversiones += tomados[r] * restantes_anteriores
+                restantes_anteriores += restantes[r]
+    finally:
+        for archivo in archivos:
+            archivo.close()
+
+    return inversiones
+
+
+def main():
+    """
+    Ejemplo: cuenta una permutación aleatoria guardada en disco con un
+    presupuesto de memoria pequeño y la compara con el conteo en memoria.
+    """
+    n = 200_000
+    memoria_max = 2 * 1024 * 1024       # 2 MiB -> fuerza varias corridas
+    permutacion = np.random.default_rng(0).permutation(n).astype(np.int32)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "permutacion.bin")
+        permutacion.tofile(ruta)
+
+        print("=" * 70)
+        print("CONTEO DE INVERSIONES EN MEMORIA EXTERNA")
+        print("=" * 70)
+        print(f"Elementos: {n}  |  Presupuesto de memoria: {memoria_max // 1024} KiB")
+
+        inversiones = contar_inversiones_archivo(ruta, dtype='int32', memoria_max=memoria_max)
+        _, esperado = contar_inversiones_numpy(permutacion)
+
+        print(f"  - Inversiones (memoria externa): {inversiones}")
+        print(f"  - Inversiones (en memoria):      {esperado}")
+        print("  - CORRECTO" if inversiones == esperado else "  - ERROR: No coinciden")
+
+
+if __name__ == "__main__":
+    main()
@@ -37,21 +37,46 @@ Autor: Implementación para CAED
 Fecha: Noviembre 2025
 """
 
+import math
+import random
+from array import array
+from itertools import islice
+from statistics import NormalDist
 
-def contar_inversiones(arr):
+import numpy as np
+
+from conteo_inversiones_numpy import contar_inversiones_numpy
+
+
+# Tipos de dato (dtype.kind) que se cuentan con el motor tipado de NumPy:
+# booleanos, enteros con y sin signo, y flotantes
+TIPOS_MOTOR_TIPADO = 'biuf'
+
+
+def contar_inversiones(arr, devolver_ordenado=True):
     """
     Cuenta el número de inversiones en un array usando divide y vencerás.
     
     *** ESTA ES LA ESTRUCTURA BÁSICA DE MERGE SORT ***
     Este algoritmo sigue EXACTAMENTE la misma estructura que Merge Sort,
     pero además de ordenar, cuenta las inversiones.
+
+    Además de listas acepta secuencias tipadas con protocolo de buffer
+    (arrays de NumPy, array.array, memoryview, numpy.memmap). Esas entradas
+    NO se convierten a lista: se leen sin copiar y se cuentan con el motor
+    tipado (ver _contar_inversiones_tipado).
     
     Args:
-        arr: Lista de números a analizar
+        arr: Lista de números a analizar (o secuencia tipada)
+        devolver_ordenado: para entradas tipadas, si False no se construye
+                           la copia ordenada (se devuelve None en su lugar)
         
     Returns:
         tupla (arr_ordenado, num_inversiones)
     """
+    if not isinstance(arr, list):
+        return _contar_inversiones_tipado(arr, devolver_ordenado)
+
     # ========================================================================
     # PASO 1: CASO BASE (igual que Merge Sort)
     # ========================================================================
@@ -99,6 +124,39 @@ def contar_inversiones(arr):
     return arr_ordenado, total_inversiones
 
 
+def _contar_inversiones_tipado(arr, devolver_ordenado=True):
+    """
+    Despacha una entrada que no es lista al motor adecuado según su dtype.
+
+    - Buffer numérico (ver TIPOS_MOTOR_TIPADO): se envuelve sin copiar con
+      np.asarray(memoryview(...)) y se cuenta con contar_inversiones_numpy().
+    - Cualquier otra secuencia (tuplas, strings, arrays de objetos): se
+      convierte a lista y se usa el algoritmo recursivo original.
+
+    Args:
+        arr: secuencia a analizar
+        devolver_ordenado: si False no se construye la copia ordenada
+
+    Returns:
+        tupla (arr_ordenado, num_inversiones)
+    """
+    valores = None
+    if isinstance(arr, np.ndarray):
+        valores = arr
+    else:
+        try:
+            valores = np.asarray(memoryview(arr))    # Vista sin copia del buffer
+        except (TypeError, ValueError):
+            pass
+
+    if valores is not None and valores.ndim == 1 and valores.dtype.kind in TIPOS_MOTOR_TIPADO:
+        return contar_inversiones_numpy(valores, devolver_ordenado)
+
+    # Motor genérico: secuencias sin buffer numérico
+    arr_ordenado, inversiones = contar_inversiones(list(arr))
+    return (arr_ordenado if devolver_ordenado else None), inversiones
+
+
 def mezclar_y_contar(izq, der):
     """
     Mezcla dos arrays ordenados y cuenta las inversiones entre ellos.
@@ -182,23 +240,259 @@ def mezclar_y_contar(izq, der):
     return resultado, inversiones
 
 
-def verificar_inversiones_fuerza_bruta(arr):
+def contar_inversiones_por_elemento(arr):
+    """
+    Cuenta, para cada índice, en cuántas inversiones participa.
+
+        conteo[k] = #{i < k : A[i] > A[k]} + #{j > k : A[j] < A[k]}
+
+    Es un Merge Sort iterativo propio (no llama a mezclar_y_contar()) que
+    mezcla los índices originales en lugar de los valores, con la MISMA
+    regla de mezcla y conteo:
+    - CASO A (se toma izq[i]): los j elementos derechos ya tomados son
+      menores que él y están a su derecha -> conteo[izq[i]] += j
+    - CASO B (se toma der[j]): los len(izq) - i restantes de la izquierda son
+      mayores que él y están a su izquierda -> conteo[der[j]] += len(izq) - i
+      (el mismo "len(izq) - i" que suma mezclar_y_contar() al total)
+
+    Cada inversión se cuenta una vez en cada uno de sus dos extremos, por lo
+    que sum(conteo) == 2 · inversiones (se devuelve el total para verificarlo).
+
+    Los índices y conteos se guardan en array('q') (enteros de máquina de 8
+    bytes), sin tuplas ni listas de objetos Python.
+
+    Complejidad:
+    - Tiempo: O(n log n)
+    - Espacio: O(n) enteros de máquina
+
+    Args:
+        arr: array a analizar
+
+    Returns:
+        tupla (conteo, num_inversiones): array('q') con el conteo de cada
+        índice y el total de inversiones
+    """
+    n = len(arr)
+    conteo = array('q', bytes(8 * n))
+    indices = array('q', range(n))
+    auxiliar = array('q', bytes(8 * n))     # Destino de la mezcla de cada nivel
+    inversiones = 0
+
+    ancho = 1
+    while ancho < n:
+        for inicio in range(0, n, 2 * ancho):
+            medio = min(inicio + ancho, n)
+            fin = min(inicio + 2 * ancho, n)
+            i, j, k = inicio, medio, inicio
+            while i < medio and j < fin:
+                if arr[indices[i]] <= arr[indices[j]]:
+                    # CASO A: ya se tomaron (j - medio) elementos derechos menores
+                    conteo[indices[i]] += j - medio
+                    auxiliar[k] = indices[i]
+                    i += 1
+                else:
+                    # CASO B: quedan (medio - i) elementos izquierdos mayores
+                    conteo[indices[j]] += medio - i
+                    inversiones += medio - i
+                    auxiliar[k] = indices[j]
+                    j += 1
+                k += 1
+            while i < medio:
+                # Restantes de la izquierda: todos los derechos eran menores
+                conteo[indices[i]] += fin - medio
+                auxiliar[k] = indices[i]
+                i += 1
+                k += 1
+            auxiliar[k:fin] = indices[j:fin]
+        indices, auxiliar = auxiliar, indices
+        ancho *= 2
+
+    return conteo, inversiones
+
+
+def _intervalo_wilson(exitos, muestras, z):
+    """
+    Centro y radio del intervalo de Wilson para una proporción binomial (se
+    comporta bien también cerca de p = 0 o p = 1).
+    """
+    p = exitos / muestras
+    denominador = 1 + z * z / muestras
+    centro = (p + z * z / (2 * muestras)) / denominador
+    radio = z * math.sqrt(p * (1 - p) / muestras + z * z / (4 * muestras * muestras)) / denominador
+    return centro, radio
+
+
+def estimar_inversiones(arr, error_objetivo=0.01, confianza=0.95, muestras=None, semilla=None,
+                        relativo=False, max_muestras=1_000_000):
+    """
+    Estima el número de inversiones por muestreo aleatorio de pares, con
+    error_objetivo ABSOLUTO sobre la proporción de pares invertidos (o, con
+    relativo=True, RELATIVO sobre el número de inversiones).
+
+    Se eligen pares (i, j) con i < j uniformemente al azar y se mide la
+    proporción p de pares invertidos. Como hay n(n-1)/2 pares posibles:
+
+        inversiones ≈ p · n(n-1)/2
+
+    El intervalo de confianza es el de Wilson para una proporción binomial.
+    El tiempo depende solo de la cantidad de muestras, NO de n (cada muestra
+    son dos accesos aleatorios al array).
+
+    Tamaño de muestra derivado del error absoluto (peor caso p = 0.5):
+
+        muestras = z² / (4 · error_objetivo²)
+        (error_objetivo = 0.01 y 95% de confianza -> 9604 muestras)
+
+    Ese error es ±1% de n(n-1)/2, no del conteo: en un array casi ordenado
+    (p cercano a 0) la estimación absoluta no dice nada útil. Con
+    relativo=True se sigue muestreando hasta que el radio del intervalo
+    quede por debajo de error_objetivo · p (hacen falta unas
+    z² (1 - p) / (error_objetivo² · p) muestras, más cuanto menor es p), o
+    hasta max_muestras.
+
+    Args:
+        arr: array a analizar (cualquier secuencia con acceso por índice)
+        error_objetivo: error máximo; absoluto sobre la proporción de pares
+                        invertidos (0.01 = ±1% del máximo n(n-1)/2), o
+                        relativo sobre el conteo si relativo=True
+                        (0.01 = ±1% de las inversiones)
+        confianza: nivel de confianza del intervalo, en (0, 1)
+        muestras: cantidad fija de pares a muestrear (None = derivada del error)
+        semilla: semilla del generador aleatorio (para reproducibilidad)
+        relativo: si True, error_objetivo es relativo al conteo
+        max_muestras: tope de muestras del modo relativo (si se alcanza, el
+                      intervalo devuelto es más ancho que el pedido)
+
+    Returns:
+        tupla (estimacion, limite_inferior, limite_superior)
+
+    Raises:
+        ValueError: si muestras < 1, max_muestras < 1, error_objetivo <= 0 o
+                    confianza no está en (0, 1)
+    """
+    if muestras is not None and muestras < 1:
+        raise ValueError("Se necesita al menos una muestra")
+    if max_muestras < 1:
+        raise ValueError("max_muestras debe ser al menos 1")
+    if error_objetivo <= 0:
+        raise ValueError("error_objetivo debe ser positivo")
+    if not 0 < confianza < 1:
+        raise ValueError("confianza debe estar entre 0 y 1 (sin incluirlos)")
+
+    n = len(arr)
+    total_pares = n * (n - 1) // 2
+    if total_pares == 0:
+        return 0, 0, 0
+
+    z = NormalDist().inv_cdf(0.5 + confianza / 2)
+    if muestras is None and not relativo:
+        muestras = math.ceil(z * z / (4 * error_objetivo ** 2))
+
+    # Muestreo de pares i != j uniformes (luego se ordenan para que i < j).
+    # Con muestras fijas hay una sola tanda; en el modo relativo, tandas que
+    # se duplican hasta alcanzar el error pedido o max_muestras
+    generador = random.Random(semilla)
+    invertidos = tomadas = 0
+    tanda = muestras if muestras is not None else min(max_muestras, 1024)
+    while True:
+        for _ in range(tanda):
+            i = generador.randrange(n)
+            j = generador.randrange(n - 1)
+            if j >= i:
+                j += 1
+            if i > j:
+                i, j = j, i
+            if arr[i] > arr[j]:
+                invertidos += 1
+        tomadas += tanda
+
+        centro, radio = _intervalo_wilson(invertidos, tomadas, z)
+        if muestras is not None or tomadas >= max_muestras:
+            break
+        if invertidos and radio <= error_objetivo * invertidos / tomadas:
+            break
+        tanda = min(tomadas, max_muestras - tomadas)
+
+    estimacion = round(invertidos / tomadas * total_pares)
+    inferior = max(0, math.floor((centro - radio) * total_pares))
+    superior = min(total_pares, math.ceil((centro + radio) * total_pares))
+    return estimacion, inferior, superior
+
+
+def generar_inversiones(arr):
+    """
+    Genera los pares invertidos (i, j, A[i], A[j]) DURANTE la mezcla.
+
+    Es el mismo Merge Sort de contar_inversiones(), en versión iterativa
+    (de abajo hacia arriba) y sobre índices: en el CASO B de la mezcla, cuando
+    der[j] < izq[i], en lugar de sumar len(izq) - i se emite cada uno de esos
+    pares. Como es un generador, obtener los primeros k pares cuesta
+    O(n log n + k) y no hace falta recorrer los O(n²) pares posibles.
+
+    Args:
+        arr: array a analizar
+
+    Yields:
+        tuplas (i, j, A[i], A[j]) con i < j y A[i] > A[j]
+    """
+    n = len(arr)
+    indices = list(range(n))        # Índices ordenados por valor dentro de cada bloque
+    ancho = 1
+    while ancho < n:
+        mezclados = []
+        for inicio in range(0, n, 2 * ancho):
+            izq = indices[inicio:inicio + ancho]
+            der = indices[inicio + ancho:inicio + 2 * ancho]
+            i = j = 0
+            while i < len(izq) and j < len(der):
+                if arr[izq[i]] <= arr[der[j]]:
+                    mezclados.append(izq[i])
+                    i += 1
+                else:
+                    # der[j] es menor que TODOS los restantes de izq: cada uno es un par
+                    d = der[j]
+                    for k in range(i, len(izq)):
+                        yield izq[k], d, arr[izq[k]], arr[d]
+                    mezclados.append(d)
+                    j += 1
+            mezclados.extend(izq[i:])
+            mezclados.extend(der[j:])
+        indices = mezclados
+        ancho *= 2
+
+
+# Tamaño máximo para el que se ejecuta la verificación por fuerza bruta
+LIMITE_FUERZA_BRUTA = 20000
+
+
+def verificar_inversiones_fuerza_bruta(arr, limite=LIMITE_FUERZA_BRUTA, tam_bloque=1024):
     """
     Verifica el conteo de inversiones usando fuerza bruta (O(n²)).
     Nos permite validar el algoritmo divide y vencerás en EL ejercicio.
-    
+
+    Se comparan todos los pares, pero por bloques de filas con NumPy:
+    cada bloque de tam_bloque índices i se compara contra todos los j > i
+    en una sola operación vectorizada (memoria O(tam_bloque · n)).
+
     Args:
         arr: Lista de números a analizar
-        
+        limite: tamaño máximo para verificar (None = sin límite)
+        tam_bloque: filas comparadas por operación vectorizada
+
     Returns:
-        número de inversiones
+        número de inversiones, o None si el array supera el límite
     """
-    inversiones = 0
     n = len(arr)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if arr[i] > arr[j]:
-                inversiones += 1
+    if limite is not None and n > limite:
+        return None
+
+    valores = np.asarray(arr)
+    inversiones = 0
+    for inicio in range(0, n, tam_bloque):
+        bloque = valores[inicio:inicio + tam_bloque]
+        # comparaciones[r, c] = A[inicio + r] > A[inicio + c]; solo cuentan c > r (j > i)
+        comparaciones = bloque[:, None] > valores[None, inicio:]
+        inversiones += int(np.triu(comparaciones, k=1).sum())
     return inversiones
 
 
@@ -215,36 +509,32 @@ def mostrar_ejemplos_inversiones(arr, nombre, max_ejemplos=5):
     print(f"{'='*70}")
     print(f"array original: {arr}")
     
-    # Encontrar algunas inversiones de ejemplo (máximo 5 por efecto para que sea legible)
-    inversiones_ejemplo = []
+    # Tomar algunas inversiones de ejemplo (máximo 5 por efecto para que sea legible)
+    # El generador se detiene apenas se obtienen: no se recorren los O(n²) pares
     n = len(arr)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if arr[i] > arr[j]:
-                inversiones_ejemplo.append((i, j, arr[i], arr[j]))
-                if len(inversiones_ejemplo) >= max_ejemplos:
-                    break
-        if len(inversiones_ejemplo) >= 5:
-            break
+    inversiones_ejemplo = list(islice(generar_inversiones(arr), max_ejemplos))
     
     if inversiones_ejemplo:
         print(f"\nEjemplos de inversiones (i, j) donde i < j pero A[i] > A[j]:")
         for i, j, val_i, val_j in inversiones_ejemplo:
             print(f"  - Índices ({i}, {j}): A[{i}] = {val_i} > A[{j}] = {val_j}")
-        if len(inversiones_ejemplo) == 5:
+        if len(inversiones_ejemplo) == max_ejemplos:
             print("  - ...")
     
     # Contar inversiones con divide y vencerás
     arr_copia = arr.copy()
     arr_ordenado, inversiones = contar_inversiones(arr_copia)
     
-    # Verificar con fuerza bruta
+    # Verificar con fuerza bruta (solo para arrays de hasta LIMITE_FUERZA_BRUTA)
     inversiones_fb = verificar_inversiones_fuerza_bruta(arr)
     
     print(f"\nResultados:")
     print(f"  - Número total de inversiones (Divide y Vencerás): {inversiones}")
-    print(f"  - Verificación (Fuerza Bruta): {inversiones_fb}")
-    print(f"  - CORRECTO" if inversiones == inversiones_fb else "  - ERROR: No coinciden")
+    if inversiones_fb is None:
+        print(f"  - Verificación (Fuerza Bruta): omitida (n > {LIMITE_FUERZA_BRUTA})")
+    else:
+        print(f"  - Verificación (Fuerza Bruta): {inversiones_fb}")
+        print(f"  - CORRECTO" if inversiones == inversiones_fb else "  - ERROR: No coinciden")
     print(f"  - array ordenado: {arr_ordenado}")
     print(f"  - Número máximo posible de inversiones: {n * (n - 1) // 2}")
     print(f"  - Porcentaje de inversiones: {100 * inversiones / (n * (n - 1) // 2):.1f}%")
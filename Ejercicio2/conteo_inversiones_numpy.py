@@ -0,0 +1,185 @@
+"""
+Conteo de Inversiones con NumPy (Merge Sort iterativo vectorizado)
+==================================================================
+
+Es el MISMO algoritmo que contar_inversiones() (Merge Sort + conteo), pero
+escrito "de abajo hacia arriba" y vectorizado:
+
+1. Comprimir los valores a rangos 0..m-1, según el dtype:
+   - Enteros con rango denso (max - min <= 4n): basta con restar el mínimo,
+     sin ordenar.
+   - Resto (flotantes, enteros dispersos): np.unique.
+2. Para ancho = 1, 2, 4, ...: todos los pares de bloques (izquierdo, derecho)
+   de ese ancho se mezclan y cuentan A LA VEZ, en lugar de uno por llamada
+   recursiva.
+
+*** CÓMO SE MEZCLAN TODOS LOS BLOQUES A LA VEZ ***
+================================================================================
+A cada elemento se le suma (id_de_bloque · m) a su rango. Así, las claves de
+bloques distintos nunca se mezclan entre sí y:
+
+- Las claves de todas las mitades izquierdas forman UN arreglo ordenado, por lo
+  que np.searchsorted cuenta, para cada elemento derecho, cuántos elementos
+  izquierdos de su bloque son <= que él. El resto (ancho - eso) son las
+  inversiones, exactamente el "len(izq) - i" de mezclar_y_contar().
+- np.sort(kind='stable') sobre las claves realiza la mezcla: cada bloque son
+  dos corridas ordenadas y Timsort las detecta, por lo que mezclar es lineal.
+================================================================================
+
+Los valores se procesan como enteros de máquina (int64), sin objetos Python
+por elemento.
+
+Complejidad:
+- Tiempo: O(n log n)
+- Espacio: O(n) enteros de 8 bytes
+"""
+
+import numpy as np
+
+
+def _comprimir_rangos(matriz):
+    """
+    Convierte los valores a rangos densos 0..m-1 según el tipo de dato.
+
+    Args:
+        matriz: array de valores (no se modifica)
+
+    Returns:
+        tupla (rangos int64, m, a_valores) donde a_valores(rangos) reconstruye
+        los valores originales a partir de los rangos
+    """
+    if matriz.dtype.kind in 'biu' and matriz.size:
+        # Motor entero: si el rango de valores es denso, restar el mínimo
+        # conserva el orden y evita el ordenamiento de np.unique
+        minimo, maximo = int(matriz.min()), int(matriz.max())
+        amplitud = maximo - minimo + 1
+        if amplitud <= 4 * matriz.size:
+            if maximo <= np.iinfo(np.int64).max:
+                rangos = matriz.astype(np.int64) - minimo
+                return rangos, amplitud, lambda r: (r + minimo).astype(matriz.dtype)
+            # uint64 por encima de 2**63: se resta el mínimo en el dtype de
+            # origen (sin signo, no desborda) y recién después se pasa a int64
+            base = matriz.dtype.type(minimo)
+            rangos = (matriz - base).astype(np.int64)
+            return rangos, amplitud, lambda r: r.astype(matriz.dtype) + base
+
+    # Motor por comparación: flotantes o enteros dispersos
+    unicos, rangos = np.unique(matriz, return_inverse=True)
+    rangos = rangos.reshape(matriz.shape).astype(np.int64, copy=False)
+    return rangos, len(unicos), lambda r: unicos[r]
+
+
+def contar_inversiones_filas(matriz, devolver_ordenadas=True):
+    """
+    Cuenta las inversiones de cada fila de una matriz 2-D.
+
+    Todas las filas se procesan en la misma pasada vectorizada, sin bucles
+    de Python por fila ni por elemento.
+
+    Args:
+        matriz: array 2-D (filas x n) de valores comparables
+        devolver_ordenadas: si False no se construyen las filas ordenadas
+
+    Returns:
+        tupla (filas_ordenadas, conteos) donde conteos es un vector int64
+        (filas_ordenadas es None si devolver_ordenadas es False)
+    """
+    matriz = np.asarray(matriz)
+    if matriz.ndim != 2:
+        raise ValueError("Se esperaba una matriz 2-D")
+
+    filas, n = matriz.shape
+    conteos = np.zeros(filas, dtype=np.int64)
+    if n <= 1 or filas == 0:
+        return (matriz.copy() if devolver_ordenadas else None), conteos
+
+    # ========================================================================
+    # PASO 1: COMPRESIÓN DE RANGOS (conserva las comparaciones estrictas)
+    # ========================================================================
+    rangos, m, a_valores = _comprimir_rangos(matriz)
+
+    # Rellenar hasta potencia de 2 con el rango máximo AL FINAL:
+    # un valor máximo al final no forma inversiones nuevas
+    tam = 1 << (n - 1).bit_length()
+    if tam != n:
+        relleno = np.full((filas, tam - n), m - 1, dtype=np.int64)
+        rangos = np.concatenate([rangos, relleno], axis=1)
+    actual = rangos.reshape(-1)
+
+    posiciones = np.arange(filas * tam, dtype=np.int64)
+
+    # ========================================================================
+    # PASO 2: NIVELES DEL MERGE SORT (todos los bloques del nivel a la vez)
+    # ========================================================================
+    ancho = 1
+    while ancho < tam:
+        bloque = posiciones // (2 * ancho)          # Id global de bloque
+        claves = actual + bloque * m
+        es_izq = (posiciones % (2 * ancho)) < ancho
+
+        claves_izq = claves[es_izq]                  # Ordenado globalmente
+        claves_der = claves[~es_izq]
+        bloque_der = bloque[~es_izq]
+
+        # Elementos izquierdos <= cada elemento derecho (dentro de su bloque)
+        izq_menores_o_iguales = (np.searchsorted(claves_izq, claves_der, side='right')
+                                 - bloque_der * ancho)
+        inversiones = ancho - izq_menores_o_iguales  # "len(izq) - i"
+        conteos += inversiones.reshape(filas, -1).sum(axis=1)
+
+        # Mezcla: cada bloque son dos corridas ordenadas (Timsort es lineal)
+        actual = np.sort(claves, kind='stable') - bloque * m
+        ancho *= 2
+
+    if not devolver_ordenadas:
+        return None, conteos
+    return a_valores(actual.reshape(filas, tam)[:, :n]), conteos
+
+
+def contar_inversiones_numpy(arr, devolver_ordenado=True):
+    """
+    Cuenta las inversiones de un array 1-D usando el motor vectorizado.
+
+    Mismo contrato que contar_inversiones(): devuelve el array ordenado y
+    el número de inversiones.
+
+    Args:
+        arr: array 1-D (o secuencia convertible con np.asarray)
+        devolver_ordenado: si False no se construye el array ordenado
+
+    Returns:
+        tupla (arr_ordenado, num_inversiones) (arr_ordenado es None si
+        devolver_ordenado es False)
+    """
+    arr = np.asarray(arr)
+    ordenadas, conteos = contar_inversiones_filas(arr.reshape(1, -1), devolver_ordenado)
+    return (ordenadas[0] if devolver_ordenado else None), int(conteos[0])
+
+
+# Casos de regresión de la compresión por dtype (ver _comprimir_rangos)
+CASOS_TIPADOS = [
+    ("uint64 mayores que 2**63 (rango denso)",
+     np.array([2**64 - 1, 2**64 - 3, 2**64 - 2, 2**64 - 4], dtype=np.uint64)),
+    ("uint64 mayores que 2**63 (rango disperso)",
+     np.array([2**64 - 1, 2**63, 2**64 - 2**40, 1], dtype=np.uint64)),
+    ("int64 negativos (rango denso)", np.array([-1, -3, -2, -4, -3], dtype=np.int64)),
+    ("float64 con repetidos", np.array([0.5, -1.25, 0.5, 3.0, -1.25])),
+]
+
+
+def main():
+    """Verifica el motor con los casos tipados contra el conteo por pares"""
+    print("=" * 70)
+    print("MOTOR NUMPY: CASOS DE REGRESIÓN POR DTYPE")
+    print("=" * 70)
+    for nombre, arr in CASOS_TIPADOS:
+        ordenado, inversiones = contar_inversiones_numpy(arr)
+        esperado = sum(1 for i in range(len(arr)) for j in range(i + 1, len(arr))
+                       if arr[i] > arr[j])
+        correcto = inversiones == esperado and np.array_equal(ordenado, np.sort(arr))
+        print(f"  - {nombre}: {inversiones} inversiones "
+              f"({'CORRECTO' if correcto else f'ERROR: se esperaban {esperado}'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Ejecución por Lotes de Casos de Prueba (archivo JSON-lines + procesos)
+======================================================================
+
+ejecutar_casos_de_prueba() recibe una lista de diccionarios en memoria,
+imprime un reporte detallado por caso y verifica SIEMPRE con fuerza bruta
+(O(n²)). Para miles de casos grandes eso hace que el tiempo lo dominen la
+impresión y la verificación, no el conteo.
+
+Este módulo:
+- Lee los casos en streaming desde un archivo JSON-lines, un caso por línea
+  con el mismo formato que CASOS_DE_PRUEBA: {"nombre": str, "array": list}
+- Cuenta cada caso en un pool de procesos (las líneas se parsean en los
+  procesos trabajadores, no en el principal).
+- Verifica con fuerza bruta solo los casos con n <= umbral_verificacion.
+- Escribe una línea JSON compacta por caso, en el mismo orden de entrada:
+  {"nombre", "n", "inversiones", "porcentaje_maximo", "tiempo", "verificado"}
+
+Uso:
+    python ejecucion_por_lotes.py casos.jsonl --salida resultados.jsonl
+"""
+
+import argparse
+import json
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from conteo_inversiones import contar_inversiones, verificar_inversiones_fuerza_bruta
+
+
+def _procesar_linea(argumentos):
+    """
+    Procesa un caso (se ejecuta en un proceso trabajador).
+
+    Args:
+        argumentos: tupla (línea JSON, umbral de verificación)
+
+    Returns:
+        diccionario con el resultado compacto del caso
+    """
+    linea, umbral_verificacion = argumentos
+    nombre = None
+    try:
+        caso = json.loads(linea)
+        nombre = caso.get("nombre")
+        arr = caso["array"]
+        n = len(arr)
+
+        # El conteo usa el motor tipado (sin listas de objetos Python)
+        inicio = time.perf_counter()
+        _, inversiones = contar_inversiones(np.asarray(arr), devolver_ordenado=False)
+        tiempo = time.perf_counter() - inicio
+
+        # Fuerza bruta solo para casos chicos (None = no verificado)
+        verificado = None
+        if n <= umbral_verificacion:
+            verificado = verificar_inversiones_fuerza_bruta(arr, limite=None) == inversiones
+
+        maximo = n * (n - 1) // 2
+        return {
+            "nombre": nombre,
+            "n": n,
+            "inversiones": inversiones,
+            "porcentaje_maximo": round(100 * inversiones / maximo, 4) if maximo else 0.0,
+            "tiempo": round(tiempo, 6),
+            "verificado": verificado,
+        }
+    except Exception as e:
+        return {"nombre": nombre, "error": str(e)}
+
+
+def ejecutar_casos_por_lotes(ruta_entrada, salida=None, procesos=None,
+                             umbral_verificacion=2000, casos_por_tarea=16):
+    """
+    Ejecuta todos los casos de un archivo JSON-lines en paralelo.
+
+    Args:
+        ruta_entrada: archivo con un caso JSON por línea
+        salida: archivo abierto donde escribir los resultados (None = stdout)
+        procesos: cantidad de procesos (None = cantidad de CPUs)
+        umbral_verificacion: n máximo para verificar con fuerza bruta
+        casos_por_tarea: casos enviados juntos a cada proceso
+
+    Returns:
+        diccionario resumen con casos, errores y discrepancias
+    """
+    salida = salida or sys.stdout
+    resumen = {"casos": 0, "errores": 0, "discrepancias": 0}
+
+    with open(ruta_entrada, encoding="utf-8") as entrada, Pool(procesos) as pool:
+        # imap consume el archivo de a poco: no se cargan todos los casos
+        lineas = ((linea, umbral_verificacion) for linea in entrada if linea.strip())
+        for resultado in pool.imap(_procesar_linea, lineas, chunksize=casos_por_tarea):
+            resumen["casos"] += 1
+            if "error" in resultado:
+                resumen["errores"] += 1
+            elif resultado["verificado"] is False:
+                resumen["discrepancias"] += 1
+            salida.write(json.dumps(resultado, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    return resumen
+
+
+def main():
+    """Función principal: ejecuta un archivo de casos desde la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Conteo de inversiones por lotes (JSON-lines)")
+    parser.add_argument("entrada", help='archivo JSON-lines con casos {"nombre": ..., "array": [...]}')
+    parser.add_argument("--salida", help="archivo JSON-lines de resultados (por defecto, stdout)")
+    parser.add_argument("--procesos", type=int, help="cantidad de procesos (por defecto, CPUs)")
+    parser.add_argument("--umbral-verificacion", type=int, default=2000,
+                        help="n máximo para verificar con fuerza bruta")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as salida:
+            resumen = ejecutar_casos_por_lotes(args.entrada, salida, args.procesos,
+                                               args.umbral_verificacion)
+    else:
+        resumen = ejecutar_casos_por_lotes(args.entrada, None, args.procesos,
+                                           args.umbral_verificacion)
+    duracion = time.perf_counter() - inicio
+
+    print(f"{resumen['casos']} casos en {duracion:.2f} s "
+          f"({resumen['casos'] / duracion if duracion else 0:.1f} casos/s), "
+          f"errores: {resumen['errores']}, discrepancias: {resumen['discrepancias']}",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
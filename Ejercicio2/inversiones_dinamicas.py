@@ -0,0 +1,212 @@
+"""
+Conteo Dinámico de Inversiones (actualizaciones puntuales e intercambios)
+=========================================================================
+
+Problema: mantener el número total de inversiones de un array mientras se
+modifican elementos (set(i, v)) o se intercambian (swap(i, j)), sin
+recalcular todo con contar_inversiones() en O(n log n) por cambio.
+
+*** IDEA: DELTA DE UN CAMBIO PUNTUAL ***
+================================================================================
+Al reemplazar A[i] = viejo por nuevo, solo cambian los pares que involucran i:
+
+    aporte(i, v) = #{j < i : A[j] > v} + #{j > i : A[j] < v}
+    delta        = aporte(i, nuevo) - aporte(i, viejo)
+
+Un swap(i, j) son dos set() consecutivos.
+================================================================================
+
+*** ESTRUCTURA: DESCOMPOSICIÓN EN BLOQUES ORDENADOS ***
+================================================================================
+El array se divide en bloques de tamaño B ≈ √(n log n). Cada bloque guarda una
+copia ORDENADA de sus elementos, así:
+- Contar mayores/menores que v en un bloque completo: bisect, O(log B)
+- En el bloque de i (parcial): recorrido directo, O(B)
+- Actualizar un bloque ordenado: bisect + insort, O(B)
+================================================================================
+
+Complejidad:
+- Construcción: O(n log n)
+- set / swap:   O(√(n log n)) por operación
+- Memoria:      O(n)
+"""
+
+import math
+from bisect import bisect_left, bisect_right, insort
+
+from conteo_inversiones import contar_inversiones, verificar_inversiones_fuerza_bruta
+
+
+class InversionesDinamicas:
+    def __init__(self, arr, tam_bloque=None):
+        """
+        Construye la estructura a partir de un array inicial.
+
+        Args:
+            arr: array de valores comparables (se copia)
+            tam_bloque: tamaño de bloque (None = ⌈√(n log n)⌉)
+        """
+        self.valores = list(arr)
+        n = len(self.valores)
+        self.tam_bloque = tam_bloque or max(1, math.ceil(math.sqrt(n * max(1.0, math.log2(n or 1)))))
+        B = self.tam_bloque
+        self.bloques_ordenados = [sorted(self.valores[k:k + B]) for k in range(0, n, B)]
+
+        # El conteo inicial se hace una sola vez con divide y vencerás
+        _, self.inversiones = contar_inversiones(self.valores)
+
+    def __len__(self):
+        return len(self.valores)
+
+    def _aporte(self, i, v):
+        """
+        Cuenta las inversiones que formaría el valor v ubicado en la posición i.
+
+        Args:
+            i: posición
+            v: valor hipotético en esa posición
+
+        Returns:
+            #{j < i : A[j] > v} + #{j > i : A[j] < v}
+        """
+        B = self.tam_bloque
+        bloque_i = i // B
+        aporte = 0
+
+        # Bloques completos a la izquierda: elementos mayores que v
+        for ordenado in self.bloques_ordenados[:bloque_i]:
+            aporte += len(ordenado) - bisect_right(ordenado, v)
+
+        # Bloques completos a la derecha: elementos menores que v
+        for ordenado in self.bloques_ordenados[bloque_i + 1:]:
+            aporte += bisect_left(ordenado, v)
+
+        # Bloque propio: recorrido directo (sin la posición i)
+        valores = self.valores
+        for j in range(bloque_i * B, i):
+            if valores[j] > v:
+                aporte += 1
+        for j in range(i + 1, min(len(valores), (bloque_i + 1) * B)):
+            if valores[j] < v:
+                aporte += 1
+        return aporte
+
+    def _validar(self, i):
+        """Verifica que 0 <= i < n (los índices negativos no se aceptan)"""
+        if not 0 <= i < len(self.valores):
+            raise IndexError(f"Posición inválida {i} para un array de longitud {len(self.valores)}")
+
+    def set(self, i, v):
+        """
+        Reemplaza A[i] por v y actualiza el número de inversiones.
+
+        Args:
+            i: posición a modificar
+            v: nuevo valor
+
+        Returns:
+            número total de inversiones luego del cambio
+
+        Raises:
+            IndexError: si la posición está fuera de [0, n)
+        """
+        self._validar(i)
+        viejo = self.valores[i]
+        if viejo == v:
+            return self.inversiones
+
+        self.inversiones += self._aporte(i, v) - self._aporte(i, viejo)
+
+        # Actualizar el bloque ordenado: quitar el viejo e insertar el nuevo
+        ordenado = self.bloques_ordenados[i // self.tam_bloque]
+        del ordenado[bisect_left(ordenado, viejo)]
+        insort(ordenado, v)
+        self.valores[i] = v
+        return self.inversiones
+
+    def swap(self, i, j):
+        """
+        Intercambia A[i] y A[j] y actualiza el número de inversiones.
+
+        Args:
+            i, j: posiciones a intercambiar
+
+        Returns:
+            número total de inversiones luego del intercambio
+
+        Raises:
+            IndexError: si alguna posición está fuera de [0, n)
+        """
+        self._validar(i)
+        self._validar(j)
+        vi, vj = self.valores[i], self.valores[j]
+        if vi == vj:
+            return self.inversiones
+        self.set(i, vj)
+        return self.set(j, vi)
+
+    def aplicar_actualizaciones(self, operaciones):
+        """
+        Aplica una secuencia de operaciones en orden.
+
+        Args:
+            operaciones: iterable de tuplas ('set', i, v) o ('swap', i, j)
+
+        Returns:
+            lista con el número de inversiones luego de cada operación
+        """
+        resultados = []
+        for operacion, x, y in operaciones:
+            if operacion == 'set':
+                resultados.append(self.set(x, y))
+            elif operacion == 'swap':
+                resultados.append(self.swap(x, y))
+            else:
+                raise ValueError(f"Operación desconocida: '{operacion}'")
+        return resultados
+
+    def verificar_consistencia(self, limite=2000):
+        """
+        Compara el conteo mantenido con la verificación por fuerza bruta.
+
+        Solo se ejecuta para arrays chicos (la fuerza bruta es O(n²)).
+
+        Args:
+            limite: tamaño máximo para el que se ejecuta la verificación
+
+        Returns:
+            True/False según coincidan, o None si el array supera el límite
+        """
+        if len(self.valores) > limite:
+            return None
+        return self.inversiones == verificar_inversiones_fuerza_bruta(self.valores)
+
+
+def main():
+    """Ejemplo: editor de ranking con intercambios y reemplazos"""
+    ranking = [3, 1, 5, 2, 8, 4, 9, 6, 10, 7]
+
+    print("=" * 70)
+    print("CONTEO DINÁMICO DE INVERSIONES")
+    print("=" * 70)
+    estructura = InversionesDinamicas(ranking)
+    print(f"array inicial: {estructura.valores} -> {estructura.inversiones} inversiones")
+
+    operaciones = [('swap', 0, 9), ('set', 4, 0), ('swap', 2, 3), ('set', 9, 11)]
+    for operacion, resultado in zip(operaciones, estructura.aplicar_actualizaciones(operaciones)):
+        print(f"  - {operacion} -> {resultado} inversiones")
+    print(f"array final: {estructura.valores}")
+
+    # Las posiciones negativas se rechazan sin modificar la estructura
+    for operacion in [('set', -1, 9), ('swap', -1, 0)]:
+        try:
+            estructura.aplicar_actualizaciones([operacion])
+        except IndexError as error:
+            print(f"  - {operacion} -> IndexError: {error}")
+
+    consistente = estructura.verificar_consistencia()
+    print(f"\nVerificación (Fuerza Bruta): {'CORRECTO' if consistente else 'ERROR: No coinciden'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Distancia de Kendall tau por Lotes
+==================================
+
+La distancia de Kendall tau entre dos rankings es la cantidad de pares de
+elementos que ambos rankings ordenan de forma distinta. Es EXACTAMENTE un
+conteo de inversiones:
+
+1. Reetiquetar: reemplazar cada elemento del candidato por su posición en el
+   ranking de referencia (la referencia pasa a ser 0, 1, ..., n-1).
+2. Contar inversiones del candidato reetiquetado.
+
+Ejemplo:
+    referencia = [B, C, A]   ->  posiciones: B=0, C=1, A=2
+    candidato  = [A, B, C]   ->  reetiquetado: [2, 0, 1]  ->  2 inversiones
+
+Para miles de candidatos, el reetiquetado se hace en UNA operación vectorizada
+sobre la matriz completa y el conteo usa el motor de conteo_inversiones_numpy,
+que procesa todas las filas de un lote en la misma pasada de Merge Sort.
+No hay bucles de Python por fila.
+
+Coeficiente normalizado:
+    tau = 1 - 2 · distancia / (n(n-1)/2)     (1 = idénticos, -1 = invertidos)
+"""
+
+import numpy as np
+
+from conteo_inversiones_numpy import contar_inversiones_filas
+
+
+# Elementos (filas x columnas) procesados por lote en el motor vectorizado
+ELEMENTOS_POR_LOTE = 1 << 22
+
+
+def distancias_kendall_tau(referencia, rankings, filas_por_lote=None):
+    """
+    Calcula la distancia y el coeficiente de Kendall tau de cada ranking
+    contra una referencia.
+
+    Args:
+        referencia: array 1-D con n etiquetas distintas
+        rankings: array 2-D (filas x n), cada fila una permutación de las
+                  etiquetas de la referencia
+        filas_por_lote: filas procesadas por pasada (None = automático)
+
+    Returns:
+        tupla (distancias, tau): vector int64 y vector float64
+
+    Raises:
+        ValueError: si las formas no coinciden, la referencia tiene etiquetas
+                    repetidas o alguna fila no es una permutación de ella
+    """
+    referencia = np.asarray(referencia)
+    rankings = np.asarray(rankings)
+    if referencia.ndim != 1 or rankings.ndim != 2 or rankings.shape[1] != len(referencia):
+        raise ValueError("Se esperaba una referencia 1-D de largo n y rankings de forma (filas, n)")
+
+    filas, n = rankings.shape
+
+    # ========================================================================
+    # PASO 1: REETIQUETADO VECTORIZADO (etiqueta -> posición en la referencia)
+    # ========================================================================
+    orden = np.argsort(referencia, kind='stable')
+    etiquetas = referencia[orden]
+    if n > 1 and np.any(etiquetas[1:] == etiquetas[:-1]):
+        raise ValueError("La referencia tiene etiquetas repetidas")
+
+    indices = np.searchsorted(etiquetas, rankings)
+    indices_validos = np.minimum(indices, max(n - 1, 0))
+    if n and not np.array_equal(etiquetas[indices_validos], rankings):
+        raise ValueError("Hay rankings con etiquetas que no están en la referencia")
+    reetiquetados = orden[indices_validos]
+    # Cada fila debe usar cada posición exactamente una vez
+    posiciones = np.broadcast_to(np.arange(n), (filas, n))
+    if n and not np.array_equal(np.sort(reetiquetados, axis=1), posiciones):
+        raise ValueError("Hay rankings con etiquetas repetidas (no son permutaciones de la referencia)")
+
+    # ========================================================================
+    # PASO 2: CONTEO DE INVERSIONES POR LOTES DE FILAS
+    # ========================================================================
+    if filas_por_lote is None:
+        filas_por_lote = max(1, ELEMENTOS_POR_LOTE // max(n, 1))
+
+    distancias = np.zeros(filas, dtype=np.int64)
+    for inicio in range(0, filas, filas_por_lote):
+        lote = reetiquetados[inicio:inicio + filas_por_lote]
+        distancias[inicio:inicio + len(lote)] = contar_inversiones_filas(lote)[1]
+
+    # ========================================================================
+    # PASO 3: NORMALIZACIÓN
+    # ========================================================================
+    max_pares = n * (n - 1) // 2
+    if max_pares:
+        tau = 1.0 - 2.0 * distancias / max_pares
+    else:
+        tau = np.ones(filas, dtype=np.float64)
+
+    return distancias, tau
+
+
+def main():
+    """Ejemplo: compara rankings candidatos contra una referencia"""
+    referencia = np.array(['B', 'C', 'A', 'E', 'D'])
+    rankings = np.array([
+        ['B', 'C', 'A', 'E', 'D'],      # Idéntico
+        ['A', 'B', 'C', 'D', 'E'],      # Orden alfabético
+        ['D', 'E', 'A', 'C', 'B'],      # Invertido
+    ])
+
+    print("=" * 70)
+    print("DISTANCIA DE KENDALL TAU POR LOTES")
+    print("=" * 70)
+    print(f"Referencia: {referencia.tolist()}")
+
+    distancias, tau = distancias_kendall_tau(referencia, rankings)
+    for ranking, distancia, coeficiente in zip(rankings, distancias, tau):
+        print(f"  - {ranking.tolist()}: distancia={distancia}, tau={coeficiente:+.2f}")
+
+    # Escala: muchas permutaciones aleatorias a la vez
+    generador = np.random.default_rng(0)
+    n, filas = 200, 5000
+    referencia = generador.permutation(n)
+    rankings = np.argsort(generador.random((filas, n)), axis=1)
+    distancias, tau = distancias_kendall_tau(referencia, rankings)
+    print(f"\n{filas} rankings aleatorios de {n} elementos:")
+    print(f"  - Distancia media: {distancias.mean():.1f} (esperada: {n * (n - 1) / 4:.1f})")
+    print(f"  - Tau medio: {tau.mean():+.4f} (esperado: 0)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Conteo de Inversiones en Ventana Deslizante
+===========================================
+
+Problema: dada una secuencia larga A y un tamaño de ventana W, calcular el
+número de inversiones de CADA ventana A[s..s+W-1].
+
+Llamar a contar_inversiones() por ventana cuesta O(n · W log W). En cambio,
+al deslizar la ventana una posición:
+- Sale A[s]:     se pierden las inversiones que A[s] formaba con los
+                 elementos MENORES que quedan a su derecha en la ventana.
+- Entra A[s+W]:  se ganan las inversiones con los elementos MAYORES que
+                 ya están en la ventana (todos a su izquierda).
+
+Ambas cantidades se obtienen con un árbol de Fenwick sobre rangos comprimidos
+en O(log W).
+
+*** COMPRESIÓN POR BLOQUES ***
+================================================================================
+Para comprimir rangos hace falta conocer los valores, pero la secuencia puede
+ser un flujo muy largo. Se lee la secuencia en bloques de tamaño W:
+toda ventana que comienza en el bloque k está contenida en los bloques k y k+1,
+por lo que alcanza con comprimir (y reconstruir el árbol) una vez por bloque
+usando solo los 2W valores de esos dos bloques.
+
+Reconstruir cuesta O(W log W) y se hace cada W ventanas: O(log W) amortizado.
+================================================================================
+
+Complejidad:
+- Tiempo: O(n log W)
+- Espacio: O(W)
+"""
+
+from itertools import islice
+
+from arbol_fenwick import ArbolFenwick, comprimir_rangos
+
+
+def inversiones_ventana_deslizante(secuencia, w):
+    """
+    Genera el número de inversiones de cada ventana de longitud w.
+
+    Es un generador: consume la secuencia a medida que avanza, por lo que
+    acepta iterables arbitrariamente largos (archivos, flujos, generadores).
+
+    Args:
+        secuencia: iterable de valores comparables
+        w: tamaño de la ventana (w >= 1)
+
+    Yields:
+        inversiones de A[s..s+w-1] para s = 0, 1, ..., n-w
+    """
+    if w < 1:
+        raise ValueError("El tamaño de la ventana debe ser al menos 1")
+
+    iterador = iter(secuencia)
+    bloque = list(islice(iterador, w))
+    if len(bloque) < w:
+        return                      # La secuencia es más corta que la ventana
+
+    inversiones = None              # Se calcula al construir el primer árbol
+
+    while True:
+        siguiente = list(islice(iterador, w))
+
+        # ====================================================================
+        # RECONSTRUCCIÓN: comprimir los dos bloques y cargar la ventana actual
+        # ====================================================================
+        # La ventana actual es exactamente "bloque" (ya emitida, salvo la primera)
+        rangos, m = comprimir_rangos(bloque + siguiente)
+        arbol = ArbolFenwick(m)
+        if inversiones is None:
+            inversiones = 0
+            for k in range(w):
+                inversiones += arbol.mayores_que(rangos[k])
+                arbol.sumar(rangos[k])
+            yield inversiones
+        else:
+            for k in range(w):
+                arbol.sumar(rangos[k])
+
+        # ====================================================================
+        # DESLIZAMIENTO: cada paso saca A[s] y agrega A[s+w] en O(log w)
+        # ====================================================================
+        for k in range(len(siguiente)):
+            saliente = rangos[k]
+            arbol.sumar(saliente, -1)
+            inversiones -= arbol.prefijo(saliente - 1)     # Menores a su derecha
+
+            entrante = rangos[w + k]
+            inversiones += arbol.mayores_que(entrante)     # Mayores a su izquierda
+            arbol.sumar(entrante)
+
+            yield inversiones
+
+        if len(siguiente) < w:
+            return                  # Se agotó la secuencia
+        bloque = siguiente